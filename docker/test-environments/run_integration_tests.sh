@@ -58,7 +58,9 @@ run_environment_test() {
 if [ -d "../../target/wheels" ]; then
     echo "📦 Copying wheels for testing..."
     mkdir -p wheels
-    cp ../../target/wheels/*.whl wheels/ 2>/dev/null || true
+    # Hard links where the filesystem allows, so the wheels aren't rewritten
+    ln -f ../../target/wheels/*.whl wheels/ 2>/dev/null \
+        || cp ../../target/wheels/*.whl wheels/ 2>/dev/null || true
 fi
 
 # Make scripts executable
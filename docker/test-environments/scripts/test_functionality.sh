@@ -10,6 +10,17 @@ python3 -c "
 import shlesha
 import sys
 
+_translator = None
+
+CORE_SCRIPTS = frozenset({'devanagari', 'iast'})
+
+def get_translator():
+    '''Shared Shlesha instance, created once on first use'''
+    global _translator
+    if _translator is None:
+        _translator = shlesha.Shlesha()
+    return _translator
+
 def test_basic_transliteration():
     '''Test basic transliteration functionality'''
     test_cases = [
@@ -30,22 +41,23 @@ def test_basic_transliteration():
 
 def test_class_methods():
     '''Test class-based API'''
-    translator = shlesha.Shlesha()
+    translator = get_translator()
     
     # Test basic transliteration
     result = translator.transliterate('नमस्ते', 'devanagari', 'iast')
     print(f'✅ Class method: नमस्ते → {result}')
     
-    # Test script support
-    scripts = translator.list_supported_scripts()
-    if 'devanagari' in scripts and 'iast' in scripts:
-        print(f'✅ Script support: {len(scripts)} scripts available')
+    # Test script support; membership checks go against one frozenset
+    supported = frozenset(translator.list_supported_scripts())
+    if CORE_SCRIPTS <= supported:
+        print(f'✅ Script support: {len(supported)} scripts available')
     else:
         print('❌ Missing core scripts')
         return False
         
-    # Test script validation
-    if translator.supports_script('devanagari') and translator.supports_script('iast'):
+    # Test script validation: supports_script is the API under test here, so
+    # it is still called, once per core script, and must agree with the list
+    if all(translator.supports_script(script) for script in CORE_SCRIPTS):
         print('✅ Script validation works')
     else:
         print('❌ Script validation failed')
@@ -55,12 +67,16 @@ def test_class_methods():
 
 def test_metadata_functionality():
     '''Test metadata collection'''
-    translator = shlesha.Shlesha()
+    translator = get_translator()
     
     # Test with mixed content that should generate metadata
     result = translator.transliterate_with_metadata('धर्मkr', 'devanagari', 'iast')
     
     if hasattr(result, 'output') and hasattr(result, 'metadata'):
+        # IAST output is lowercase, so a case-sensitive substring check is enough
+        if 'dharma' not in result.output:
+            print(f'❌ Expected lowercase IAST \'dharma\' in output, got {result.output}')
+            return False
         print(f'✅ Metadata collection: output={result.output}')
         if result.metadata and hasattr(result.metadata, 'unknown_tokens'):
             print(f'✅ Unknown tokens tracked: {len(result.metadata.unknown_tokens)} tokens')
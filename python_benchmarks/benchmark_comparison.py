@@ -4,22 +4,52 @@ Fair comparison benchmarks between Shlesha and other transliteration tools.
 Compares only on common supported scripts and features.
 """
 
-import time
+import argparse
+import gc
+import timeit
 import statistics
 import csv
 import os
+import multiprocessing
 import importlib.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import groupby
+from typing import NamedTuple, Optional
 
 # Import Shlesha
 import shlesha
 
+# One transliterator per process, built on first use so importing this module stays cheap
+_transliterator = None
+
+def get_transliterator():
+    """This process's Shlesha instance; each pool worker builds its own"""
+    global _transliterator
+    if _transliterator is None:
+        _transliterator = shlesha.Shlesha()
+    return _transliterator
+
 # Try to import other transliteration libraries
 other_libs = {}
 
 # Try importing vidyut
 try:
     from vidyut.lipi import Scheme, transliterate
-    other_libs['vidyut'] = {'Scheme': Scheme, 'transliterate': transliterate}
+    # Resolve script names to vidyut schemes once, skipping any this version lacks
+    vidyut_schemes = {
+        script: getattr(Scheme, scheme_name)
+        for script, scheme_name in {
+            "devanagari": "Devanagari",
+            "iast": "Iast",
+            "itrans": "Itrans",
+            "slp1": "Slp1",
+            "telugu": "Telugu",
+            "tamil": "Tamil",
+        }.items()
+        if hasattr(Scheme, scheme_name)
+    }
+    other_libs['vidyut'] = {'schemes': vidyut_schemes, 'transliterate': transliterate}
     print("✓ vidyut found")
 except ImportError:
     print("✗ vidyut not found (pip install vidyut)")
@@ -27,7 +57,16 @@ except ImportError:
 # Try importing indic-transliteration
 try:
     from indic_transliteration import sanscript
-    other_libs['indic_transliteration'] = sanscript
+    # Resolve script names to sanscript schemes once, like vidyut above
+    sanscript_schemes = {
+        "devanagari": sanscript.DEVANAGARI,
+        "iast": sanscript.IAST,
+        "itrans": sanscript.ITRANS,
+        "slp1": sanscript.SLP1,
+        "telugu": sanscript.TELUGU,
+        "tamil": sanscript.TAMIL
+    }
+    other_libs['indic_transliteration'] = {'schemes': sanscript_schemes, 'transliterate': sanscript.transliterate}
     print("✓ indic-transliteration found")
 except ImportError:
     print("✗ indic-transliteration not found (pip install indic-transliteration)")
@@ -35,7 +74,15 @@ except ImportError:
 # Try importing aksharamukha
 try:
     from aksharamukha import transliterate as aksh_transliterate
-    other_libs['aksharamukha'] = aksh_transliterate
+    aksharamukha_schemes = {
+        "devanagari": "Devanagari",
+        "iast": "IAST",
+        "itrans": "ITRANS",
+        "slp1": "SLP1",
+        "telugu": "Telugu",
+        "tamil": "Tamil"
+    }
+    other_libs['aksharamukha'] = {'schemes': aksharamukha_schemes, 'process': aksh_transliterate.process}
     print("✓ aksharamukha found")
 except ImportError:
     print("✗ aksharamukha not found (pip install aksharamukha)")
@@ -84,34 +131,98 @@ COMMON_CONVERSIONS = [
     ("itrans", "slp1"),
 ]
 
-class ComparisonResult:
-    def __init__(self, library, from_script, to_script, text_size, throughput, latency, success=True, error=None):
-        self.library = library
-        self.from_script = from_script
-        self.to_script = to_script
-        self.text_size = text_size
-        self.throughput = throughput
-        self.latency = latency
-        self.success = success
-        self.error = error
+# Strings per transliterate_batch call in the batched Shlesha measurement
+SHLESHA_BATCH_SIZE = 1000
+
+# Timed regions per measurement; the fastest one is reported (best-of-N)
+TIMING_REPEATS = 5
+
+@contextmanager
+def stable_timing():
+    """Reduce measurement noise: GC off, pinned to one CPU, raised priority if permitted."""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    
+    # Pin to a single CPU (Linux only) so the process doesn't migrate between cores
+    old_affinity = None
+    if hasattr(os, "sched_setaffinity"):
+        old_affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {min(old_affinity)})
+    
+    # Raising priority needs privileges; carry on at normal priority without them
+    reniced = False
+    try:
+        os.nice(-5)
+        reniced = True
+    except (AttributeError, OSError):
+        pass
+    
+    try:
+        yield
+    finally:
+        if reniced:
+            os.nice(5)
+        if old_affinity is not None:
+            os.sched_setaffinity(0, old_affinity)
+        if gc_was_enabled:
+            gc.enable()
+
+def measure_ns(func, iterations):
+    """Average nanoseconds per call of func.
+
+    timeit's autorange picks how many calls make up one timed region (at least
+    0.2s worth, capped at `iterations`), which amortizes clock reads over many
+    calls. The best of TIMING_REPEATS regions is used, as it is the least
+    disturbed by GC and scheduling noise.
+    """
+    timer = timeit.Timer(func)
+    with stable_timing():
+        number, _ = timer.autorange()
+        number = max(1, min(number, iterations))
+        best = min(timer.repeat(repeat=TIMING_REPEATS, number=number))
+    return best * 1_000_000_000 / number
+
+class ComparisonResult(NamedTuple):
+    library: str
+    from_script: str
+    to_script: str
+    text_size: str
+    throughput: float
+    latency: float
+    success: bool = True
+    error: Optional[str] = None
 
 def benchmark_shlesha(text, from_script, to_script, iterations=1000):
     """Benchmark Shlesha"""
-    transliterator = shlesha.Shlesha()
-    times = []
+    transliterator = get_transliterator()
     
-    # Warmup
-    for _ in range(10):
+    # Warmup: compiled Rust with no JIT or lazy tables, so this only primes caches
+    for _ in range(2):
         transliterator.transliterate(text, from_script, to_script)
     
     # Benchmark
-    for _ in range(iterations):
-        start = time.perf_counter_ns()
-        transliterator.transliterate(text, from_script, to_script)
-        end = time.perf_counter_ns()
-        times.append(end - start)
+    avg_time_ns = measure_ns(lambda: transliterator.transliterate(text, from_script, to_script), iterations)
+    throughput = len(text) / (avg_time_ns / 1_000_000_000)
     
-    avg_time_ns = statistics.mean(times)
+    return throughput, avg_time_ns
+
+def benchmark_shlesha_batch(text, from_script, to_script, iterations=20):
+    """Benchmark Shlesha through transliterate_batch.
+
+    One call converts SHLESHA_BATCH_SIZE copies of text, so the Python/Rust
+    crossing is paid once per batch; the returned latency is per string. This
+    reports core conversion cost, where benchmark_shlesha reports per-call cost.
+    """
+    transliterator = get_transliterator()
+    batch = [text] * SHLESHA_BATCH_SIZE
+    
+    # Warmup
+    transliterator.transliterate_batch(batch, from_script, to_script)
+    
+    # Benchmark
+    avg_time_ns = measure_ns(
+        lambda: transliterator.transliterate_batch(batch, from_script, to_script), iterations
+    ) / SHLESHA_BATCH_SIZE
     throughput = len(text) / (avg_time_ns / 1_000_000_000)
     
     return throughput, avg_time_ns
@@ -122,47 +233,25 @@ def benchmark_vidyut(text, from_script, to_script, iterations=1000):
         return None, None
     
     vidyut_lib = other_libs['vidyut']
-    Scheme = vidyut_lib['Scheme']
+    schemes = vidyut_lib['schemes']
     transliterate = vidyut_lib['transliterate']
     
-    # Map script names to vidyut scheme names
-    vidyut_map = {
-        "devanagari": "Devanagari",
-        "iast": "Iast", 
-        "itrans": "Itrans",
-        "slp1": "Slp1",
-        "telugu": "Telugu",
-        "tamil": "Tamil"
-    }
-    
-    if from_script not in vidyut_map or to_script not in vidyut_map:
-        return None, None
-    
-    try:
-        from_scheme = getattr(Scheme, vidyut_map[from_script])
-        to_scheme = getattr(Scheme, vidyut_map[to_script])
-    except AttributeError as e:
-        print(f"    vidyut AttributeError: {e}")
+    if from_script not in schemes or to_script not in schemes:
         return None, None
     
-    times = []
+    from_scheme = schemes[from_script]
+    to_scheme = schemes[to_script]
     
-    # Warmup
+    # Warmup: compiled Rust as well, only cache priming needed
     try:
-        for _ in range(10):
+        for _ in range(2):
             transliterate(text, from_scheme, to_scheme)
     except Exception as e:
         print(f"    vidyut warmup error: {e}")
         return None, None
     
     # Benchmark
-    for _ in range(iterations):
-        start = time.perf_counter_ns()
-        transliterate(text, from_scheme, to_scheme)
-        end = time.perf_counter_ns()
-        times.append(end - start)
-    
-    avg_time_ns = statistics.mean(times)
+    avg_time_ns = measure_ns(lambda: transliterate(text, from_scheme, to_scheme), iterations)
     throughput = len(text) / (avg_time_ns / 1_000_000_000)
     
     return throughput, avg_time_ns
@@ -172,35 +261,22 @@ def benchmark_indic_transliteration(text, from_script, to_script, iterations=100
     if 'indic_transliteration' not in other_libs:
         return None, None
     
-    sanscript = other_libs['indic_transliteration']
+    indic_lib = other_libs['indic_transliteration']
+    schemes = indic_lib['schemes']
+    transliterate = indic_lib['transliterate']
     
-    # Map script names
-    script_map = {
-        "devanagari": sanscript.DEVANAGARI,
-        "iast": sanscript.IAST,
-        "itrans": sanscript.ITRANS,
-        "slp1": sanscript.SLP1,
-        "telugu": sanscript.TELUGU,
-        "tamil": sanscript.TAMIL
-    }
-    
-    if from_script not in script_map or to_script not in script_map:
+    if from_script not in schemes or to_script not in schemes:
         return None, None
     
-    times = []
+    from_scheme = schemes[from_script]
+    to_scheme = schemes[to_script]
     
-    # Warmup
+    # Warmup: pure Python, fills its per-scheme caches and warms the interpreter
     for _ in range(10):
-        sanscript.transliterate(text, script_map[from_script], script_map[to_script])
+        transliterate(text, from_scheme, to_scheme)
     
     # Benchmark
-    for _ in range(iterations):
-        start = time.perf_counter_ns()
-        sanscript.transliterate(text, script_map[from_script], script_map[to_script])
-        end = time.perf_counter_ns()
-        times.append(end - start)
-    
-    avg_time_ns = statistics.mean(times)
+    avg_time_ns = measure_ns(lambda: transliterate(text, from_scheme, to_scheme), iterations)
     throughput = len(text) / (avg_time_ns / 1_000_000_000)
     
     return throughput, avg_time_ns
@@ -210,168 +286,231 @@ def benchmark_aksharamukha(text, from_script, to_script, iterations=100):  # Few
     if 'aksharamukha' not in other_libs:
         return None, None
     
-    aksh_transliterate = other_libs['aksharamukha']
-    
-    # Map script names
-    script_map = {
-        "devanagari": "Devanagari",
-        "iast": "IAST",
-        "itrans": "ITRANS", 
-        "slp1": "SLP1",
-        "telugu": "Telugu",
-        "tamil": "Tamil"
-    }
+    aksharamukha_lib = other_libs['aksharamukha']
+    schemes = aksharamukha_lib['schemes']
+    process = aksharamukha_lib['process']
     
-    if from_script not in script_map or to_script not in script_map:
+    if from_script not in schemes or to_script not in schemes:
         return None, None
     
-    times = []
+    from_scheme = schemes[from_script]
+    to_scheme = schemes[to_script]
     
-    # Warmup
+    # Warmup: the first calls for a script pair do one-off setup
     for _ in range(5):
-        aksh_transliterate.process(script_map[from_script], script_map[to_script], text)
+        process(from_scheme, to_scheme, text)
     
     # Benchmark
-    for _ in range(iterations):
-        start = time.perf_counter_ns()
-        aksh_transliterate.process(script_map[from_script], script_map[to_script], text)
-        end = time.perf_counter_ns()
-        times.append(end - start)
-    
-    avg_time_ns = statistics.mean(times)
+    avg_time_ns = measure_ns(lambda: process(from_scheme, to_scheme, text), iterations)
     throughput = len(text) / (avg_time_ns / 1_000_000_000)
     
     return throughput, avg_time_ns
 
-def run_comparison_benchmarks():
-    """Run fair comparison benchmarks"""
-    results = []
+# Benchmark entry points by library name; other libraries join only if they imported
+BENCHMARKS = {
+    "shlesha": benchmark_shlesha,
+    "shlesha_batch": benchmark_shlesha_batch,
+    "vidyut": benchmark_vidyut,
+    "indic_transliteration": benchmark_indic_transliteration,
+    "aksharamukha": benchmark_aksharamukha,
+}
+AVAILABLE_LIBRARIES = [name for name in BENCHMARKS if name.startswith("shlesha") or name in other_libs]
+
+TEXT_SIZES = ["small", "medium", "large"]
+
+CSV_COLUMNS = ["library", "from_script", "to_script", "text_size", "throughput_chars_per_sec", "latency_ns", "success"]
+
+# Fewer cells than this run inline even with jobs > 1; worker startup and
+# importing every library per worker would outweigh the overlap
+MIN_CELLS_FOR_POOL = 3
+
+# Iterations per measurement under --quick
+QUICK_ITERATIONS = 50
+
+def benchmark_cell(cell):
+    """Benchmark one (library, from_script, to_script, size_name) cell.
+
+    Returns None when the library doesn't support the conversion.
+    """
+    library, from_script, to_script, size_name, iterations = cell
     
-    for from_script, to_script in COMMON_CONVERSIONS:
-        for size_name in ["small", "medium", "large"]:
-            # Get appropriate test data for the source script
-            if from_script in TEST_DATA:
-                text = TEST_DATA[from_script][size_name]
-            else:
-                text = TEST_DATA["devanagari"][size_name]  # fallback
-            
+    # Get appropriate test data for the source script
+    if from_script in TEST_DATA:
+        text = TEST_DATA[from_script][size_name]
+    else:
+        text = TEST_DATA["devanagari"][size_name]  # fallback
+    
+    iteration_kwargs = {} if iterations is None else {"iterations": iterations}
+    try:
+        throughput, latency = BENCHMARKS[library](text, from_script, to_script, **iteration_kwargs)
+    except Exception as e:
+        return ComparisonResult(library, from_script, to_script, size_name, 0, 0, False, str(e))
+    
+    if not throughput:
+        return None
+    return ComparisonResult(library, from_script, to_script, size_name, throughput, latency)
+
+def _pin_worker(next_cpu):
+    """ProcessPoolExecutor initializer: give each worker its own CPU.
+
+    stable_timing pins to the lowest CPU it is allowed; restricting each worker
+    to a distinct one first keeps parallel workers from sharing a core.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpus = sorted(os.sched_getaffinity(0))
+    with next_cpu.get_lock():
+        index = next_cpu.value
+        next_cpu.value += 1
+    os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+def run_comparison_benchmarks(conversions=COMMON_CONVERSIONS, sizes=TEXT_SIZES,
+                              libraries=AVAILABLE_LIBRARIES, iterations=None, jobs=1):
+    """Run fair comparison benchmarks.
+
+    Returns a dict keyed by (library, from_script, to_script, size_name). Cells
+    are inserted conversion by conversion, size by size, so iterating it in
+    order yields each conversion's rows together. When iterations is None each
+    benchmark uses its own default.
+
+    With jobs > 1 the cells are spread over that many worker processes, each
+    with its own transliterator instances. That shortens the run, but workers
+    compete for memory bandwidth and turbo headroom, so keep jobs=1 for
+    publishable numbers. Runs with fewer than MIN_CELLS_FOR_POOL cells stay
+    in this process.
+    """
+    cells = [
+        (library, from_script, to_script, size_name, iterations)
+        for from_script, to_script in conversions
+        for size_name in sizes
+        for library in libraries
+    ]
+    
+    jobs = min(jobs, len(cells))
+    if jobs > 1 and len(cells) >= MIN_CELLS_FOR_POOL:
+        measured = {}
+        next_cpu = multiprocessing.Value("i", 0)
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_pin_worker, initargs=(next_cpu,)) as executor:
+            futures = {executor.submit(benchmark_cell, cell): cell for cell in cells}
+            for future in as_completed(futures):
+                library, from_script, to_script, size_name, _ = cell = futures[future]
+                measured[cell] = result = future.result()
+                if result and result.success:
+                    print(f"  {library} {from_script} → {to_script} ({size_name}): {result.throughput:.0f} chars/sec")
+        # Rebuild in cell order; the report relies on conversion-then-size ordering
+        return {cell[:4]: measured[cell] for cell in cells if measured[cell] is not None}
+    
+    results = {}
+    for cell in cells:
+        library, from_script, to_script, size_name, _ = cell
+        if library == libraries[0]:
             print(f"\nBenchmarking {from_script} → {to_script} ({size_name})...")
-            
-            # Benchmark Shlesha
-            try:
-                throughput, latency = benchmark_shlesha(text, from_script, to_script)
-                results.append(ComparisonResult(
-                    "shlesha", from_script, to_script, size_name, 
-                    throughput, latency
-                ))
-                print(f"  Shlesha: {throughput:.0f} chars/sec")
-            except Exception as e:
-                results.append(ComparisonResult(
-                    "shlesha", from_script, to_script, size_name,
-                    0, 0, False, str(e)
-                ))
-            
-            # Benchmark vidyut
-            if 'vidyut' in other_libs:
-                try:
-                    throughput, latency = benchmark_vidyut(text, from_script, to_script)
-                    if throughput:
-                        results.append(ComparisonResult(
-                            "vidyut", from_script, to_script, size_name,
-                            throughput, latency
-                        ))
-                        print(f"  vidyut: {throughput:.0f} chars/sec")
-                except Exception as e:
-                    results.append(ComparisonResult(
-                        "vidyut", from_script, to_script, size_name,
-                        0, 0, False, str(e)
-                    ))
-            
-            # Benchmark indic-transliteration
-            if 'indic_transliteration' in other_libs:
-                try:
-                    throughput, latency = benchmark_indic_transliteration(text, from_script, to_script)
-                    if throughput:
-                        results.append(ComparisonResult(
-                            "indic_transliteration", from_script, to_script, size_name,
-                            throughput, latency
-                        ))
-                        print(f"  indic-transliteration: {throughput:.0f} chars/sec")
-                except Exception as e:
-                    results.append(ComparisonResult(
-                        "indic_transliteration", from_script, to_script, size_name,
-                        0, 0, False, str(e)
-                    ))
-            
-            # Benchmark aksharamukha
-            if 'aksharamukha' in other_libs:
-                try:
-                    throughput, latency = benchmark_aksharamukha(text, from_script, to_script)
-                    if throughput:
-                        results.append(ComparisonResult(
-                            "aksharamukha", from_script, to_script, size_name,
-                            throughput, latency
-                        ))
-                        print(f"  aksharamukha: {throughput:.0f} chars/sec")
-                except Exception as e:
-                    results.append(ComparisonResult(
-                        "aksharamukha", from_script, to_script, size_name,
-                        0, 0, False, str(e)
-                    ))
+        
+        result = benchmark_cell(cell)
+        if result is None:
+            continue
+        results[cell[:4]] = result
+        if result.success:
+            print(f"  {library}: {result.throughput:.0f} chars/sec")
     
     return results
 
+def write_csv(results, filename):
+    """Write results to CSV"""
+    rows = [
+        (r.library, r.from_script, r.to_script, r.text_size, f"{r.throughput:.0f}", f"{r.latency:.0f}", r.success)
+        for r in results.values()
+    ]
+    with open(filename, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(rows)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare Shlesha against other transliteration libraries")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"run {QUICK_ITERATIONS} iterations per measurement (overridden by --iterations)")
+    parser.add_argument("--iterations", type=int, metavar="N",
+                        help="iterations per measurement instead of each benchmark's default")
+    parser.add_argument("--libs", metavar="LIB[,LIB...]",
+                        help=f"libraries to run (default: all available; known: {','.join(BENCHMARKS)})")
+    parser.add_argument("--sizes", metavar="SIZE[,SIZE...]",
+                        help=f"text sizes to run (default: {','.join(TEXT_SIZES)})")
+    parser.add_argument("--conversions", metavar="FROM:TO[,FROM:TO...]",
+                        help="conversions to run, e.g. devanagari:iast (default: all common conversions)")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="benchmark cells in N worker processes (faster, noisier; default: 1)")
+    args = parser.parse_args()
+    
+    if args.jobs < 1:
+        parser.error("--jobs must be positive")
+    if args.iterations is None and args.quick:
+        args.iterations = QUICK_ITERATIONS
+    if args.iterations is not None and args.iterations < 1:
+        parser.error("--iterations must be positive")
+    
+    args.libs = args.libs.split(",") if args.libs else AVAILABLE_LIBRARIES
+    unavailable = [name for name in args.libs if name not in AVAILABLE_LIBRARIES]
+    if unavailable:
+        parser.error(f"libraries not available: {', '.join(unavailable)}")
+    
+    args.sizes = args.sizes.split(",") if args.sizes else TEXT_SIZES
+    unknown = [size for size in args.sizes if size not in TEXT_SIZES]
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(unknown)}")
+    
+    if args.conversions:
+        conversions = [tuple(pair.split(":", 1)) for pair in args.conversions.split(",")]
+        malformed = [":".join(pair) for pair in conversions if len(pair) != 2]
+        if malformed:
+            parser.error(f"conversions must look like FROM:TO, got: {', '.join(malformed)}")
+        args.conversions = conversions
+    else:
+        args.conversions = COMMON_CONVERSIONS
+    
+    return args
+
 def generate_comparison_markdown(results):
     """Generate markdown comparison report"""
-    md = "# Transliteration Library Performance Comparison\n\n"
-    
-    # Group by conversion type
-    conversions = {}
-    for result in results:
-        key = f"{result.from_script}_to_{result.to_script}"
-        if key not in conversions:
-            conversions[key] = {}
-        if result.text_size not in conversions[key]:
-            conversions[key][result.text_size] = {}
-        conversions[key][result.text_size][result.library] = result
-    
-    # Performance comparison by conversion
-    for conversion, sizes in conversions.items():
-        from_script, to_script = conversion.replace("_to_", " → ").split(" → ")
-        md += f"\n## {from_script} → {to_script}\n\n"
+    parts = ["# Transliteration Library Performance Comparison\n\n"]
+    
+    # Performance comparison by conversion; results arrive grouped by conversion, then size
+    for (from_script, to_script), cells in groupby(results.items(), key=lambda item: item[0][1:3]):
+        parts.append(f"\n## {from_script} → {to_script}\n\n")
         
-        md += "| Text Size | Library | Throughput (chars/sec) | Latency (ns) | Relative Speed |\n"
-        md += "|-----------|---------|----------------------|--------------|----------------|\n"
+        parts.append("| Text Size | Library | Throughput (chars/sec) | Latency (ns) | Relative Speed |\n")
+        parts.append("|-----------|---------|----------------------|--------------|----------------|\n")
         
-        for size_name in ["small", "medium", "large"]:
-            if size_name in sizes:
-                # Find baseline (shlesha)
-                baseline = sizes[size_name].get("shlesha")
-                if baseline and baseline.success:
-                    baseline_throughput = baseline.throughput
+        for size_name, size_cells in groupby(cells, key=lambda item: item[0][3]):
+            libraries = {key[0]: result for key, result in size_cells}
+            
+            # Find baseline (shlesha)
+            baseline = libraries.get("shlesha")
+            if baseline and baseline.success:
+                baseline_throughput = baseline.throughput
+            else:
+                baseline_throughput = None
+            
+            for library, result in sorted(libraries.items()):
+                if result.success:
+                    relative = ""
+                    if baseline_throughput and library != "shlesha":
+                        ratio = result.throughput / baseline_throughput
+                        relative = f"{ratio:.2f}x"
+                    elif library == "shlesha":
+                        relative = "1.00x (baseline)"
+                    
+                    parts.append(f"| {size_name} | {library} | {result.throughput:.0f} | {result.latency:.0f} | {relative} |\n")
                 else:
-                    baseline_throughput = None
-                
-                for library, result in sorted(sizes[size_name].items()):
-                    if result.success:
-                        relative = ""
-                        if baseline_throughput and library != "shlesha":
-                            ratio = result.throughput / baseline_throughput
-                            relative = f"{ratio:.2f}x"
-                        elif library == "shlesha":
-                            relative = "1.00x (baseline)"
-                        
-                        md += f"| {size_name} | {library} | {result.throughput:.0f} | {result.latency:.0f} | {relative} |\n"
-                    else:
-                        md += f"| {size_name} | {library} | ERROR | ERROR | N/A |\n"
+                    parts.append(f"| {size_name} | {library} | ERROR | ERROR | N/A |\n")
     
     # Overall performance summary
-    md += "\n## Overall Performance Summary\n\n"
-    md += "| Library | Average Throughput (chars/sec) | Conversions Tested | Success Rate |\n"
-    md += "|---------|-------------------------------|-------------------|-------------|\n"
+    parts.append("\n## Overall Performance Summary\n\n")
+    parts.append("| Library | Average Throughput (chars/sec) | Conversions Tested | Success Rate |\n")
+    parts.append("|---------|-------------------------------|-------------------|-------------|\n")
     
     library_stats = {}
-    for result in results:
+    for result in results.values():
         if result.library not in library_stats:
             library_stats[result.library] = {"throughputs": [], "total": 0, "success": 0}
         library_stats[result.library]["total"] += 1
@@ -385,12 +524,17 @@ def generate_comparison_markdown(results):
         else:
             avg_throughput = 0
         success_rate = (stats["success"] / stats["total"]) * 100
-        md += f"| {library} | {avg_throughput:.0f} | {stats['total']} | {success_rate:.0f}% |\n"
+        parts.append(f"| {library} | {avg_throughput:.0f} | {stats['total']} | {success_rate:.0f}% |\n")
     
-    return md
+    parts.append(f"\nshlesha_batch converts {SHLESHA_BATCH_SIZE} strings per transliterate_batch call; "
+                 "its latency is per string, so it excludes most per-call binding overhead.\n")
+    
+    return "".join(parts)
 
 def main():
     """Run comparison benchmarks"""
+    args = parse_args()
+    
     print("Running transliteration library comparison benchmarks...")
     print(f"Libraries found: {list(other_libs.keys())}")
     
@@ -400,25 +544,18 @@ def main():
         print("  pip install vidyut-py indic-transliteration aksharamukha")
         return
     
-    results = run_comparison_benchmarks()
+    results = run_comparison_benchmarks(args.conversions, args.sizes, args.libs, args.iterations, args.jobs)
     
     # Save results
     os.makedirs("target", exist_ok=True)
     
     # Save CSV
-    with open("target/comparison_benchmark_results.csv", "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["library", "from_script", "to_script", "text_size", "throughput_chars_per_sec", "latency_ns", "success"])
-        for result in results:
-            writer.writerow([
-                result.library, result.from_script, result.to_script, result.text_size,
-                f"{result.throughput:.0f}", f"{result.latency:.0f}", result.success
-            ])
+    write_csv(results, "target/comparison_benchmark_results.csv")
     
     # Generate and save markdown
     md = generate_comparison_markdown(results)
-    with open("target/COMPARISON_BENCHMARK_RESULTS.md", "w") as f:
-        f.write(md)
+    with open("target/COMPARISON_BENCHMARK_RESULTS.md", "wb") as f:
+        f.write(md.encode("utf-8"))
     
     print(f"\nComparison benchmarks complete!")
     print(f"Results saved to:")
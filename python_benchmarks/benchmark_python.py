@@ -4,10 +4,15 @@ Comprehensive Python API benchmarks for Shlesha.
 Generates clean markdown output without commentary.
 """
 
+import argparse
 import time
 import statistics
 import csv
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from itertools import permutations, product
+from typing import NamedTuple
 import shlesha
 
 # Test data sets
@@ -20,212 +25,277 @@ HUB_SCRIPTS = ["devanagari", "iso15919"]
 STANDARD_SCRIPTS = ["bengali", "tamil", "telugu", "gujarati", "kannada", "malayalam", "odia"]
 EXTENSION_SCRIPTS = ["iast", "itrans", "slp1", "harvard_kyoto", "velthuis", "wx"]
 
-class BenchmarkResult:
-    def __init__(self, script_from, script_to, category, text_size, throughput_chars_per_sec, latency_ns, api_type):
-        self.script_from = script_from
-        self.script_to = script_to
-        self.category = category
-        self.text_size = text_size
-        self.throughput_chars_per_sec = throughput_chars_per_sec
-        self.latency_ns = latency_ns
-        self.api_type = api_type
+TEXT_SIZES = {"small": SMALL_TEXT, "medium": MEDIUM_TEXT, "large": LARGE_TEXT}
 
-def benchmark_api_method(method, text, from_script, to_script, iterations=100):
-    """Benchmark a specific API method"""
-    times = []
+# Encoded once so the bytes API is timed without a per-call str.encode()
+TEXT_BYTES = {name: text.encode("utf-8") for name, text in TEXT_SIZES.items()}
+TEXT_CHARS = {name: len(text) for name, text in TEXT_SIZES.items()}
+
+# API entry points measured for each within-category conversion
+CATEGORY_API_TYPES = (
+    "instance_method", "convenience_function", "compiled_converter", "with_metadata", "bytes_function"
+)
+
+# API types timed inside Rust by bench_transliterate, without the per-call
+# Python/Rust boundary cost the other types pay; reported separately
+RUST_TIMED_API_TYPES = frozenset({"instance_method", "convenience_function", "with_metadata"})
+
+# API types whose timed loop is the same Rust code as another type's: both
+# bench_transliterate entry points time a default Shlesha, so these are
+# only run (and reported) with --measure-aliases
+ALIASED_API_TYPES = {"convenience_function": "instance_method"}
+
+# Fewer tasks than this run inline; pool startup would outweigh the overlap
+MIN_TASKS_FOR_POOL = 3
+
+class BenchmarkResult(NamedTuple):
+    script_from: str
+    script_to: str
+    category: str
+    text_size: str
+    throughput_chars_per_sec: float
+    latency_ns: float
+    api_type: str
+    timing: str  # "rust" or "python": where the timed loop ran
+
+def benchmark_api_method(method, text, from_script, to_script, iterations=100, bench=None, bound=False,
+                         chars_count=None, warmup=5):
+    """Benchmark a specific API method
+
+    When `bench` is given (a bench_transliterate entry point), the timed loop
+    runs inside Rust in one call and `method` is only used for warmup, so the
+    latency excludes per-call Python/Rust boundary overhead. A `bound` method
+    is a compiled converter that takes only the text. `chars_count` is the
+    character length of the input, needed when `text` is pre-encoded bytes.
+    Pass `warmup=0` when the caller has already warmed this conversion.
+    """
+    args = (text,) if bound else (text, from_script, to_script)
     
     # Warmup
-    for _ in range(5):
-        method(text, from_script, to_script)
+    for _ in range(warmup):
+        method(*args)
     
-    # Actual benchmark
-    for _ in range(iterations):
+    if bench is not None:
+        avg_time_ns = bench(text, from_script, to_script, iterations) / iterations
+    else:
+        # One clock read pair around the whole loop; only the mean is reported
         start = time.perf_counter_ns()
-        method(text, from_script, to_script)
-        end = time.perf_counter_ns()
-        times.append(end - start)
+        for _ in range(iterations):
+            method(*args)
+        avg_time_ns = (time.perf_counter_ns() - start) / iterations
     
-    avg_time_ns = statistics.mean(times)
-    chars_count = len(text)
+    if chars_count is None:
+        chars_count = len(text)
     throughput = chars_count / (avg_time_ns / 1_000_000_000)
     
     return throughput, avg_time_ns
 
-def benchmark_category(category_name, scripts, transliterator, results):
-    """Benchmark a category of scripts"""
-    
-    for from_script in scripts:
-        for to_script in scripts:
-            if from_script == to_script:
-                continue
-                
-            for size_name, text in [("small", SMALL_TEXT), ("medium", MEDIUM_TEXT), ("large", LARGE_TEXT)]:
-                # Instance method benchmark
-                throughput, latency = benchmark_api_method(
-                    transliterator.transliterate, text, from_script, to_script
-                )
-                results.append(BenchmarkResult(
-                    from_script, to_script, category_name, size_name,
-                    throughput, latency, "instance_method"
-                ))
-                
-                # Convenience function benchmark
-                throughput, latency = benchmark_api_method(
-                    shlesha.transliterate, text, from_script, to_script
-                )
-                results.append(BenchmarkResult(
-                    from_script, to_script, category_name, size_name,
-                    throughput, latency, "convenience_function"
-                ))
-                
-                # With metadata benchmark
-                def transliterate_with_metadata(text, from_script, to_script):
-                    return transliterator.transliterate_with_metadata(text, from_script, to_script)
-                
-                throughput, latency = benchmark_api_method(
-                    transliterate_with_metadata, text, from_script, to_script
-                )
-                results.append(BenchmarkResult(
-                    from_script, to_script, category_name, size_name,
-                    throughput, latency, "with_metadata"
-                ))
-
-def benchmark_cross_category(transliterator, results):
-    """Benchmark cross-category conversions"""
-    
-    # Hub to Standard
-    for hub_script in HUB_SCRIPTS:
-        for standard_script in STANDARD_SCRIPTS:
-            for size_name, text in [("small", SMALL_TEXT), ("medium", MEDIUM_TEXT), ("large", LARGE_TEXT)]:
-                throughput, latency = benchmark_api_method(
-                    transliterator.transliterate, text, hub_script, standard_script
-                )
-                results.append(BenchmarkResult(
-                    hub_script, standard_script, "cross_hub_to_standard", size_name,
-                    throughput, latency, "instance_method"
-                ))
-    
-    # Hub to Extension
-    for hub_script in HUB_SCRIPTS:
-        for ext_script in EXTENSION_SCRIPTS:
-            for size_name, text in [("small", SMALL_TEXT), ("medium", MEDIUM_TEXT), ("large", LARGE_TEXT)]:
-                throughput, latency = benchmark_api_method(
-                    transliterator.transliterate, text, hub_script, ext_script
-                )
-                results.append(BenchmarkResult(
-                    hub_script, ext_script, "cross_hub_to_extension", size_name,
-                    throughput, latency, "instance_method"
-                ))
+def category_tasks(category_name, scripts, api_types=CATEGORY_API_TYPES):
+    """Benchmark tasks for every ordered pair of distinct scripts in a category"""
+    return [
+        (category_name, from_script, to_script, size_name, api_type)
+        for from_script, to_script in permutations(scripts, 2)
+        for size_name, api_type in product(TEXT_SIZES, api_types)
+    ]
+
+def cross_category_tasks():
+    """Benchmark tasks for hub to standard and hub to extension conversions"""
+    return [
+        (
+            "cross_hub_to_standard" if target_script in STANDARD_SCRIPTS else "cross_hub_to_extension",
+            hub_script, target_script, size_name, "instance_method"
+        )
+        for hub_script, target_script, size_name
+        in product(HUB_SCRIPTS, STANDARD_SCRIPTS + EXTENSION_SCRIPTS, TEXT_SIZES)
+    ]
+
+_transliterator = None
+_warmed = set()
+
+def get_transliterator():
+    """This process's Shlesha instance; each pool worker builds its own"""
+    global _transliterator
+    if _transliterator is None:
+        _transliterator = shlesha.Shlesha()
+    return _transliterator
+
+def warm_up(transliterator, text, from_script, to_script, calls=5):
+    """Warm a conversion on this process's instance and on the module-level one"""
+    for _ in range(calls):
+        transliterator.transliterate(text, from_script, to_script)
+        shlesha.transliterate(text, from_script, to_script)
+
+def run_one(task):
+    """Run one (category, from, to, size, api_type) benchmark task"""
+    category_name, from_script, to_script, size_name, api_type = task
+    text = TEXT_SIZES[size_name]
+    transliterator = get_transliterator()
+    
+    # Every API type shares the same conversion, so warm it once per
+    # (from, to, size) in this process rather than once per API type
+    key = (from_script, to_script, size_name)
+    if key not in _warmed:
+        warm_up(transliterator, text, from_script, to_script)
+        _warmed.add(key)
+    
+    if api_type == "instance_method":
+        throughput, latency = benchmark_api_method(
+            transliterator.transliterate, text, from_script, to_script,
+            bench=transliterator.bench_transliterate, warmup=0
+        )
+    elif api_type == "convenience_function":
+        throughput, latency = benchmark_api_method(
+            shlesha.transliterate, text, from_script, to_script,
+            bench=shlesha.bench_transliterate, warmup=0
+        )
+    elif api_type == "compiled_converter":
+        # Script pair resolved once, timed per call from Python
+        converter = transliterator.compile(from_script, to_script)
+        throughput, latency = benchmark_api_method(
+            converter, text, from_script, to_script, bound=True, warmup=0
+        )
+    elif api_type == "with_metadata":
+        throughput, latency = benchmark_api_method(
+            transliterator.transliterate_with_metadata, text, from_script, to_script,
+            bench=partial(transliterator.bench_transliterate, with_metadata=True), warmup=0
+        )
+    elif api_type == "bytes_function":
+        throughput, latency = benchmark_api_method(
+            shlesha.transliterate_bytes, TEXT_BYTES[size_name], from_script, to_script,
+            chars_count=TEXT_CHARS[size_name], warmup=0
+        )
+    else:
+        raise ValueError(f"Unknown API type: {api_type}")
+    
+    return BenchmarkResult(
+        from_script, to_script, category_name, size_name,
+        throughput, latency, api_type,
+        "rust" if api_type in RUST_TIMED_API_TYPES else "python"
+    )
+
+def run_tasks(tasks, jobs=1, threads=False):
+    """Run benchmark tasks, in `jobs` workers when jobs > 1
+
+    Workers are processes, or threads sharing one transliterator when
+    `threads` is set; the binding releases the GIL while it converts, so
+    threads overlap inside Rust. Every task is submitted up front so a slow
+    task never holds back queued ones. Results come back in task order.
+    Runs with fewer than MIN_TASKS_FOR_POOL tasks skip the pool.
+    """
+    jobs = min(jobs, len(tasks))
+    if jobs <= 1 or len(tasks) < MIN_TASKS_FOR_POOL:
+        return [run_one(task) for task in tasks]
+    
+    executor_class = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    results = [None] * len(tasks)
+    with executor_class(max_workers=jobs) as executor:
+        futures = {executor.submit(run_one, task): index for index, task in enumerate(tasks)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
 
 def write_csv_results(results, filename):
     """Write results to CSV file"""
+    rows = [
+        (r.script_from, r.script_to, r.category, r.text_size,
+         round(r.throughput_chars_per_sec), round(r.latency_ns), r.api_type, r.timing)
+        for r in results
+    ]
     with open(filename, 'w', newline='') as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerow(['script_from', 'script_to', 'category', 'text_size', 'throughput_chars_per_sec', 'latency_ns', 'api_type'])
-        
-        for result in results:
-            writer.writerow([
-                result.script_from, result.script_to, result.category, result.text_size,
-                f"{result.throughput_chars_per_sec:.0f}", f"{result.latency_ns:.0f}", result.api_type
-            ])
+        writer.writerow(['script_from', 'script_to', 'category', 'text_size', 'throughput_chars_per_sec', 'latency_ns', 'api_type', 'timing'])
+        writer.writerows(rows)
+
+_ROW = "| {0} | {1} | {2} | {3} | {4:.0f} | {5:.0f} |".format
+_CROSS_ROW = "| {0} | {1} | {2} | {3} | {4} | {5:.0f} | {6:.0f} |".format
+
+_TABLE_HEADER = (
+    "| From | To | Text Size | API Type | Throughput (chars/sec) | Latency (ns) |\n"
+    "|------|----|-----------|---------|-----------------------|-------------|"
+)
+_CROSS_TABLE_HEADER = (
+    "| From | To | Category | Text Size | API Type | Throughput (chars/sec) | Latency (ns) |\n"
+    "|------|----|-----------|-----------|---------|-----------------------|-------------|"
+)
 
 def generate_markdown_report(results):
     """Generate markdown report from results"""
     
-    md_content = "# Shlesha Python API Performance Benchmark Results\n\n"
-    
-    # Hub Scripts Performance
-    md_content += "## Hub Scripts (Devanagari ↔ ISO-15919)\n\n"
-    md_content += "| From | To | Text Size | API Type | Throughput (chars/sec) | Latency (ns) |\n"
-    md_content += "|------|----|-----------|---------|-----------------------|-------------|\n"
-    
-    for result in results:
-        if result.category == "hub":
-            md_content += f"| {result.script_from} | {result.script_to} | {result.text_size} | {result.api_type} | {result.throughput_chars_per_sec:.0f} | {result.latency_ns:.0f} |\n"
-    
-    # Standard Scripts Performance
-    md_content += "\n## Standard Indic Scripts\n\n"
-    md_content += "| From | To | Text Size | API Type | Throughput (chars/sec) | Latency (ns) |\n"
-    md_content += "|------|----|-----------|---------|-----------------------|-------------|\n"
-    
-    for result in results:
-        if result.category == "standard":
-            md_content += f"| {result.script_from} | {result.script_to} | {result.text_size} | {result.api_type} | {result.throughput_chars_per_sec:.0f} | {result.latency_ns:.0f} |\n"
-    
-    # Extension Scripts Performance
-    md_content += "\n## Extension Scripts (Roman/ASCII)\n\n"
-    md_content += "| From | To | Text Size | API Type | Throughput (chars/sec) | Latency (ns) |\n"
-    md_content += "|------|----|-----------|---------|-----------------------|-------------|\n"
-    
-    for result in results:
-        if result.category == "extension":
-            md_content += f"| {result.script_from} | {result.script_to} | {result.text_size} | {result.api_type} | {result.throughput_chars_per_sec:.0f} | {result.latency_ns:.0f} |\n"
-    
-    # Cross-Category Performance
-    md_content += "\n## Cross-Category Performance\n\n"
-    md_content += "| From | To | Category | Text Size | API Type | Throughput (chars/sec) | Latency (ns) |\n"
-    md_content += "|------|----|-----------|-----------|---------|-----------------------|-------------|\n"
+    # One pass: format each row into its section and collect throughputs for the summaries
+    rows = {"hub": [], "standard": [], "extension": [], "cross": []}
+    api_stats = {"rust": {}, "python": {}}
+    category_stats = {}
     
     for result in results:
         if result.category.startswith("cross_"):
-            md_content += f"| {result.script_from} | {result.script_to} | {result.category} | {result.text_size} | {result.api_type} | {result.throughput_chars_per_sec:.0f} | {result.latency_ns:.0f} |\n"
-    
-    # API Method Comparison
-    md_content += "\n## API Method Performance Comparison\n\n"
-    
-    api_stats = {}
-    for result in results:
-        if result.api_type not in api_stats:
-            api_stats[result.api_type] = []
-        api_stats[result.api_type].append(result.throughput_chars_per_sec)
-    
-    md_content += "| API Method | Average Throughput (chars/sec) | Count |\n"
-    md_content += "|------------|-------------------------------|-------|\n"
-    
-    for api_type, throughputs in api_stats.items():
-        avg_throughput = statistics.mean(throughputs)
-        count = len(throughputs)
-        md_content += f"| {api_type} | {avg_throughput:.0f} | {count} |\n"
-    
-    # Category Summary
-    md_content += "\n## Category Summary\n\n"
-    
-    category_stats = {}
-    for result in results:
-        if result.category not in category_stats:
-            category_stats[result.category] = []
-        category_stats[result.category].append(result.throughput_chars_per_sec)
-    
-    md_content += "| Category | Average Throughput (chars/sec) | Count |\n"
-    md_content += "|----------|-------------------------------|-------|\n"
-    
-    for category, throughputs in category_stats.items():
-        avg_throughput = statistics.mean(throughputs)
-        count = len(throughputs)
-        md_content += f"| {category} | {avg_throughput:.0f} | {count} |\n"
-    
-    return md_content
+            rows["cross"].append(_CROSS_ROW(
+                result.script_from, result.script_to, result.category, result.text_size,
+                result.api_type, result.throughput_chars_per_sec, result.latency_ns
+            ))
+        elif result.category in rows:
+            rows[result.category].append(_ROW(
+                result.script_from, result.script_to, result.text_size, result.api_type,
+                result.throughput_chars_per_sec, result.latency_ns
+            ))
+        api_stats[result.timing].setdefault(result.api_type, []).append(result.throughput_chars_per_sec)
+        if result.timing == "rust":
+            category_stats.setdefault(result.category, []).append(result.throughput_chars_per_sec)
+    
+    def summary_rows(stats):
+        return [f"| {name} | {statistics.fmean(throughputs):.0f} | {len(throughputs)} |"
+                for name, throughputs in stats.items()]
+    
+    sections = [
+        "# Shlesha Python API Performance Benchmark Results\n",
+        "## Hub Scripts (Devanagari ↔ ISO-15919)\n",
+        _TABLE_HEADER, *rows["hub"],
+        "\n## Standard Indic Scripts\n",
+        _TABLE_HEADER, *rows["standard"],
+        "\n## Extension Scripts (Roman/ASCII)\n",
+        _TABLE_HEADER, *rows["extension"],
+        "\n## Cross-Category Performance\n",
+        _CROSS_TABLE_HEADER, *rows["cross"],
+        "\n## API Method Performance Comparison\n",
+        "### Timed inside Rust (no per-call Python/Rust overhead)\n",
+        "| API Method | Average Throughput (chars/sec) | Count |",
+        "|------------|-------------------------------|-------|",
+        *summary_rows(api_stats["rust"]),
+        "\n### Timed from Python (includes per-call overhead)\n",
+        "| API Method | Average Throughput (chars/sec) | Count |",
+        "|------------|-------------------------------|-------|",
+        *summary_rows(api_stats["python"]),
+        "\n## Category Summary (Rust-timed API methods)\n",
+        "| Category | Average Throughput (chars/sec) | Count |",
+        "|----------|-------------------------------|-------|",
+        *summary_rows(category_stats),
+    ]
+    return "\n".join(sections) + "\n"
 
 def main():
     """Run comprehensive Python API benchmarks"""
-    
-    # Create transliterator instance
-    transliterator = shlesha.Shlesha()
-    
-    # Collect all results
-    results = []
-    
-    print("Running Hub Scripts benchmarks...")
-    benchmark_category("hub", HUB_SCRIPTS, transliterator, results)
-    
-    print("Running Standard Scripts benchmarks...")
-    benchmark_category("standard", STANDARD_SCRIPTS, transliterator, results)
-    
-    print("Running Extension Scripts benchmarks...")
-    benchmark_category("extension", EXTENSION_SCRIPTS, transliterator, results)
-    
-    print("Running Cross-Category benchmarks...")
-    benchmark_cross_category(transliterator, results)
+    parser = argparse.ArgumentParser(description="Run Shlesha Python API benchmarks")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="run benchmarks in N worker processes, 0 for one per CPU (faster, noisier; default: 1)")
+    parser.add_argument("--threads", action="store_true",
+                        help="use worker threads instead of processes for --jobs")
+    parser.add_argument("--measure-aliases", action="store_true",
+                        help="also time API types that repeat another's measurement (convenience_function)")
+    args = parser.parse_args()
+    jobs = args.jobs or os.cpu_count() or 1
+    
+    categories = {"hub": HUB_SCRIPTS, "standard": STANDARD_SCRIPTS, "extension": EXTENSION_SCRIPTS}
+    api_types = CATEGORY_API_TYPES
+    if not args.measure_aliases:
+        api_types = tuple(t for t in CATEGORY_API_TYPES if t not in ALIASED_API_TYPES)
+    
+    tasks = [
+        *(task for name, scripts in categories.items() for task in category_tasks(name, scripts, api_types)),
+        *cross_category_tasks(),
+    ]
+    
+    worker_kind = "thread(s)" if args.threads else "process(es)"
+    print(f"Running {len(tasks)} benchmarks in {jobs} {worker_kind}...")
+    results = run_tasks(tasks, jobs, args.threads)
     
     # Write results
     os.makedirs("target", exist_ok=True)
@@ -233,8 +303,9 @@ def main():
     
     # Generate markdown report
     md_content = generate_markdown_report(results)
-    with open("target/PYTHON_BENCHMARK_RESULTS.md", "w") as f:
-        f.write(md_content)
+    # One UTF-8 encode of the whole report, no text-layer newline translation
+    with open("target/PYTHON_BENCHMARK_RESULTS.md", "wb") as f:
+        f.write(md_content.encode("utf-8"))
     
     print(f"Benchmarks complete. Results written to:")
     print("  target/python_benchmark_results.csv")
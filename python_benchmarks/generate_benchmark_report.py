@@ -4,11 +4,18 @@ Generate a clean, consolidated benchmark report from all benchmark results.
 Produces a single markdown file with just data - no commentary.
 """
 
+import io
 import os
 import csv
 import json
+import argparse
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def read_csv_results(filename):
     """Read CSV benchmark results"""
     results = []
@@ -18,6 +25,72 @@ def read_csv_results(filename):
             results = list(reader)
     return results
 
+RUST_CATEGORIES = ("hub", "standard", "extension", "cross_category")
+
+def load_results():
+    """Read every benchmark CSV once, for all the report writers to share
+
+    Rust results stay keyed by the file they came from.
+    """
+    return {
+        'rust': {category: read_csv_results(f"target/benchmark_results_{category}.csv")
+                 for category in RUST_CATEGORIES},
+        'python': read_csv_results("target/python_benchmark_results.csv"),
+        'comparison': read_csv_results("target/comparison_benchmark_results.csv"),
+    }
+
+def group_by(rows, key):
+    """Bucket rows by `key` in one pass, keeping each bucket in input order"""
+    groups = {}
+    for r in rows:
+        groups.setdefault(r.get(key), []).append(r)
+    return groups
+
+def to_float(value):
+    """Parse a numeric CSV field, returning None when it is not a number"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def average(values):
+    """Mean of the non-None values, or None if there are none"""
+    values = [v for v in values if v is not None]
+    return sum(values) / len(values) if values else None
+
+def mean_throughput_by(rows, key):
+    """Average throughput per value of `key`, sorted by that value
+
+    Groups without a single numeric throughput are left out.
+    """
+    groups = {}
+    for r in rows:
+        groups.setdefault(r[key], []).append(to_float(r['throughput_chars_per_sec']))
+    return sorted((name, avg) for name, avg in ((name, average(xs)) for name, xs in groups.items())
+                  if avg is not None)
+
+def library_ranking(rows):
+    """(library, avg throughput, success rate %) for each library, fastest first
+
+    Only successful runs count towards the average; libraries with no
+    successful runs are left out.
+    """
+    lib_stats = {}
+    for r in rows:
+        stats = lib_stats.setdefault(r['library'], {'throughputs': [], 'total': 0, 'success': 0})
+        stats['total'] += 1
+        if r.get('success') == 'True':
+            stats['success'] += 1
+            stats['throughputs'].append(to_float(r['throughput_chars_per_sec']))
+    ranking = []
+    for lib, stats in lib_stats.items():
+        avg = average(stats['throughputs'])
+        if avg is not None:
+            ranking.append((lib, avg, (stats['success'] / stats['total']) * 100))
+    
+    ranking.sort(key=lambda x: x[1], reverse=True)
+    return ranking
+
 def format_number(num_str):
     """Format number string for display"""
     try:
@@ -25,75 +98,70 @@ def format_number(num_str):
     except:
         return num_str
 
-def generate_clean_report():
-    """Generate consolidated benchmark report"""
-    report = []
-    report.append(f"# Shlesha Benchmark Results")
-    report.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-    report.append("")
+RUST_SECTIONS = (
+    ("hub", "Hub Scripts (Devanagari ↔ ISO-15919)"),
+    ("standard", "Standard Indic Scripts"),
+    ("extension", "Extension Scripts (Roman/ASCII)"),
+)
+
+RUST_TABLE_HEADER = (
+    "| From | To | Text Size | Throughput (chars/sec) | Latency (ns) |\n"
+    "|------|----|-----------|-----------------------|-------------|\n"
+)
+PYTHON_TABLE_HEADER = (
+    "| From | To | Category | Text Size | Throughput (chars/sec) | Latency (ns) |\n"
+    "|------|-----|----------|-----------|------------------------|-------------|\n"
+)
+COMPARISON_TABLE_HEADER = (
+    "| Library | Text Size | Throughput (chars/sec) | Latency (ns) |\n"
+    "|---------|-----------|------------------------|-------------|\n"
+)
+
+# Row templates, bound once rather than re-parsed as f-strings per row
+RUST_ROW = "| {script_from} | {script_to} | {text_size} | {throughput} | {latency} |\n".format
+PYTHON_ROW = "| {script_from} | {script_to} | {category} | {text_size} | {throughput} | {latency} |\n".format
+COMPARISON_ROW = "| {library} | {text_size} | {throughput} | {latency} |\n".format
+
+def write_rows(buf, row, rows):
+    """Write one formatted table row per result, with throughput and latency formatted"""
+    buf.writelines(
+        row(**r, throughput=format_number(r['throughput_chars_per_sec']),
+            latency=format_number(r['latency_ns']))
+        for r in rows
+    )
+
+def generate_clean_report(results):
+    """Generate consolidated benchmark report from load_results() output"""
+    buf = io.StringIO()
+    buf.write("# Shlesha Benchmark Results\n")
+    buf.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
     
     # Rust/Native benchmarks
-    rust_results = []
-    for category in ["hub", "standard", "extension", "cross_category"]:
-        rust_results.extend(read_csv_results(f"target/benchmark_results_{category}.csv"))
+    rust_results = [r for rows in results['rust'].values() for r in rows]
     
     if rust_results:
-        report.append("## Rust Native Performance")
-        report.append("")
-        report.append("### Hub Scripts (Devanagari ↔ ISO-15919)")
-        report.append("| From | To | Text Size | Throughput (chars/sec) | Latency (ns) |")
-        report.append("|------|----|-----------|-----------------------|-------------|")
-        
-        for r in rust_results:
-            if r.get('category') == 'hub':
-                report.append(f"| {r['script_from']} | {r['script_to']} | {r['text_size']} | {format_number(r['throughput_chars_per_sec'])} | {format_number(r['latency_ns'])} |")
-        
-        report.append("")
-        report.append("### Standard Indic Scripts")
-        report.append("| From | To | Text Size | Throughput (chars/sec) | Latency (ns) |")
-        report.append("|------|----|-----------|-----------------------|-------------|")
-        
-        for r in rust_results:
-            if r.get('category') == 'standard':
-                report.append(f"| {r['script_from']} | {r['script_to']} | {r['text_size']} | {format_number(r['throughput_chars_per_sec'])} | {format_number(r['latency_ns'])} |")
-        
-        report.append("")
-        report.append("### Extension Scripts (Roman/ASCII)")
-        report.append("| From | To | Text Size | Throughput (chars/sec) | Latency (ns) |")
-        report.append("|------|----|-----------|-----------------------|-------------|")
-        
-        for r in rust_results:
-            if r.get('category') == 'extension':
-                report.append(f"| {r['script_from']} | {r['script_to']} | {r['text_size']} | {format_number(r['throughput_chars_per_sec'])} | {format_number(r['latency_ns'])} |")
+        buf.write("## Rust Native Performance\n")
+        by_category = group_by(rust_results, 'category')
+        for category, title in RUST_SECTIONS:
+            buf.write(f"\n### {title}\n" + RUST_TABLE_HEADER)
+            write_rows(buf, RUST_ROW, by_category.get(category, ()))
     
     # Python benchmarks
-    python_results = read_csv_results("target/python_benchmark_results.csv")
+    python_results = results['python']
     
     if python_results:
-        report.append("")
-        report.append("## Python API Performance")
-        report.append("")
-        
-        # Group by API type
-        api_types = set(r['api_type'] for r in python_results)
+        buf.write("\n## Python API Performance\n\n")
         
-        for api_type in sorted(api_types):
-            report.append(f"### {api_type.replace('_', ' ').title()}")
-            report.append("| From | To | Category | Text Size | Throughput (chars/sec) | Latency (ns) |")
-            report.append("|------|-----|----------|-----------|------------------------|-------------|")
-            
-            for r in python_results:
-                if r['api_type'] == api_type:
-                    report.append(f"| {r['script_from']} | {r['script_to']} | {r['category']} | {r['text_size']} | {format_number(r['throughput_chars_per_sec'])} | {format_number(r['latency_ns'])} |")
-            report.append("")
+        for api_type, rows in sorted(group_by(python_results, 'api_type').items()):
+            buf.write(f"### {api_type.replace('_', ' ').title()}\n" + PYTHON_TABLE_HEADER)
+            write_rows(buf, PYTHON_ROW, rows)
+            buf.write("\n")
     
     # Comparison benchmarks
-    comparison_results = read_csv_results("target/comparison_benchmark_results.csv")
+    comparison_results = results['comparison']
     
     if comparison_results:
-        report.append("")
-        report.append("## Library Comparison")
-        report.append("")
+        buf.write("\n## Library Comparison\n\n")
         
         # Group by conversion
         conversions = {}
@@ -106,103 +174,103 @@ def generate_clean_report():
         
         for conversion, results in sorted(conversions.items()):
             from_script, to_script = conversion.split('_')
-            report.append(f"### {from_script} → {to_script}")
-            report.append("| Library | Text Size | Throughput (chars/sec) | Latency (ns) |")
-            report.append("|---------|-----------|------------------------|-------------|")
-            
-            for r in sorted(results, key=lambda x: (x['text_size'], x['library'])):
-                report.append(f"| {r['library']} | {r['text_size']} | {format_number(r['throughput_chars_per_sec'])} | {format_number(r['latency_ns'])} |")
-            report.append("")
+            buf.write(f"### {from_script} → {to_script}\n" + COMPARISON_TABLE_HEADER)
+            write_rows(buf, COMPARISON_ROW, sorted(results, key=lambda x: (x['text_size'], x['library'])))
+            buf.write("\n")
     
     # Performance Summary Tables
-    report.append("")
-    report.append("## Performance Summary")
-    report.append("")
+    buf.write("\n## Performance Summary\n\n")
     
     # Calculate averages
     if rust_results:
-        categories = {}
-        for r in rust_results:
-            cat = r['category']
-            if cat not in categories:
-                categories[cat] = []
-            try:
-                categories[cat].append(float(r['throughput_chars_per_sec']))
-            except:
-                pass
-        
-        report.append("### Average Throughput by Category (Rust)")
-        report.append("| Category | Avg Throughput (chars/sec) |")
-        report.append("|----------|----------------------------|")
-        
-        for cat, throughputs in sorted(categories.items()):
-            if throughputs:
-                avg = sum(throughputs) / len(throughputs)
-                report.append(f"| {cat} | {avg:,.0f} |")
+        buf.write("### Average Throughput by Category (Rust)\n"
+                  "| Category | Avg Throughput (chars/sec) |\n"
+                  "|----------|----------------------------|\n")
+        for cat, avg in mean_throughput_by(rust_results, 'category'):
+            buf.write(f"| {cat} | {avg:,.0f} |\n")
     
     if python_results:
-        report.append("")
-        report.append("### Average Throughput by API Type (Python)")
-        report.append("| API Type | Avg Throughput (chars/sec) |")
-        report.append("|----------|----------------------------|")
-        
-        api_throughputs = {}
-        for r in python_results:
-            api = r['api_type']
-            if api not in api_throughputs:
-                api_throughputs[api] = []
-            try:
-                api_throughputs[api].append(float(r['throughput_chars_per_sec']))
-            except:
-                pass
-        
-        for api, throughputs in sorted(api_throughputs.items()):
-            if throughputs:
-                avg = sum(throughputs) / len(throughputs)
-                report.append(f"| {api} | {avg:,.0f} |")
+        # Rust-timed and Python-timed API types are not comparable, so they
+        # are averaged separately (older CSVs have no timing column)
+        buf.write("\n### Average Throughput by API Type (Python)\n"
+                  "| API Type | Timed In | Avg Throughput (chars/sec) |\n"
+                  "|----------|----------|----------------------------|\n")
+        for timing, rows in sorted(group_by(python_results, 'timing').items(), key=lambda kv: kv[0] or ''):
+            for api, avg in mean_throughput_by(rows, 'api_type'):
+                buf.write(f"| {api} | {timing or 'unknown'} | {avg:,.0f} |\n")
     
     if comparison_results:
-        report.append("")
-        report.append("### Library Performance Ranking")
-        report.append("| Library | Avg Throughput (chars/sec) | Success Rate |")
-        report.append("|---------|----------------------------|--------------|")
-        
-        lib_stats = {}
-        for r in comparison_results:
-            lib = r['library']
-            if lib not in lib_stats:
-                lib_stats[lib] = {'throughputs': [], 'total': 0, 'success': 0}
-            lib_stats[lib]['total'] += 1
-            if r.get('success') == 'True':
-                lib_stats[lib]['success'] += 1
-                try:
-                    lib_stats[lib]['throughputs'].append(float(r['throughput_chars_per_sec']))
-                except:
-                    pass
-        
-        # Sort by average throughput
-        lib_ranking = []
-        for lib, stats in lib_stats.items():
-            if stats['throughputs']:
-                avg = sum(stats['throughputs']) / len(stats['throughputs'])
-                success_rate = (stats['success'] / stats['total']) * 100
-                lib_ranking.append((lib, avg, success_rate))
-        
-        lib_ranking.sort(key=lambda x: x[1], reverse=True)
-        
-        for lib, avg, success_rate in lib_ranking:
-            report.append(f"| {lib} | {avg:,.0f} | {success_rate:.0f}% |")
+        buf.write("\n### Library Performance Ranking\n"
+                  "| Library | Avg Throughput (chars/sec) | Success Rate |\n"
+                  "|---------|----------------------------|--------------|\n")
+        for lib, avg, success_rate in library_ranking(comparison_results):
+            buf.write(f"| {lib} | {avg:,.0f} | {success_rate:.0f}% |\n")
     
-    return '\n'.join(report)
+    return buf.getvalue()
+
+def generate_report_data(results):
+    """Collect load_results() output into a structure suitable for JSON output"""
+    data = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'rust': {'categories': {}},
+        'python': {'api_types': {}},
+        'comparison': {'conversions': {}, 'libraries': {}},
+    }
+
+    for category, rows in results['rust'].items():
+        if rows:
+            data['rust']['categories'][category] = {
+                'rows': rows,
+                'avg_throughput': average(to_float(r.get('throughput_chars_per_sec')) for r in rows),
+            }
+
+    for r in results['python']:
+        entry = data['python']['api_types'].setdefault(r['api_type'], {'rows': []})
+        entry['rows'].append(r)
+    for entry in data['python']['api_types'].values():
+        entry['avg_throughput'] = average(to_float(r.get('throughput_chars_per_sec')) for r in entry['rows'])
+
+    for r in results['comparison']:
+        success = r.get('success') == 'True'
+        if success:
+            key = f"{r['from_script']}_{r['to_script']}"
+            data['comparison']['conversions'].setdefault(key, []).append(r)
+        lib = data['comparison']['libraries'].setdefault(
+            r['library'], {'total': 0, 'success': 0, 'throughputs': []})
+        lib['total'] += 1
+        if success:
+            lib['success'] += 1
+            lib['throughputs'].append(to_float(r.get('throughput_chars_per_sec')))
+    for lib in data['comparison']['libraries'].values():
+        lib['avg_throughput'] = average(lib.pop('throughputs'))
+        lib['success_rate'] = (lib['success'] / lib['total']) * 100
+
+    return data
+
+def write_json(data, path):
+    """Write report data as JSON, using orjson when it is available"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
 
 def main():
     """Generate consolidated benchmark report"""
+    parser = argparse.ArgumentParser(description="Generate consolidated benchmark report")
+    parser.add_argument("--json", metavar="PATH",
+                        help="also write the full results structure as JSON to PATH")
+    args = parser.parse_args()
+
     os.makedirs("target", exist_ok=True)
     
-    report = generate_clean_report()
+    results = load_results()
+    report = generate_clean_report(results)
     
-    with open("target/BENCHMARK_DATA.md", "w") as f:
-        f.write(report)
+    # One UTF-8 encode of the whole report, no text-layer newline translation
+    with open("target/BENCHMARK_DATA.md", "wb") as f:
+        f.write(report.encode("utf-8"))
     
     print("Generated consolidated benchmark report: target/BENCHMARK_DATA.md")
     
@@ -216,9 +284,7 @@ def main():
     summary.append("|--------|-------|")
     
     # Add key metrics
-    rust_results = []
-    for category in ["hub", "standard", "extension"]:
-        rust_results.extend(read_csv_results(f"target/benchmark_results_{category}.csv"))
+    rust_results = [r for category in ("hub", "standard", "extension") for r in results['rust'][category]]
     
     if rust_results:
         throughputs = []
@@ -233,7 +299,7 @@ def main():
             summary.append(f"| Rust Max Throughput | {max(throughputs):,.0f} chars/sec |")
             summary.append(f"| Rust Min Throughput | {min(throughputs):,.0f} chars/sec |")
     
-    python_results = read_csv_results("target/python_benchmark_results.csv")
+    python_results = results['python']
     if python_results:
         throughputs = []
         for r in python_results:
@@ -248,10 +314,14 @@ def main():
     summary.append("")
     summary.append("*See target/BENCHMARK_DATA.md for complete results*")
     
-    with open("target/BENCHMARK_SUMMARY.md", "w") as f:
-        f.write('\n'.join(summary))
+    with open("target/BENCHMARK_SUMMARY.md", "wb") as f:
+        f.write('\n'.join(summary).encode("utf-8"))
     
     print("Generated benchmark summary: target/BENCHMARK_SUMMARY.md")
 
+    if args.json:
+        write_json(generate_report_data(results), args.json)
+        print(f"Generated JSON results: {args.json}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
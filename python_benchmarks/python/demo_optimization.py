@@ -4,25 +4,27 @@ Demonstration of Shlesha Aho-Corasick Optimization Impact
 Shows the performance improvements achieved
 """
 
-import time
-import statistics
+import timeit
+from functools import partial
 import shlesha
 from vidyut.lipi import transliterate, Scheme
 
-def benchmark_function(func, iterations=5000):
-    """Benchmark a function call."""
-    times = []
-    result = None
-    
-    for _ in range(iterations):
-        start = time.perf_counter()
-        result = func()
-        times.append(time.perf_counter() - start)
+def benchmark_function(func, iterations=None):
+    """Benchmark a function call.
+
+    The loop is timed with one clock read at each end. Without an explicit
+    iteration count, timeit's autorange picks one that runs for at least 0.2s.
+    """
+    timer = timeit.Timer(func)
+    if iterations is None:
+        iterations, total = timer.autorange()
+    else:
+        total = timer.timeit(iterations)
     
     return {
-        'avg_time': statistics.mean(times),
-        'ops_per_sec': iterations / sum(times),
-        'result': result
+        'avg_time': total / iterations,
+        'ops_per_sec': iterations / total,
+        'result': func()
     }
 
 def main():
@@ -71,13 +73,9 @@ def main():
         print(f"   {test['description']}")
         print("-" * 60)
         
-        # Shlesha test
-        def shlesha_func():
-            return shlesha.transliterate(test['text'], test['shlesha'][0], test['shlesha'][1])
-        
-        # Vidyut test  
-        def vidyut_func():
-            return transliterate(test['text'], test['vidyut'][0], test['vidyut'][1])
+        # Bind the arguments up front so each timed call goes straight to the library
+        shlesha_func = partial(shlesha.transliterate, test['text'], *test['shlesha'])
+        vidyut_func = partial(transliterate, test['text'], *test['vidyut'])
         
         shlesha_result = benchmark_function(shlesha_func)
         vidyut_result = benchmark_function(vidyut_func)
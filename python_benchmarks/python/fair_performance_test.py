@@ -4,26 +4,27 @@ Fair Performance Comparison
 Ensures both libraries are doing equivalent work
 """
 
-import time
-import statistics
+import timeit
+from functools import partial
 import shlesha
 from vidyut.lipi import transliterate, Scheme
 
-def benchmark_function(func, iterations=5000):
-    """Benchmark a function."""
-    times = []
-    result = None
-    
-    for _ in range(iterations):
-        start = time.perf_counter()
-        result = func()
-        times.append(time.perf_counter() - start)
+def benchmark_function(func, iterations=None):
+    """Benchmark a function.
+
+    The loop is timed with one clock read at each end. Without an explicit
+    iteration count, timeit's autorange picks one that runs for at least 0.2s.
+    """
+    timer = timeit.Timer(func)
+    if iterations is None:
+        iterations, total = timer.autorange()
+    else:
+        total = timer.timeit(iterations)
     
-    avg_time = statistics.mean(times)
     return {
-        'avg_time': avg_time,
-        'ops_per_sec': 1 / avg_time,
-        'result': result
+        'avg_time': total / iterations,
+        'ops_per_sec': iterations / total,
+        'result': func()
     }
 
 def verify_output(input_text, output1, output2, conversion_type):
@@ -136,20 +137,9 @@ def main():
         print(f"\n{test['name']} ({test['type']})")
         print(f"Input: '{test['input']}'")
         
-        # Define benchmark functions
-        def shlesha_func():
-            return shlesha.transliterate(
-                test['input'], 
-                test['shlesha_args'][0], 
-                test['shlesha_args'][1]
-            )
-        
-        def vidyut_func():
-            return transliterate(
-                test['input'],
-                test['vidyut_args'][0],
-                test['vidyut_args'][1]
-            )
+        # Bind the arguments up front so each timed call goes straight to the library
+        shlesha_func = partial(shlesha.transliterate, test['input'], *test['shlesha_args'])
+        vidyut_func = partial(transliterate, test['input'], *test['vidyut_args'])
         
         # Run benchmarks
         shlesha_result = benchmark_function(shlesha_func)
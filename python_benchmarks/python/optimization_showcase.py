@@ -4,29 +4,45 @@ Shlesha Aho-Corasick Optimization Showcase
 Shows the real-world performance improvements achieved
 """
 
+import array
 import time
 import statistics
+from functools import partial
 import shlesha
 from vidyut.lipi import transliterate, Scheme
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def summarize_times(times):
+    """Return (mean, min, max, stdev) of the samples, via numpy when available."""
+    if np is not None:
+        arr = np.asarray(times)
+        return float(arr.mean()), float(arr.min()), float(arr.max()), float(arr.std(ddof=1))
+    return statistics.fmean(times), min(times), max(times), statistics.stdev(times)
+
 def benchmark_function(func, iterations=5000):
-    """Benchmark a function with timing stats."""
-    times = []
+    """Benchmark a function with timing stats (reported in seconds)."""
+    # Integer nanoseconds avoid float rounding on sub-microsecond calls
+    times = np.empty(iterations, dtype=np.int64) if np is not None else array.array('q', [0] * iterations)
     result = None
     
-    for _ in range(iterations):
-        start = time.perf_counter()
+    for i in range(iterations):
+        start = time.perf_counter_ns()
         result = func()
-        times.append(time.perf_counter() - start)
+        times[i] = time.perf_counter_ns() - start
     
-    avg_time = statistics.mean(times)
+    avg_ns, min_ns, max_ns, std_ns = summarize_times(times)
+    avg_time, min_time, max_time, std_dev = avg_ns / 1e9, min_ns / 1e9, max_ns / 1e9, std_ns / 1e9
     return {
         'avg_time': avg_time,
         'ops_per_sec': 1 / avg_time,
         'result': result,
-        'min_time': min(times),
-        'max_time': max(times),
-        'std_dev': statistics.stdev(times),
+        'min_time': min_time,
+        'max_time': max_time,
+        'std_dev': std_dev,
         'iterations': iterations
     }
 
@@ -98,20 +114,21 @@ def main():
         print(f"   Strategy: {test['note']}")
         print("-" * 65)
         
-        # Define test functions
-        def shlesha_func():
-            return shlesha.transliterate(test['text'], test['shlesha_args'][0], test['shlesha_args'][1])
-        
-        def vidyut_func():
-            return transliterate(test['text'], test['vidyut_args'][0], test['vidyut_args'][1])
+        # Bind the arguments up front so each timed call goes straight to the library
+        shlesha_func = partial(shlesha.transliterate, test['text'], *test['shlesha_args'])
+        shlesha_cached_func = partial(shlesha.transliterate_cached, test['text'], *test['shlesha_args'])
+        vidyut_func = partial(transliterate, test['text'], *test['vidyut_args'])
         
         # Run benchmarks
         shlesha_result = benchmark_function(shlesha_func)
         vidyut_result = benchmark_function(vidyut_func)
+        # Every call after the first is a cache hit; not part of the head-to-head
+        cached_result = benchmark_function(shlesha_cached_func)
         
         # Display results
         print(f"   Shlesha: {shlesha_result['ops_per_sec']:>8,.0f} ops/sec → '{shlesha_result['result']}'")
         print(f"   Vidyut:  {vidyut_result['ops_per_sec']:>8,.0f} ops/sec → '{vidyut_result['result']}'")
+        print(f"   Shlesha (cached throughput): {cached_result['ops_per_sec']:>8,.0f} ops/sec")
         
         # Determine winner
         if shlesha_result['ops_per_sec'] > vidyut_result['ops_per_sec']:
@@ -4,32 +4,37 @@ Quick Performance Test: Shlesha vs Vidyut
 Shows the impact of Aho-Corasick optimization
 """
 
-import time
-import statistics
+import timeit
+from functools import partial
 
-def test_conversion(name, shlesha_func, vidyut_func, iterations=3000):
+import shlesha
+from vidyut.lipi import transliterate, Scheme
+
+# Resolved once, not on every timed call
+TELUGU, DEVANAGARI, IAST, SLP1 = Scheme.Telugu, Scheme.Devanagari, Scheme.Iast, Scheme.Slp1
+
+def average_time(func, iterations=None):
+    """Mean seconds per call of func
+
+    With iterations=None the loop count is picked by timeit's autorange
+    (enough calls to take at least 0.2s) rather than fixed up front.
+    """
+    timer = timeit.Timer(func)
+    if iterations is None:
+        iterations, total = timer.autorange()
+    else:
+        total = timer.timeit(iterations)
+    return total / iterations
+
+def test_conversion(name, shlesha_func, vidyut_func, iterations=None):
     """Test and compare a specific conversion."""
     print(f"\n🧪 Testing: {name}")
     print("-" * 50)
     
-    # Test Shlesha
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        shlesha_func()
-        times.append(time.perf_counter() - start)
-    
-    shlesha_avg = statistics.mean(times)
+    shlesha_avg = average_time(shlesha_func, iterations)
     shlesha_throughput = 1 / shlesha_avg
     
-    # Test Vidyut
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        vidyut_func()
-        times.append(time.perf_counter() - start)
-    
-    vidyut_avg = statistics.mean(times)
+    vidyut_avg = average_time(vidyut_func, iterations)
     vidyut_throughput = 1 / vidyut_avg
     
     # Compare
@@ -49,14 +54,12 @@ def test_conversion(name, shlesha_func, vidyut_func, iterations=3000):
         'faster': faster,
         'speedup': speedup,
         'shlesha_throughput': shlesha_throughput,
-        'vidyut_throughput': vidyut_throughput
+        'vidyut_throughput': vidyut_throughput,
+        'shlesha_output': shlesha_func(),
     }
 
 def main():
     """Run the performance comparison."""
-    import shlesha
-    from vidyut.lipi import transliterate, Scheme
-    
     print("⚡ Shlesha vs Vidyut Performance Comparison")
     print("=" * 60)
     print("Testing the impact of Aho-Corasick optimization")
@@ -64,10 +67,8 @@ def main():
     results = []
     
     # Test 1: Indic → Indic (where Shlesha should win)
-    def shlesha_indic(): 
-        return shlesha.transliterate("నమస్కారం", "telugu", "devanagari")
-    def vidyut_indic(): 
-        return transliterate("నమస్కారం", Scheme.Telugu, Scheme.Devanagari)
+    shlesha_indic = partial(shlesha.transliterate, "నమస్కారం", "telugu", "devanagari")
+    vidyut_indic = partial(transliterate, "నమస్కారం", TELUGU, DEVANAGARI)
     
     results.append(test_conversion(
         "Indic → Indic (Telugu → Devanagari)",
@@ -75,10 +76,8 @@ def main():
     ))
     
     # Test 2: Roman → Roman (Aho-Corasick optimization)
-    def shlesha_roman(): 
-        return shlesha.transliterate("namaskāram", "iast", "slp1")
-    def vidyut_roman(): 
-        return transliterate("namaskāram", Scheme.Iast, Scheme.Slp1)
+    shlesha_roman = partial(shlesha.transliterate, "namaskāram", "iast", "slp1")
+    vidyut_roman = partial(transliterate, "namaskāram", IAST, SLP1)
     
     results.append(test_conversion(
         "Roman → Roman (IAST → SLP1)",
@@ -86,10 +85,8 @@ def main():
     ))
     
     # Test 3: Roman → Indic (complex pipeline)
-    def shlesha_roman_indic(): 
-        return shlesha.transliterate("saṃskṛtam", "iast", "telugu")
-    def vidyut_roman_indic(): 
-        return transliterate("saṃskṛtam", Scheme.Iast, Scheme.Telugu)
+    shlesha_roman_indic = partial(shlesha.transliterate, "saṃskṛtam", "iast", "telugu")
+    vidyut_roman_indic = partial(transliterate, "saṃskṛtam", IAST, TELUGU)
     
     results.append(test_conversion(
         "Roman → Indic (IAST → Telugu)",
@@ -97,10 +94,8 @@ def main():
     ))
     
     # Test 4: Indic → Roman
-    def shlesha_indic_roman(): 
-        return shlesha.transliterate("సంస్కృతం", "telugu", "slp1")
-    def vidyut_indic_roman(): 
-        return transliterate("సంస్కృతం", Scheme.Telugu, Scheme.Slp1)
+    shlesha_indic_roman = partial(shlesha.transliterate, "సంస్కృతం", "telugu", "slp1")
+    vidyut_indic_roman = partial(transliterate, "సంస్కృతం", TELUGU, SLP1)
     
     results.append(test_conversion(
         "Indic → Roman (Telugu → SLP1)",
@@ -130,9 +125,9 @@ def main():
     
     # Show sample outputs
     print(f"\n📝 Sample Conversions:")
-    print(f"Telugu → Devanagari: నమస్కారం → {shlesha.transliterate('నమస్కారం', 'telugu', 'devanagari')}")
-    print(f"IAST → SLP1: namaskāram → {shlesha.transliterate('namaskāram', 'iast', 'slp1')}")
-    print(f"IAST → Telugu: saṃskṛtam → {shlesha.transliterate('saṃskṛtam', 'iast', 'telugu')}")
+    print(f"Telugu → Devanagari: నమస్కారం → {results[0]['shlesha_output']}")
+    print(f"IAST → SLP1: namaskāram → {results[1]['shlesha_output']}")
+    print(f"IAST → Telugu: saṃskṛtam → {results[2]['shlesha_output']}")
 
 if __name__ == "__main__":
     main()
@@ -37,12 +37,22 @@ print_success "CLI binary built: ./target/release/shlesha"
 # Build Python bindings
 print_status "Building Python bindings..."
 if command -v uv &> /dev/null && [[ -f "pyproject.toml" ]]; then
-    if [[ "$RUST_SETUP" == "homebrew" ]]; then
-        PYO3_USE_ABI3_FORWARD_COMPATIBILITY=1 uv run maturin develop --features python
+    # maturin develop rebuilds and reinstalls every time; skip it when no
+    # build input changed since the last install and the module still imports
+    PYTHON_STAMP="target/.python-bindings.stamp"
+    if [[ -f "$PYTHON_STAMP" ]] \
+        && [[ -z "$(find src schemas templates build.rs Cargo.toml Cargo.lock pyproject.toml -newer "$PYTHON_STAMP" -print -quit)" ]] \
+        && uv run python -c "import shlesha" &> /dev/null; then
+        print_success "Python bindings up to date; skipped rebuild"
     else
-        uv run maturin develop --features python
+        if [[ "$RUST_SETUP" == "homebrew" ]]; then
+            PYO3_USE_ABI3_FORWARD_COMPATIBILITY=1 uv run maturin develop --features python
+        else
+            uv run maturin develop --features python
+        fi
+        mkdir -p target && touch "$PYTHON_STAMP"
+        print_success "Python bindings built and installed in uv environment"
     fi
-    print_success "Python bindings built and installed in uv environment"
 else
     print_error "uv environment not found. Run ./scripts/setup-dev.sh first"
     exit 1
@@ -29,6 +29,20 @@ else
     echo "✅ On main branch"
 fi
 
+# The Python and WASM builds don't depend on the Rust builds below or on each
+# other, so start them now in the background. Each gets its own target
+# directory so the builds don't queue on cargo's build-directory lock.
+mkdir -p target/release-check
+trap 'kill $(jobs -p) 2>/dev/null || true' EXIT
+echo ""
+echo "🐍📦 Starting Python and WASM builds in the background..."
+CARGO_TARGET_DIR=target/release-check/python \
+    maturin build --features python > target/release-check/python.log 2>&1 &
+PYTHON_BUILD_PID=$!
+CARGO_TARGET_DIR=target/release-check/wasm \
+    wasm-pack build --target web --out-dir pkg --features wasm > target/release-check/wasm.log 2>&1 &
+WASM_BUILD_PID=$!
+
 # Test Rust build
 echo ""
 echo "🦀 Testing Rust build..."
@@ -52,20 +66,22 @@ fi
 # Test Python build
 echo ""
 echo "🐍 Testing Python build..."
-if maturin build --features python; then
+if wait $PYTHON_BUILD_PID; then
     echo "✅ Python wheel build successful"
 else
     echo "⚠️ Python wheel build failed (this is expected on some systems)"
+    echo "   See target/release-check/python.log"
     echo "   Python builds will work in CI with proper Python linking"
 fi
 
 # Test WASM build
 echo ""
 echo "📦 Testing WASM build..."
-if wasm-pack build --target web --out-dir pkg --features wasm; then
+if wait $WASM_BUILD_PID; then
     echo "✅ WASM build successful"
 else
     echo "⚠️ WASM build failed (may need rustup setup)"
+    echo "   See target/release-check/wasm.log"
     echo "   WASM builds will work in CI with proper target installation"
 fi
 
@@ -23,7 +23,8 @@ cd docker/test-environments
 # Copy fresh wheels
 rm -rf wheels
 mkdir -p wheels
-cp ../../target/wheels/*.whl wheels/
+# Hard links where the filesystem allows, so the wheels aren't rewritten
+ln -f ../../target/wheels/*.whl wheels/ 2>/dev/null || cp ../../target/wheels/*.whl wheels/
 
 # Run the integration tests
 ./run_integration_tests.sh
@@ -3,10 +3,12 @@
 Simple integration test that can run anywhere to verify basic functionality
 """
 
+import argparse
 import sys
 import subprocess
 import tempfile
 import os
+from pathlib import Path
 
 def test_current_installation():
     """Test the currently installed version of shlesha"""
@@ -42,49 +44,88 @@ def test_current_installation():
         print(f"❌ Unexpected error: {e}")
         return False
 
-def test_fresh_installation():
-    """Test installing shlesha in a fresh environment"""
+# Reusable venvs for --reuse-venv, one per Python version and installer
+CACHED_VENV_DIR = Path.home() / '.cache' / 'shlesha-tests'
+
+def venv_python(venv_path):
+    """Path of the python executable inside a venv"""
+    if sys.platform == 'win32':
+        return os.path.join(venv_path, 'Scripts', 'python.exe')
+    return os.path.join(venv_path, 'bin', 'python')
+
+def create_venv(venv_path, use_uv=False):
+    """Create a venv, with uv when requested (much faster than python -m venv)"""
+    if use_uv:
+        subprocess.run(['uv', 'venv', '--python', sys.executable, str(venv_path)],
+                       check=True, capture_output=True)
+    else:
+        subprocess.run([sys.executable, '-m', 'venv', str(venv_path)], check=True)
+
+def install_shlesha(python_exe, use_uv=False):
+    """Install (or upgrade to) the latest published shlesha without cached downloads"""
+    if use_uv:
+        cmd = ['uv', 'pip', 'install', '--python', python_exe, '--no-cache', '--upgrade', 'shlesha']
+    else:
+        cmd = [python_exe, '-m', 'pip', 'install', '--upgrade', 'shlesha', '--no-cache-dir']
+    subprocess.run(cmd, check=True, capture_output=True)
+
+def test_fresh_installation(reuse_venv=False, use_uv=False):
+    """Test installing shlesha in a fresh environment
+
+    With reuse_venv, the venv under ~/.cache/shlesha-tests is created on the
+    first run and kept; later runs only upgrade shlesha inside it.
+    """
     print("\n🔄 Testing fresh installation...")
     
+    if reuse_venv:
+        installer = 'uv' if use_uv else 'pip'
+        venv_path = CACHED_VENV_DIR / f'venv-py{sys.version_info.major}.{sys.version_info.minor}-{installer}'
+        if not os.path.exists(venv_python(venv_path)):
+            create_venv(venv_path, use_uv)
+        else:
+            print(f"♻️  Reusing {venv_path}")
+        return check_installation(venv_path, use_uv)
+    
     with tempfile.TemporaryDirectory() as temp_dir:
         venv_path = os.path.join(temp_dir, 'test_venv')
-        
-        # Create virtual environment
-        subprocess.run([sys.executable, '-m', 'venv', venv_path], check=True)
-        
-        # Get python executable in venv
-        if sys.platform == 'win32':
-            python_exe = os.path.join(venv_path, 'Scripts', 'python.exe')
-        else:
-            python_exe = os.path.join(venv_path, 'bin', 'python')
-            
-        # Install shlesha
-        subprocess.run([python_exe, '-m', 'pip', 'install', 'shlesha', '--no-cache-dir'], 
-                      check=True, capture_output=True)
-        
-        # Test in fresh environment
-        test_script = '''
+        create_venv(venv_path, use_uv)
+        return check_installation(venv_path, use_uv)
+
+def check_installation(venv_path, use_uv=False):
+    """Install shlesha into the venv and run a transliteration with it"""
+    python_exe = venv_python(venv_path)
+    install_shlesha(python_exe, use_uv)
+    
+    # Test in fresh environment
+    test_script = '''
 import shlesha
 result = shlesha.transliterate("धर्म", "devanagari", "iast")
 print(f"Fresh install test: {result}")
 assert result == "dharma", f"Expected dharma, got {result}"
 print("✅ Fresh installation test passed")
 '''
-        
-        result = subprocess.run([python_exe, '-c', test_script], 
-                              capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("✅ Fresh installation test passed")
-            print(result.stdout.strip())
-            return True
-        else:
-            print("❌ Fresh installation test failed")
-            print(f"stdout: {result.stdout}")
-            print(f"stderr: {result.stderr}")
-            return False
+    
+    result = subprocess.run([python_exe, '-c', test_script], 
+                          capture_output=True, text=True)
+    
+    if result.returncode == 0:
+        print("✅ Fresh installation test passed")
+        print(result.stdout.strip())
+        return True
+    else:
+        print("❌ Fresh installation test failed")
+        print(f"stdout: {result.stdout}")
+        print(f"stderr: {result.stderr}")
+        return False
 
 def main():
+    parser = argparse.ArgumentParser(description="Simple shlesha integration test")
+    parser.add_argument('--reuse-venv', action='store_true',
+                        help=f"keep the install-test venv under {CACHED_VENV_DIR} between runs")
+    parser.add_argument('--use-uv', action='store_true',
+                        help="create the venv and install with uv instead of venv + pip")
+    args = parser.parse_args()
+    
     print("🚀 Shlesha Simple Integration Test")
     print("================================")
     print(f"Python: {sys.version}")
@@ -98,7 +139,7 @@ def main():
         tests_passed += 1
     
     # Test 2: Fresh installation
-    if test_fresh_installation():
+    if test_fresh_installation(args.reuse_venv, args.use_uv):
         tests_passed += 1
     
     print(f"\n📊 Results: {tests_passed}/{total_tests} tests passed")
@@ -25,14 +25,74 @@ enum Commands {
         /// Target script (e.g., devanagari, iso)
         #[arg(short, long)]
         to: String,
-        /// Text to transliterate (or read from stdin if not provided)
+        /// Text to transliterate (read from stdin if not provided or "-")
         text: Option<String>,
         /// Show detailed metadata breakdown
         #[arg(short, long)]
         verbose: bool,
+        /// Transliterate each stdin line separately, streaming one output line per input line
+        #[arg(long, conflicts_with_all = ["text", "verbose"])]
+        lines: bool,
     },
     /// List supported scripts
     Scripts,
+    /// Answer JSON-lines requests on stdin until EOF, from one long-lived process
+    Serve,
+}
+
+/// One `serve` request line: {"from": ..., "to": ..., "text": ...}
+#[derive(serde::Deserialize)]
+struct ServeRequest {
+    from: String,
+    to: String,
+    text: String,
+}
+
+/// Reply to each request line with one flushed JSON line, {"output": ...} or
+/// {"error": ...}, so a client can keep the process open and pay start-up once
+fn serve(transliterator: &Shlesha) {
+    use std::io::{BufRead, Write};
+
+    let stdin = std::io::stdin();
+    let mut out = std::io::stdout().lock();
+    for line in stdin.lock().lines() {
+        let line = line.expect("Failed to read from stdin");
+        if line.trim().is_empty() {
+            continue;
+        }
+        let response = match serde_json::from_str::<ServeRequest>(&line) {
+            Ok(request) => {
+                match transliterator.transliterate(&request.text, &request.from, &request.to) {
+                    Ok(output) => serde_json::json!({ "output": output }),
+                    Err(e) => serde_json::json!({ "error": e.to_string() }),
+                }
+            }
+            Err(e) => serde_json::json!({ "error": format!("Invalid request: {e}") }),
+        };
+        writeln!(out, "{response}").expect("Failed to write to stdout");
+        out.flush().expect("Failed to write to stdout");
+    }
+}
+
+/// Convert stdin line by line in this one process, so a batch of strings
+/// costs a single start-up instead of one process per string
+fn transliterate_lines(transliterator: &Shlesha, from: &str, to: &str) {
+    use std::io::{BufRead, BufWriter, Write};
+
+    let stdin = std::io::stdin();
+    let mut out = BufWriter::new(std::io::stdout().lock());
+    for line in stdin.lock().lines() {
+        let line = line.expect("Failed to read from stdin");
+        match transliterator.transliterate(&line, from, to) {
+            Ok(result) => writeln!(out, "{result}").expect("Failed to write to stdout"),
+            Err(e) => {
+                let _ = out.flush();
+                eprintln!("Error: {e}");
+                std::process::exit(1);
+            }
+        }
+    }
+    out.flush().expect("Failed to write to stdout");
 }
 
 fn main() {
@@ -45,17 +105,26 @@ fn main() {
             to,
             text,
             verbose,
+            lines,
         } => {
+            if lines {
+                transliterate_lines(&transliterator, &from, &to);
+                return;
+            }
+
             // Get input text
             let input = match text {
-                Some(t) => t,
-                None => {
+                Some(t) if t != "-" => t,
+                _ => {
                     use std::io::Read;
                     let mut buffer = String::new();
                     std::io::stdin()
                         .read_to_string(&mut buffer)
                         .expect("Failed to read from stdin");
-                    buffer.trim().to_string()
+                    // Trim in place rather than copying large inputs
+                    buffer.truncate(buffer.trim_end().len());
+                    buffer.drain(..buffer.len() - buffer.trim_start().len());
+                    buffer
                 }
             };
 
@@ -105,6 +174,8 @@ fn main() {
             }
         }
 
+        Commands::Serve => serve(&transliterator),
+
         Commands::DebugTest => {
             let transliterator = Shlesha::new();
 
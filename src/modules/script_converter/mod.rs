@@ -244,6 +244,15 @@ impl TokenConverterRegistry {
     }
 }
 
+/// Case-insensitive check for the Devanagari hub script name or its alias
+///
+/// Compares in place instead of lowercasing, since this runs on every
+/// support/capability query.
+#[inline]
+fn is_hub_script_name(script: &str) -> bool {
+    script.eq_ignore_ascii_case("devanagari") || script.eq_ignore_ascii_case("deva")
+}
+
 /// Registry for script converters
 pub struct ScriptConverterRegistry {
     converters: Vec<Box<dyn ScriptConverter>>,
@@ -576,7 +585,7 @@ impl ScriptConverterRegistry {
         schema_registry: Option<&crate::modules::registry::SchemaRegistry>,
     ) -> bool {
         // Special case: Devanagari is always supported (hub format)
-        if script.to_lowercase() == "devanagari" || script.to_lowercase() == "deva" {
+        if is_hub_script_name(script) {
             return true;
         }
 
@@ -667,7 +676,7 @@ impl ScriptConverterRegistry {
     /// Check if a converter supports bidirectional conversion for a specific script
     pub fn supports_reverse_conversion(&self, script: &str) -> bool {
         // Special case: Devanagari always supports reverse conversion (hub format)
-        if script.to_lowercase() == "devanagari" || script.to_lowercase() == "deva" {
+        if is_hub_script_name(script) {
             return true;
         }
 
@@ -685,7 +694,7 @@ impl ScriptConverterRegistry {
     /// Check if a script has implicit 'a' vowel in consonants
     pub fn script_has_implicit_a(&self, script: &str) -> bool {
         // Special case: Devanagari always has implicit 'a' vowels
-        if script.to_lowercase() == "devanagari" || script.to_lowercase() == "deva" {
+        if is_hub_script_name(script) {
             return true;
         }
 
@@ -764,7 +773,7 @@ impl ScriptConverterRegistry {
     /// Get information about whether a script has implicit vowels
     pub fn script_has_implicit_vowels(&self, script: &str) -> Result<bool, ConverterError> {
         // Special case: Devanagari (hub format) always has implicit 'a' vowels
-        if script.to_lowercase() == "devanagari" || script.to_lowercase() == "deva" {
+        if is_hub_script_name(script) {
             return Ok(true);
         }
 
@@ -1,7 +1,9 @@
 use super::ConverterError;
 use aho_corasick::AhoCorasick;
 use rustc_hash::FxHashMap;
+use std::borrow::Borrow;
 use std::collections::HashMap;
+use std::hash::Hash;
 
 /// Helper to build optimized mapping structures for fast lookup
 pub struct FastMappingBuilder;
@@ -86,11 +88,18 @@ impl RomanScriptProcessor {
 
     /// Optimized version using FxHashMap for better performance
     /// This is used internally by schema-generated converters
+    ///
+    /// Keys and values may be borrowed (`&str`) or owned (`String`), so prebuilt
+    /// tables that own their strings can be reused across calls.
     #[inline]
-    pub fn process_with_fx_hashmap(
+    pub fn process_with_fx_hashmap<K, V>(
         input: &str,
-        mapping: &FxHashMap<&str, &str>,
-    ) -> Result<String, ConverterError> {
+        mapping: &FxHashMap<K, V>,
+    ) -> Result<String, ConverterError>
+    where
+        K: Borrow<str> + Hash + Eq,
+        V: AsRef<str>,
+    {
         let mut result = String::with_capacity(input.len() * 2); // Pre-allocate for worst case
         let mut chars = input.char_indices();
 
@@ -126,8 +135,8 @@ impl RomanScriptProcessor {
                         &remaining[..remaining.chars().next().unwrap().len_utf8()]
                     };
 
-                    if let Some(&mapped_str) = mapping.get(seq) {
-                        result.push_str(mapped_str);
+                    if let Some(mapped_str) = mapping.get(seq) {
+                        result.push_str(mapped_str.as_ref());
                         // Skip the matched characters (len - 1 because we already have the first one)
                         for _ in 1..len {
                             chars.next();
@@ -149,11 +158,16 @@ impl RomanScriptProcessor {
 
     /// High-performance version with first-character indexing for maximum speed
     #[inline]
-    pub fn process_with_fast_lookup(
+    pub fn process_with_fast_lookup<K, V, C>(
         input: &str,
-        mapping: &FxHashMap<&str, &str>,
-        by_first_char: &FxHashMap<char, Vec<&str>>,
-    ) -> Result<String, ConverterError> {
+        mapping: &FxHashMap<K, V>,
+        by_first_char: &FxHashMap<char, Vec<C>>,
+    ) -> Result<String, ConverterError>
+    where
+        K: Borrow<str> + Hash + Eq,
+        V: AsRef<str>,
+        C: AsRef<str>,
+    {
         let mut result = String::with_capacity(input.len() * 2); // Pre-allocate for worst case
         let mut i = 0;
         let input_bytes = input.as_bytes();
@@ -173,7 +187,8 @@ impl RomanScriptProcessor {
             // Use first-character indexing for O(1) prefix lookup (Vidyut technique)
             if let Some(candidates) = by_first_char.get(&ch) {
                 // Candidates are pre-sorted by length descending for greedy longest match
-                for &candidate in candidates.iter() {
+                for candidate in candidates.iter() {
+                    let candidate = candidate.as_ref();
                     let candidate_len = candidate.len();
 
                     // Check if we have enough characters remaining
@@ -181,8 +196,8 @@ impl RomanScriptProcessor {
                         // Direct byte slice comparison - no allocations!
                         if let Ok(slice) = std::str::from_utf8(&input_bytes[i..i + candidate_len]) {
                             if slice == candidate {
-                                if let Some(&mapped_str) = mapping.get(candidate) {
-                                    result.push_str(mapped_str);
+                                if let Some(mapped_str) = mapping.get(candidate) {
+                                    result.push_str(mapped_str.as_ref());
                                     i += candidate_len;
                                     matched = true;
                                     break;
@@ -196,8 +211,8 @@ impl RomanScriptProcessor {
             if !matched {
                 // Single character fallback - check if it's in mapping
                 let ch_str = std::str::from_utf8(&input_bytes[i..i + 1]).unwrap_or("");
-                if let Some(&mapped_str) = mapping.get(ch_str) {
-                    result.push_str(mapped_str);
+                if let Some(mapped_str) = mapping.get(ch_str) {
+                    result.push_str(mapped_str.as_ref());
                 } else {
                     // Character not found in mapping - preserve as-is
                     result.push(ch);
@@ -212,10 +227,10 @@ impl RomanScriptProcessor {
     /// Ultra-high-performance version using Aho-Corasick automaton for pattern matching
     /// This provides the fastest possible longest-match transliteration
     #[inline]
-    pub fn process_with_aho_corasick(
+    pub fn process_with_aho_corasick<R: AsRef<str>>(
         input: &str,
         ac: &AhoCorasick,
-        replacements: &[&str],
+        replacements: &[R],
     ) -> Result<String, ConverterError> {
         let mut result = String::with_capacity(input.len() * 2);
         let mut last_end = 0;
@@ -232,7 +247,7 @@ impl RomanScriptProcessor {
             }
 
             // Add the replacement text
-            result.push_str(replacements[pattern_id]);
+            result.push_str(replacements[pattern_id].as_ref());
             last_end = match_end;
         }
 
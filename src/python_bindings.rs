@@ -6,19 +6,55 @@
 //! - Script discovery and validation
 //! - Runtime schema loading
 
+use aho_corasick::AhoCorasick;
 use once_cell::sync::Lazy;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use rustc_hash::FxHashMap;
 use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
+use std::hint::black_box;
+use std::sync::{Arc, RwLock};
+use std::time::Instant;
 
+use crate::modules::script_converter::processors::{FastMappingBuilder, RomanScriptProcessor};
 use crate::Shlesha;
 
 // Global transliterator instance for convenience function
 static GLOBAL_TRANSLITERATOR: Lazy<Shlesha> = Lazy::new(Shlesha::new);
 
+// Scripts supported by the global transliterator; it never loads runtime
+// schemas, so the list is fixed after first use
+static GLOBAL_SUPPORTED_SCRIPTS: Lazy<Vec<String>> = Lazy::new(|| {
+    GLOBAL_TRANSLITERATOR
+        .list_supported_scripts()
+        .into_iter()
+        .map(|s| s.to_string())
+        .collect()
+});
+
+// Results of `transliterate_cached`, keyed by a hash of (from, to, text).
+// Entries keep their inputs so a hash collision is recomputed, not returned.
+const TRANSLITERATION_CACHE_CAPACITY: usize = 4096;
+
+type TransliterationCache = RwLock<FxHashMap<u64, CachedTransliteration>>;
+
+struct CachedTransliteration {
+    from_script: String,
+    to_script: String,
+    text: String,
+    output: Arc<str>,
+}
+
+static TRANSLITERATION_CACHE: Lazy<TransliterationCache> =
+    Lazy::new(|| RwLock::new(FxHashMap::default()));
+
 /// Python wrapper for the Shlesha transliterator
-#[pyclass(unsendable)]
+#[pyclass]
 pub struct PyShlesha {
     inner: Shlesha,
+    // Per instance, since runtime schemas change what a script name means
+    cache: TransliterationCache,
 }
 
 /// Python wrapper for transliteration metadata
@@ -60,6 +96,156 @@ pub struct PyTransliterationResult {
     metadata: Option<PyTransliterationMetadata>,
 }
 
+/// Transliterator bound to one script pair, created by `Shlesha.compile` or
+/// constructed directly with its own default transliterator
+///
+/// Script names are validated once when the converter is built, and each call
+/// passes only the text across the Python/Rust boundary.
+#[pyclass]
+pub struct PyConverter {
+    transliterator: Py<PyShlesha>,
+    #[pyo3(get)]
+    from_script: String,
+    #[pyo3(get)]
+    to_script: String,
+}
+
+/// Prebuilt mapping processor for performance testing
+///
+/// Builds the lookup structures for one processor type once, so repeated
+/// calls measure only the matching work and not table construction.
+#[pyclass]
+pub struct PyMappingProcessor {
+    processor_type: String,
+    tables: MappingTables,
+}
+
+/// Mapping table given either as a dict or as (from, to) pairs; the
+/// processors sort patterns longest first themselves, so order is not needed
+#[derive(FromPyObject)]
+enum MappingPairs {
+    Dict(HashMap<String, String>),
+    Pairs(Vec<(String, String)>),
+}
+
+impl MappingPairs {
+    fn into_vec(self) -> Vec<(String, String)> {
+        match self {
+            Self::Dict(mappings) => mappings.into_iter().collect(),
+            Self::Pairs(pairs) => pairs,
+        }
+    }
+}
+
+/// Mappings accepted by `benchmark_processor`: a prebuilt processor, or a
+/// mapping table to build one from on every call
+#[derive(FromPyObject)]
+enum ProcessorMappings<'py> {
+    Prepared(PyRef<'py, PyMappingProcessor>),
+    Table(MappingPairs),
+}
+
+/// Lookup structures owned by a `PyMappingProcessor`
+enum MappingTables {
+    FxHashMap(FxHashMap<String, String>),
+    AhoCorasick {
+        ac: AhoCorasick,
+        replacements: Vec<String>,
+    },
+    FastLookup {
+        mapping: FxHashMap<String, String>,
+        by_first_char: FxHashMap<char, Vec<String>>,
+    },
+}
+
+impl MappingTables {
+    fn build(processor_type: &str, mappings: &[(String, String)]) -> PyResult<Self> {
+        let mappings_vec: Vec<(&str, &str)> = mappings
+            .iter()
+            .map(|(k, v)| (k.as_str(), v.as_str()))
+            .collect();
+
+        match processor_type {
+            "fx_hashmap" => Ok(Self::FxHashMap(
+                mappings
+                    .iter()
+                    .map(|(k, v)| (k.clone(), v.clone()))
+                    .collect(),
+            )),
+            "aho_corasick" => {
+                let (ac, replacements) =
+                    FastMappingBuilder::build_aho_corasick_mapping(&mappings_vec).map_err(|e| {
+                        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+                            "Failed to build Aho-Corasick automaton: {e}"
+                        ))
+                    })?;
+
+                Ok(Self::AhoCorasick {
+                    ac,
+                    replacements: replacements.into_iter().map(str::to_string).collect(),
+                })
+            }
+            "fast_lookup" => {
+                let (mapping, by_first_char) =
+                    FastMappingBuilder::build_optimized_mapping(&mappings_vec);
+
+                Ok(Self::FastLookup {
+                    mapping: mapping
+                        .into_iter()
+                        .map(|(k, v)| (k.to_string(), v.to_string()))
+                        .collect(),
+                    by_first_char: by_first_char
+                        .into_iter()
+                        .map(|(ch, candidates)| {
+                            (ch, candidates.into_iter().map(str::to_string).collect())
+                        })
+                        .collect(),
+                })
+            }
+            _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                format!("Unknown processor type: {processor_type}. Use 'fx_hashmap', 'aho_corasick', or 'fast_lookup'")
+            )),
+        }
+    }
+
+    fn process(&self, text: &str) -> PyResult<String> {
+        let result = match self {
+            Self::FxHashMap(mapping) => {
+                RomanScriptProcessor::process_with_fx_hashmap(text, mapping)
+            }
+            Self::AhoCorasick { ac, replacements } => {
+                RomanScriptProcessor::process_with_aho_corasick(text, ac, replacements)
+            }
+            Self::FastLookup {
+                mapping,
+                by_first_char,
+            } => RomanScriptProcessor::process_with_fast_lookup(text, mapping, by_first_char),
+        };
+
+        result.map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Processor failed: {e}"))
+        })
+    }
+
+    /// Run `process` back to back and return the achieved calls per second
+    fn ops_per_sec(&self, text: &str, iterations: usize) -> PyResult<f64> {
+        let start = Instant::now();
+        for _ in 0..iterations {
+            black_box(self.process(black_box(text))?);
+        }
+        Ok(iterations as f64 / start.elapsed().as_secs_f64())
+    }
+}
+
+impl PyShlesha {
+    /// Drop cached results before the set of scripts changes
+    fn clear_cache(&mut self) {
+        if let Ok(cache) = self.cache.get_mut() {
+            cache.clear();
+        }
+    }
+}
+
 #[pymethods]
 impl PyShlesha {
     /// Create a new Shlesha transliterator instance
@@ -67,6 +253,7 @@ impl PyShlesha {
     fn new() -> Self {
         Self {
             inner: Shlesha::new(),
+            cache: RwLock::new(FxHashMap::default()),
         }
     }
 
@@ -87,14 +274,182 @@ impl PyShlesha {
     ///     >>> transliterator = Shlesha()
     ///     >>> result = transliterator.transliterate("धर्म", "devanagari", "iast")
     ///     >>> print(result)  # "dharma"
-    fn transliterate(&self, text: &str, from_script: &str, to_script: &str) -> PyResult<String> {
-        self.inner
-            .transliterate(text, from_script, to_script)
-            .map_err(|e| {
-                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                    "Transliteration failed: {e}"
-                ))
-            })
+    fn transliterate(
+        &self,
+        py: Python<'_>,
+        text: &str,
+        from_script: &str,
+        to_script: &str,
+    ) -> PyResult<String> {
+        let inner = &self.inner;
+        py.allow_threads(|| transliterate_text(inner, text, from_script, to_script))
+    }
+
+    /// Transliterate text, reusing the result of an earlier identical call
+    ///
+    /// Results are cached per instance, up to 4096 of them, and the cache is
+    /// cleared whenever runtime schemas change.
+    ///
+    /// Args:
+    ///     text (str): Text to transliterate
+    ///     from_script (str): Source script name
+    ///     to_script (str): Target script name
+    ///
+    /// Returns:
+    ///     str: Transliterated text
+    ///
+    /// Raises:
+    ///     RuntimeError: If transliteration fails
+    ///
+    /// Example:
+    ///     >>> transliterator = Shlesha()
+    ///     >>> transliterator.transliterate_cached("धर्म", "devanagari", "iast")
+    ///     'dharma'
+    fn transliterate_cached(
+        &self,
+        py: Python<'_>,
+        text: &str,
+        from_script: &str,
+        to_script: &str,
+    ) -> PyResult<String> {
+        let (inner, cache) = (&self.inner, &self.cache);
+        py.allow_threads(|| cached_transliteration(inner, cache, text, from_script, to_script))
+            .map(|output| output.to_string())
+    }
+
+    /// Transliterate a batch of texts from one script to another
+    ///
+    /// Converts every text in a single call so the per-call Python/Rust
+    /// boundary cost is paid once per batch rather than once per text.
+    ///
+    /// Args:
+    ///     texts (List[str]): Texts to transliterate
+    ///     from_script (str): Source script name
+    ///     to_script (str): Target script name
+    ///
+    /// Returns:
+    ///     List[str]: Transliterated texts, in input order
+    ///
+    /// Raises:
+    ///     RuntimeError: If transliteration of any text fails
+    ///
+    /// Example:
+    ///     >>> transliterator = Shlesha()
+    ///     >>> transliterator.transliterate_batch(["धर्म", "कर्म"], "devanagari", "iast")
+    ///     ['dharma', 'karma']
+    fn transliterate_batch(
+        &self,
+        py: Python<'_>,
+        texts: Vec<String>,
+        from_script: &str,
+        to_script: &str,
+    ) -> PyResult<Vec<String>> {
+        let inner = &self.inner;
+        py.allow_threads(|| transliterate_many(inner, &texts, from_script, to_script))
+    }
+
+    /// Transliterate one text for several script pairs in a single call
+    ///
+    /// Args:
+    ///     text (str): Text to transliterate
+    ///     pairs (List[Tuple[str, str]]): (from_script, to_script) pairs
+    ///
+    /// Returns:
+    ///     List[str]: One transliteration per pair, in pair order
+    ///
+    /// Raises:
+    ///     RuntimeError: If any of the conversions fails
+    ///
+    /// Example:
+    ///     >>> transliterator = Shlesha()
+    ///     >>> transliterator.transliterate_pairs("dharma", [("iast", "slp1"), ("iast", "devanagari")])
+    ///     ['Darma', 'धर्म']
+    fn transliterate_pairs(
+        &self,
+        py: Python<'_>,
+        text: &str,
+        pairs: Vec<(String, String)>,
+    ) -> PyResult<Vec<String>> {
+        let inner = &self.inner;
+        py.allow_threads(|| transliterate_for_pairs(inner, text, &pairs))
+    }
+
+    /// Bind this transliterator to one script pair
+    ///
+    /// Args:
+    ///     from_script (str): Source script name
+    ///     to_script (str): Target script name
+    ///
+    /// Returns:
+    ///     PyConverter: Callable taking only the text to transliterate
+    ///
+    /// Raises:
+    ///     ValueError: If either script is not supported
+    ///
+    /// Example:
+    ///     >>> transliterator = Shlesha()
+    ///     >>> to_iast = transliterator.compile("devanagari", "iast")
+    ///     >>> print(to_iast("धर्म"))  # "dharma"
+    fn compile(slf: PyRef<'_, Self>, from_script: &str, to_script: &str) -> PyResult<PyConverter> {
+        for script in [from_script, to_script] {
+            if !slf.inner.supports_script(script) {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                    "Unsupported script: {script}"
+                )));
+            }
+        }
+
+        Ok(PyConverter {
+            transliterator: slf.into(),
+            from_script: from_script.to_string(),
+            to_script: to_script.to_string(),
+        })
+    }
+
+    /// Time repeated transliteration without leaving Rust
+    ///
+    /// Runs `iterations` back-to-back conversions of the same text in one call,
+    /// so the measurement excludes the per-call Python/Rust boundary cost.
+    ///
+    /// Args:
+    ///     text (str): Text to transliterate
+    ///     from_script (str): Source script name
+    ///     to_script (str): Target script name
+    ///     iterations (int): Conversions to time
+    ///     with_metadata (bool): Time transliterate_with_metadata instead
+    ///
+    /// Returns:
+    ///     int: Total elapsed nanoseconds
+    ///
+    /// Raises:
+    ///     ValueError: If iterations is zero
+    ///     RuntimeError: If transliteration fails
+    ///
+    /// Example:
+    ///     >>> transliterator = Shlesha()
+    ///     >>> total_ns = transliterator.bench_transliterate("धर्म", "devanagari", "iast", 1000)
+    ///     >>> print(total_ns / 1000)  # nanoseconds per conversion
+    #[pyo3(signature = (text, from_script, to_script, iterations, with_metadata=false))]
+    fn bench_transliterate(
+        &self,
+        py: Python<'_>,
+        text: &str,
+        from_script: &str,
+        to_script: &str,
+        iterations: u64,
+        with_metadata: bool,
+    ) -> PyResult<u64> {
+        let inner = &self.inner;
+        py.allow_threads(|| {
+            time_transliterations(
+                inner,
+                text,
+                from_script,
+                to_script,
+                iterations,
+                with_metadata,
+            )
+        })
     }
 
     /// Transliterate text with metadata collection for unknown tokens
@@ -202,6 +557,7 @@ impl PyShlesha {
     ///     >>> transliterator = Shlesha()
     ///     >>> transliterator.load_schema_from_file("custom_script.yaml")
     fn load_schema_from_file(&mut self, file_path: &str) -> PyResult<()> {
+        self.clear_cache();
         self.inner.load_schema_from_file(file_path).map_err(|e| {
             PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Schema loading failed: {e}"))
         })
@@ -228,6 +584,7 @@ impl PyShlesha {
     ///     >>> transliterator = Shlesha()
     ///     >>> transliterator.load_schema_from_string(yaml_content, "custom")
     fn load_schema_from_string(&mut self, yaml_content: &str, schema_name: &str) -> PyResult<()> {
+        self.clear_cache();
         self.inner
             .load_schema_from_string(yaml_content, schema_name)
             .map_err(|e| {
@@ -273,6 +630,7 @@ impl PyShlesha {
     ///     >>> success = transliterator.remove_schema("custom")
     ///     >>> print(success)  # True if removed
     fn remove_schema(&mut self, script_name: &str) -> bool {
+        self.clear_cache();
         self.inner.remove_schema(script_name)
     }
 
@@ -281,6 +639,7 @@ impl PyShlesha {
     /// Example:
     ///     >>> transliterator.clear_runtime_schemas()
     fn clear_runtime_schemas(&mut self) {
+        self.clear_cache();
         self.inner.clear_runtime_schemas()
     }
 
@@ -337,66 +696,177 @@ impl PyShlesha {
     /// Args:
     ///     text (str): Text to process
     ///     processor_type (str): "fx_hashmap", "aho_corasick", or "fast_lookup"
-    ///     mappings (Dict[str, str]): Mapping dictionary for conversion
+    ///     mappings (Dict[str, str] | List[Tuple[str, str]] | PyMappingProcessor):
+    ///         Mapping dictionary or (from, to) pairs, or a processor from
+    ///         `prepare_mapping` so the lookup structures are not rebuilt on every call
     ///
     /// Returns:
     ///     str: Processed text
+    ///
+    /// Raises:
+    ///     ValueError: If a prepared processor was built for another processor type
     fn benchmark_processor(
         &self,
         text: &str,
         processor_type: &str,
-        mappings: HashMap<String, String>,
+        mappings: ProcessorMappings<'_>,
     ) -> PyResult<String> {
-        use crate::modules::script_converter::processors::{
-            FastMappingBuilder, RomanScriptProcessor,
-        };
-        use rustc_hash::FxHashMap;
+        match mappings {
+            ProcessorMappings::Prepared(processor) => {
+                if processor.processor_type != processor_type {
+                    return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                        "Processor was prepared as '{}', not '{processor_type}'",
+                        processor.processor_type
+                    )));
+                }
+                processor.tables.process(text)
+            }
+            ProcessorMappings::Table(mappings) => {
+                MappingTables::build(processor_type, &mappings.into_vec())?.process(text)
+            }
+        }
+    }
 
-        // Convert Python dict to appropriate format
-        let fx_mappings: FxHashMap<&str, &str> = mappings
-            .iter()
-            .map(|(k, v)| (k.as_str(), v.as_str()))
-            .collect();
+    /// Build the lookup structures for one processor type once
+    ///
+    /// Args:
+    ///     processor_type (str): "fx_hashmap", "aho_corasick", or "fast_lookup"
+    ///     mappings (Dict[str, str] | List[Tuple[str, str]]): Mapping dictionary or (from, to) pairs
+    ///
+    /// Returns:
+    ///     PyMappingProcessor: Reusable processor, also accepted by `benchmark_processor`
+    ///
+    /// Example:
+    ///     >>> prepared = transliterator.prepare_mapping("aho_corasick", [("kh", "K")])
+    ///     >>> transliterator.benchmark_processor("kha", "aho_corasick", prepared)
+    ///     'Ka'
+    fn prepare_mapping(
+        &self,
+        processor_type: &str,
+        mappings: MappingPairs,
+    ) -> PyResult<PyMappingProcessor> {
+        PyMappingProcessor::new(processor_type, mappings)
+    }
+}
 
-        let result = match processor_type {
-            "fx_hashmap" => RomanScriptProcessor::process_with_fx_hashmap(text, &fx_mappings),
-            "aho_corasick" => {
-                let mappings_vec: Vec<(&str, &str)> = mappings
-                    .iter()
-                    .map(|(k, v)| (k.as_str(), v.as_str()))
-                    .collect();
+#[pymethods]
+impl PyConverter {
+    /// Create a converter for one script pair with a default transliterator
+    ///
+    /// Args:
+    ///     from_script (str): Source script name
+    ///     to_script (str): Target script name
+    ///
+    /// Raises:
+    ///     ValueError: If either script is not supported
+    ///
+    /// Example:
+    ///     >>> to_iast = PyConverter("devanagari", "iast")
+    ///     >>> print(to_iast.convert("धर्म"))  # "dharma"
+    #[new]
+    fn new(py: Python<'_>, from_script: &str, to_script: &str) -> PyResult<Self> {
+        let transliterator = Py::new(py, PyShlesha::new())?;
+        PyShlesha::compile(transliterator.borrow(py), from_script, to_script)
+    }
 
-                let (ac, replacements) =
-                    FastMappingBuilder::build_aho_corasick_mapping(&mappings_vec).map_err(|e| {
-                        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                            "Failed to build Aho-Corasick automaton: {e}"
-                        ))
-                    })?;
+    /// Transliterate text between the bound scripts
+    ///
+    /// Args:
+    ///     text (str): Text to transliterate
+    ///
+    /// Returns:
+    ///     str: Transliterated text
+    ///
+    /// Raises:
+    ///     RuntimeError: If transliteration fails
+    fn convert(&self, py: Python<'_>, text: &str) -> PyResult<String> {
+        let transliterator = self.transliterator.borrow(py);
+        let inner = &transliterator.inner;
+        let (from_script, to_script) = (self.from_script.as_str(), self.to_script.as_str());
+        py.allow_threads(|| transliterate_text(inner, text, from_script, to_script))
+    }
 
-                RomanScriptProcessor::process_with_aho_corasick(text, &ac, &replacements)
-            }
-            "fast_lookup" => {
-                let mappings_vec: Vec<(&str, &str)> = mappings
-                    .iter()
-                    .map(|(k, v)| (k.as_str(), v.as_str()))
-                    .collect();
+    /// Transliterate a batch of texts between the bound scripts
+    ///
+    /// Args:
+    ///     texts (List[str]): Texts to transliterate
+    ///
+    /// Returns:
+    ///     List[str]: Transliterated texts, in input order
+    ///
+    /// Raises:
+    ///     RuntimeError: If transliteration of any text fails
+    fn convert_batch(&self, py: Python<'_>, texts: Vec<String>) -> PyResult<Vec<String>> {
+        let transliterator = self.transliterator.borrow(py);
+        let inner = &transliterator.inner;
+        let (from_script, to_script) = (self.from_script.as_str(), self.to_script.as_str());
+        py.allow_threads(|| transliterate_many(inner, &texts, from_script, to_script))
+    }
 
-                let (mapping, by_first_char) =
-                    FastMappingBuilder::build_optimized_mapping(&mappings_vec);
+    /// Same as `convert`, so a converter can be used as a plain function
+    fn __call__(&self, py: Python<'_>, text: &str) -> PyResult<String> {
+        self.convert(py, text)
+    }
 
-                RomanScriptProcessor::process_with_fast_lookup(text, &mapping, &by_first_char)
-            }
-            _ => {
-                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                    format!("Unknown processor type: {processor_type}. Use 'fx_hashmap', 'aho_corasick', or 'fast_lookup'")
-                ));
-            }
-        };
+    /// Python representation
+    fn __repr__(&self) -> String {
+        format!(
+            "Converter(from_script='{}', to_script='{}')",
+            self.from_script, self.to_script
+        )
+    }
+}
 
-        result.map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Processor failed: {e}"))
+#[pymethods]
+impl PyMappingProcessor {
+    /// Build a reusable processor from a mapping table
+    ///
+    /// Args:
+    ///     processor_type (str): "fx_hashmap", "aho_corasick", or "fast_lookup"
+    ///     mappings (Dict[str, str] | List[Tuple[str, str]]): Mapping dictionary or (from, to) pairs
+    ///
+    /// Raises:
+    ///     ValueError: If the processor type is unknown
+    ///     RuntimeError: If the lookup structures cannot be built
+    ///
+    /// Example:
+    ///     >>> processor = PyMappingProcessor("aho_corasick", [("kh", "K"), ("ā", "A")])
+    ///     >>> print(processor.transliterate("khā"))  # "KA"
+    #[new]
+    fn new(processor_type: &str, mappings: MappingPairs) -> PyResult<Self> {
+        Ok(Self {
+            processor_type: processor_type.to_string(),
+            tables: MappingTables::build(processor_type, &mappings.into_vec())?,
         })
     }
+
+    /// Process text with the prebuilt lookup structures
+    ///
+    /// Args:
+    ///     text (str): Text to process
+    ///
+    /// Returns:
+    ///     str: Processed text
+    fn transliterate(&self, text: &str) -> PyResult<String> {
+        self.tables.process(text)
+    }
+
+    /// Process a batch of texts with the prebuilt lookup structures
+    ///
+    /// Args:
+    ///     texts (List[str]): Texts to process
+    ///
+    /// Returns:
+    ///     List[str]: Processed texts, in input order
+    fn transliterate_batch(&self, py: Python<'_>, texts: Vec<String>) -> PyResult<Vec<String>> {
+        let tables = &self.tables;
+        py.allow_threads(|| texts.iter().map(|text| tables.process(text)).collect())
+    }
+
+    /// Python representation
+    fn __repr__(&self) -> String {
+        format!("MappingProcessor(type='{}')", self.processor_type)
+    }
 }
 
 #[pymethods]
@@ -466,8 +936,261 @@ fn create_transliterator() -> PyShlesha {
 ///     >>> result = transliterate("धर्म", "devanagari", "iast")
 ///     >>> print(result)  # "dharma"
 #[pyfunction]
-fn transliterate(text: &str, from_script: &str, to_script: &str) -> PyResult<String> {
-    GLOBAL_TRANSLITERATOR
+fn transliterate(
+    py: Python<'_>,
+    text: &str,
+    from_script: &str,
+    to_script: &str,
+) -> PyResult<String> {
+    // Same-script conversion returns the input unchanged; skip the
+    // optimization cache and the GIL release for it
+    if from_script == to_script {
+        return Ok(text.to_string());
+    }
+    py.allow_threads(|| transliterate_text(&GLOBAL_TRANSLITERATOR, text, from_script, to_script))
+}
+
+/// Convenience function for transliteration through a result cache
+///
+/// Repeated (text, from_script, to_script) inputs return the stored result
+/// without converting again, so timing this measures cached throughput.
+/// The cache holds up to 4096 results and is cleared when full.
+///
+/// Args:
+///     text (str): Text to transliterate
+///     from_script (str): Source script name
+///     to_script (str): Target script name
+///
+/// Returns:
+///     str: Transliterated text
+///
+/// Example:
+///     >>> from shlesha import transliterate_cached
+///     >>> transliterate_cached("धर्म", "devanagari", "iast")
+///     'dharma'
+#[pyfunction]
+fn transliterate_cached(
+    py: Python<'_>,
+    text: &str,
+    from_script: &str,
+    to_script: &str,
+) -> PyResult<String> {
+    py.allow_threads(|| {
+        cached_transliteration(
+            &GLOBAL_TRANSLITERATOR,
+            &TRANSLITERATION_CACHE,
+            text,
+            from_script,
+            to_script,
+        )
+    })
+    .map(|output| output.to_string())
+}
+
+/// Convenience function for batch transliteration
+///
+/// Args:
+///     texts (List[str]): Texts to transliterate
+///     from_script (str): Source script name
+///     to_script (str): Target script name
+///
+/// Returns:
+///     List[str]: Transliterated texts, in input order
+///
+/// Example:
+///     >>> from shlesha import transliterate_batch
+///     >>> transliterate_batch(["धर्म", "कर्म"], "devanagari", "iast")
+///     ['dharma', 'karma']
+#[pyfunction(name = "transliterate_batch")]
+fn transliterate_batch_fn(
+    py: Python<'_>,
+    texts: Vec<String>,
+    from_script: &str,
+    to_script: &str,
+) -> PyResult<Vec<String>> {
+    // Same-script conversion returns the inputs unchanged
+    if from_script == to_script {
+        return Ok(texts);
+    }
+    py.allow_threads(|| transliterate_many(&GLOBAL_TRANSLITERATOR, &texts, from_script, to_script))
+}
+
+/// Convenience function for converting one text for several script pairs
+///
+/// Args:
+///     text (str): Text to transliterate
+///     pairs (List[Tuple[str, str]]): (from_script, to_script) pairs
+///
+/// Returns:
+///     List[str]: One transliteration per pair, in pair order
+///
+/// Example:
+///     >>> from shlesha import transliterate_pairs
+///     >>> transliterate_pairs("dharma", [("iast", "slp1"), ("iast", "devanagari")])
+///     ['Darma', 'धर्म']
+#[pyfunction(name = "transliterate_pairs")]
+fn transliterate_pairs_fn(
+    py: Python<'_>,
+    text: &str,
+    pairs: Vec<(String, String)>,
+) -> PyResult<Vec<String>> {
+    py.allow_threads(|| transliterate_for_pairs(&GLOBAL_TRANSLITERATOR, text, &pairs))
+}
+
+/// Convenience function for timing repeated transliteration without leaving Rust
+///
+/// Args:
+///     text (str): Text to transliterate
+///     from_script (str): Source script name
+///     to_script (str): Target script name
+///     iterations (int): Conversions to time
+///
+/// Returns:
+///     int: Total elapsed nanoseconds
+///
+/// Example:
+///     >>> from shlesha import bench_transliterate
+///     >>> total_ns = bench_transliterate("धर्म", "devanagari", "iast", 1000)
+#[pyfunction]
+fn bench_transliterate(
+    py: Python<'_>,
+    text: &str,
+    from_script: &str,
+    to_script: &str,
+    iterations: u64,
+) -> PyResult<u64> {
+    py.allow_threads(|| {
+        time_transliterations(
+            &GLOBAL_TRANSLITERATOR,
+            text,
+            from_script,
+            to_script,
+            iterations,
+            false,
+        )
+    })
+}
+
+/// Convenience function for transliterating UTF-8 encoded bytes
+///
+/// Intended for ASCII-only inputs (e.g. SLP1, Harvard-Kyoto, ITRANS) that the
+/// caller already holds as bytes, so no Python str is decoded or created.
+///
+/// Args:
+///     data (bytes): UTF-8 encoded text to transliterate
+///     from_script (str): Source script name
+///     to_script (str): Target script name
+///
+/// Returns:
+///     bytes: UTF-8 encoded transliterated text
+///
+/// Raises:
+///     ValueError: If data is not valid UTF-8
+///     RuntimeError: If transliteration fails
+///
+/// Example:
+///     >>> from shlesha import transliterate_bytes
+///     >>> transliterate_bytes(b"Darma", "slp1", "iast")
+///     b'dharma'
+#[pyfunction]
+fn transliterate_bytes<'py>(
+    py: Python<'py>,
+    data: &[u8],
+    from_script: &str,
+    to_script: &str,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let text = std::str::from_utf8(data).map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Input is not valid UTF-8: {e}"))
+    })?;
+    let output = transliterate_text(&GLOBAL_TRANSLITERATOR, text, from_script, to_script)?;
+    Ok(PyBytes::new(py, output.as_bytes()))
+}
+
+/// Time every mapping processor over every text without leaving Rust
+///
+/// Builds each processor once, then times `iterations` back-to-back calls per
+/// text, so the measurement excludes per-call Python/Rust boundary overhead.
+///
+/// Args:
+///     texts (List[str]): Texts to process
+///     processor_types (List[str]): Any of "fx_hashmap", "aho_corasick", "fast_lookup"
+///     mappings (Dict[str, str] | List[Tuple[str, str]]): Mapping dictionary or (from, to) pairs
+///     iterations (int): Calls to time per text and processor
+///
+/// Returns:
+///     List[List[float]]: Ops/sec, one row per text and one column per processor type
+///
+/// Raises:
+///     ValueError: If iterations is zero or a processor type is unknown
+///     RuntimeError: If a processor fails
+#[pyfunction]
+fn run_processor_matrix(
+    py: Python<'_>,
+    texts: Vec<String>,
+    processor_types: Vec<String>,
+    mappings: MappingPairs,
+    iterations: usize,
+) -> PyResult<Vec<Vec<f64>>> {
+    if iterations == 0 {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "iterations must be at least 1",
+        ));
+    }
+
+    let mappings = mappings.into_vec();
+    let tables = processor_types
+        .iter()
+        .map(|processor_type| MappingTables::build(processor_type, &mappings))
+        .collect::<PyResult<Vec<_>>>()?;
+
+    py.allow_threads(|| {
+        texts
+            .iter()
+            .map(|text| {
+                tables
+                    .iter()
+                    .map(|table| table.ops_per_sec(text, iterations))
+                    .collect()
+            })
+            .collect()
+    })
+}
+
+/// Transliterate every text with one transliterator, stopping at the first failure
+fn transliterate_many(
+    transliterator: &Shlesha,
+    texts: &[String],
+    from_script: &str,
+    to_script: &str,
+) -> PyResult<Vec<String>> {
+    texts
+        .iter()
+        .map(|text| transliterate_text(transliterator, text, from_script, to_script))
+        .collect()
+}
+
+/// Transliterate one text for each (from, to) pair, in pair order
+fn transliterate_for_pairs(
+    transliterator: &Shlesha,
+    text: &str,
+    pairs: &[(String, String)],
+) -> PyResult<Vec<String>> {
+    pairs
+        .iter()
+        .map(|(from_script, to_script)| {
+            transliterate_text(transliterator, text, from_script, to_script)
+        })
+        .collect()
+}
+
+/// Transliterate one text, mapping failures to `RuntimeError`
+fn transliterate_text(
+    transliterator: &Shlesha,
+    text: &str,
+    from_script: &str,
+    to_script: &str,
+) -> PyResult<String> {
+    transliterator
         .transliterate(text, from_script, to_script)
         .map_err(|e| {
             PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
@@ -476,6 +1199,86 @@ fn transliterate(text: &str, from_script: &str, to_script: &str) -> PyResult<Str
         })
 }
 
+/// Convert with `transliterator`, reusing a result from `cache` when the same
+/// (from, to, text) was converted before
+fn cached_transliteration(
+    transliterator: &Shlesha,
+    cache: &TransliterationCache,
+    text: &str,
+    from_script: &str,
+    to_script: &str,
+) -> PyResult<Arc<str>> {
+    let mut hasher = rustc_hash::FxHasher::default();
+    (from_script, to_script, text).hash(&mut hasher);
+    let key = hasher.finish();
+
+    if let Ok(entries) = cache.read() {
+        if let Some(entry) = entries.get(&key) {
+            if entry.text == text
+                && entry.from_script == from_script
+                && entry.to_script == to_script
+            {
+                return Ok(Arc::clone(&entry.output));
+            }
+        }
+    }
+
+    let output: Arc<str> = transliterate_text(transliterator, text, from_script, to_script)?.into();
+    if let Ok(mut entries) = cache.write() {
+        if entries.len() >= TRANSLITERATION_CACHE_CAPACITY {
+            entries.clear();
+        }
+        entries.insert(
+            key,
+            CachedTransliteration {
+                from_script: from_script.to_string(),
+                to_script: to_script.to_string(),
+                text: text.to_string(),
+                output: Arc::clone(&output),
+            },
+        );
+    }
+    Ok(output)
+}
+
+/// Time `iterations` back-to-back conversions and return the elapsed nanoseconds
+fn time_transliterations(
+    transliterator: &Shlesha,
+    text: &str,
+    from_script: &str,
+    to_script: &str,
+    iterations: u64,
+    with_metadata: bool,
+) -> PyResult<u64> {
+    if iterations == 0 {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "iterations must be at least 1",
+        ));
+    }
+
+    let to_py_err = |e: Box<dyn std::error::Error>| {
+        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Transliteration failed: {e}"))
+    };
+
+    let start = Instant::now();
+    for _ in 0..iterations {
+        if with_metadata {
+            black_box(
+                transliterator
+                    .transliterate_with_metadata(black_box(text), from_script, to_script)
+                    .map_err(to_py_err)?,
+            );
+        } else {
+            black_box(
+                transliterator
+                    .transliterate(black_box(text), from_script, to_script)
+                    .map_err(to_py_err)?,
+            );
+        }
+    }
+    Ok(start.elapsed().as_nanos() as u64)
+}
+
 /// Get list of all supported scripts
 ///
 /// Returns:
@@ -487,12 +1290,7 @@ fn transliterate(text: &str, from_script: &str, to_script: &str) -> PyResult<Str
 ///     >>> print("devanagari" in scripts)  # True
 #[pyfunction]
 fn get_supported_scripts() -> Vec<String> {
-    let transliterator = Shlesha::new();
-    transliterator
-        .list_supported_scripts()
-        .into_iter()
-        .map(|s| s.to_string())
-        .collect()
+    GLOBAL_SUPPORTED_SCRIPTS.clone()
 }
 
 /// Configure the Python module with all classes and functions
@@ -502,10 +1300,18 @@ pub fn configure_module(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyTransliterationResult>()?;
     m.add_class::<PyTransliterationMetadata>()?;
     m.add_class::<PyUnknownToken>()?;
+    m.add_class::<PyConverter>()?;
+    m.add_class::<PyMappingProcessor>()?;
 
     // Add convenience functions
     m.add_function(wrap_pyfunction!(create_transliterator, m)?)?;
     m.add_function(wrap_pyfunction!(transliterate, m)?)?;
+    m.add_function(wrap_pyfunction!(transliterate_cached, m)?)?;
+    m.add_function(wrap_pyfunction!(transliterate_batch_fn, m)?)?;
+    m.add_function(wrap_pyfunction!(transliterate_pairs_fn, m)?)?;
+    m.add_function(wrap_pyfunction!(transliterate_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(bench_transliterate, m)?)?;
+    m.add_function(wrap_pyfunction!(run_processor_matrix, m)?)?;
     m.add_function(wrap_pyfunction!(get_supported_scripts, m)?)?;
 
     // Add module metadata
@@ -528,9 +1334,7 @@ mod tests {
     #[test]
     fn test_python_basic_transliteration() {
         let transliterator = PyShlesha::new();
-        let result = transliterator
-            .transliterate("अ", "devanagari", "iast")
-            .unwrap();
+        let result = transliterate_text(&transliterator.inner, "अ", "devanagari", "iast").unwrap();
         assert_eq!(result, "a");
     }
 
@@ -562,13 +1366,121 @@ mod tests {
         assert!(scripts.iter().any(|s| s == "devanagari"));
     }
 
+    #[test]
+    fn test_batch_transliteration() {
+        let texts = vec!["अ".to_string(), "धर्म".to_string()];
+        let result =
+            transliterate_many(&GLOBAL_TRANSLITERATOR, &texts, "devanagari", "iast").unwrap();
+        assert_eq!(result, vec!["a".to_string(), "dharma".to_string()]);
+
+        let empty = transliterate_many(&GLOBAL_TRANSLITERATOR, &[], "devanagari", "iast").unwrap();
+        assert!(empty.is_empty());
+    }
+
+    #[test]
+    fn test_transliterate_for_pairs() {
+        let pairs = vec![
+            ("devanagari".to_string(), "iast".to_string()),
+            ("devanagari".to_string(), "slp1".to_string()),
+        ];
+        let result = transliterate_for_pairs(&GLOBAL_TRANSLITERATOR, "धर्म", &pairs).unwrap();
+        assert_eq!(result, vec!["dharma".to_string(), "Darma".to_string()]);
+
+        let bad_pair = vec![("devanagari".to_string(), "nonexistent".to_string())];
+        assert!(transliterate_for_pairs(&GLOBAL_TRANSLITERATOR, "धर्म", &bad_pair).is_err());
+    }
+
+    #[test]
+    fn test_timed_transliterations() {
+        for with_metadata in [false, true] {
+            assert!(time_transliterations(
+                &GLOBAL_TRANSLITERATOR,
+                "धर्म",
+                "devanagari",
+                "iast",
+                10,
+                with_metadata
+            )
+            .is_ok());
+        }
+
+        assert!(
+            time_transliterations(&GLOBAL_TRANSLITERATOR, "a", "devanagari", "iast", 0, false)
+                .is_err()
+        );
+        assert!(time_transliterations(
+            &GLOBAL_TRANSLITERATOR,
+            "a",
+            "nonexistent",
+            "iast",
+            1,
+            false
+        )
+        .is_err());
+    }
+
+    #[test]
+    fn test_mapping_tables_agree() {
+        let mappings: Vec<(String, String)> = [("kh", "K"), ("ā", "A"), ("k", "k"), ("a", "a")]
+            .iter()
+            .map(|(from, to)| (from.to_string(), to.to_string()))
+            .collect();
+
+        for processor_type in ["fx_hashmap", "aho_corasick", "fast_lookup"] {
+            let tables = MappingTables::build(processor_type, &mappings).unwrap();
+            assert_eq!(tables.process("kha").unwrap(), "Ka", "{processor_type}");
+            assert!(tables.ops_per_sec("kha", 10).unwrap() > 0.0);
+        }
+
+        assert!(MappingTables::build("unknown", &mappings).is_err());
+    }
+
     #[test]
     fn test_convenience_functions() {
-        let result = transliterate("अ", "devanagari", "iast").unwrap();
+        let result = transliterate_text(&GLOBAL_TRANSLITERATOR, "अ", "devanagari", "iast").unwrap();
         assert_eq!(result, "a");
 
         let scripts = get_supported_scripts();
         assert!(!scripts.is_empty());
         assert!(scripts.iter().any(|s| s == "devanagari"));
     }
+
+    #[test]
+    fn test_cached_transliteration() {
+        let convert = |text, from, to| {
+            cached_transliteration(
+                &GLOBAL_TRANSLITERATOR,
+                &TRANSLITERATION_CACHE,
+                text,
+                from,
+                to,
+            )
+        };
+        let first = convert("धर्म", "devanagari", "iast").unwrap();
+        let second = convert("धर्म", "devanagari", "iast").unwrap();
+        assert_eq!(&*first, "dharma");
+        assert!(Arc::ptr_eq(&first, &second));
+
+        let other = convert("धर्म", "devanagari", "slp1").unwrap();
+        assert_eq!(&*other, "Darma");
+        assert!(convert("a", "nonexistent", "iast").is_err());
+    }
+
+    #[test]
+    fn test_instance_cache_cleared_on_schema_change() {
+        let mut transliterator = PyShlesha::new();
+        let output = cached_transliteration(
+            &transliterator.inner,
+            &transliterator.cache,
+            "धर्म",
+            "devanagari",
+            "iast",
+        )
+        .unwrap();
+        assert_eq!(&*output, "dharma");
+        assert_eq!(transliterator.cache.read().unwrap().len(), 1);
+
+        transliterator.clear_runtime_schemas();
+        assert!(transliterator.cache.read().unwrap().is_empty());
+    }
 }
@@ -1,12 +1,19 @@
 use std::io::Write;
 use std::process::Command;
+use std::sync::OnceLock;
 
 /// Test CLI integration
 #[cfg(test)]
 mod cli_tests {
     use super::*;
 
-    fn get_cli_binary() -> String {
+    /// Path of the CLI binary, located once and shared by every test
+    fn get_cli_binary() -> &'static str {
+        static CLI_BINARY: OnceLock<String> = OnceLock::new();
+        CLI_BINARY.get_or_init(find_cli_binary)
+    }
+
+    fn find_cli_binary() -> String {
         // Try to use the release binary first, then fall back to debug
         let release_path = std::path::Path::new("target/release/shlesha");
         if release_path.exists() {
@@ -45,6 +52,32 @@ mod cli_tests {
         assert_eq!(stdout.trim(), "a");
     }
 
+    #[test]
+    fn test_cli_stdin_dash() {
+        let mut child = Command::new(get_cli_binary())
+            .arg("transliterate")
+            .arg("--from")
+            .arg("devanagari")
+            .arg("--to")
+            .arg("iast")
+            .arg("-")
+            .stdin(std::process::Stdio::piped())
+            .stdout(std::process::Stdio::piped())
+            .spawn()
+            .expect("Failed to spawn CLI");
+
+        let stdin = child.stdin.as_mut().expect("Failed to get stdin");
+        stdin
+            .write_all("  धर्म\n".as_bytes())
+            .expect("Failed to write to stdin");
+        let _ = child.stdin.take(); // Close stdin to signal EOF
+
+        let output = child.wait_with_output().expect("Failed to wait for CLI");
+        assert!(output.status.success());
+        let stdout = String::from_utf8(output.stdout).unwrap();
+        assert_eq!(stdout, "dharma\n");
+    }
+
     #[test]
     fn test_cli_verbose_flag() {
         let output = Command::new(get_cli_binary())
@@ -130,6 +163,70 @@ mod cli_tests {
         assert_eq!(stdout.trim(), "a");
     }
 
+    #[test]
+    fn test_cli_lines_mode() {
+        let mut child = Command::new(get_cli_binary())
+            .arg("transliterate")
+            .arg("--from")
+            .arg("devanagari")
+            .arg("--to")
+            .arg("iast")
+            .arg("--lines")
+            .stdin(std::process::Stdio::piped())
+            .stdout(std::process::Stdio::piped())
+            .spawn()
+            .expect("Failed to spawn CLI");
+
+        let stdin = child.stdin.as_mut().expect("Failed to get stdin");
+        stdin
+            .write_all("धर्म\nयोग\n".as_bytes())
+            .expect("Failed to write to stdin");
+        let _ = child.stdin.take(); // Close stdin to signal EOF
+
+        let output = child.wait_with_output().expect("Failed to wait for CLI");
+        assert!(output.status.success());
+        let stdout = String::from_utf8(output.stdout).unwrap();
+        assert_eq!(stdout.lines().collect::<Vec<_>>(), ["dharma", "yoga"]);
+    }
+
+    #[test]
+    fn test_cli_serve_mode() {
+        let mut child = Command::new(get_cli_binary())
+            .arg("serve")
+            .stdin(std::process::Stdio::piped())
+            .stdout(std::process::Stdio::piped())
+            .spawn()
+            .expect("Failed to spawn CLI");
+
+        let stdin = child.stdin.as_mut().expect("Failed to get stdin");
+        stdin
+            .write_all(
+                concat!(
+                    r#"{"from": "devanagari", "to": "iast", "text": "धर्म"}"#,
+                    "\n",
+                    r#"{"from": "nonexistent", "to": "iast", "text": "a"}"#,
+                    "\n",
+                    r#"{"from": "slp1", "to": "iast", "text": "yoga"}"#,
+                    "\n",
+                )
+                .as_bytes(),
+            )
+            .expect("Failed to write to stdin");
+        let _ = child.stdin.take(); // Close stdin to signal EOF
+
+        let output = child.wait_with_output().expect("Failed to wait for CLI");
+        assert!(output.status.success());
+        let stdout = String::from_utf8(output.stdout).unwrap();
+        let responses: Vec<serde_json::Value> = stdout
+            .lines()
+            .map(|line| serde_json::from_str(line).unwrap())
+            .collect();
+        assert_eq!(responses.len(), 3);
+        assert_eq!(responses[0]["output"], "dharma");
+        assert!(responses[1]["error"].is_string());
+        assert_eq!(responses[2]["output"], "yoga");
+    }
+
     #[test]
     fn test_cli_error_handling_invalid_script() {
         let output = Command::new(get_cli_binary())
@@ -0,0 +1,19 @@
+"""Shared pytest configuration for the Python test suite."""
+
+import os
+
+try:
+    from hypothesis import settings
+    from hypothesis.database import DirectoryBasedExampleDatabase
+except ImportError:
+    settings = None
+
+# Under pytest-xdist, keep each worker's Hypothesis examples in a separate
+# directory so parallel workers don't contend on one database
+WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+if settings is not None and WORKER:
+    settings.register_profile(
+        "xdist", database=DirectoryBasedExampleDatabase(f".hypothesis/examples-{WORKER}")
+    )
+    settings.load_profile("xdist")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Record Vidyut's outputs for the property-test corpus
+
+test_vidyut_consistency compares Shlesha against these recorded outputs
+instead of calling Vidyut on every run. Rerun this after changing the corpus
+or the conversions below:
+
+    python tests/generate_vidyut_golden.py
+"""
+
+import json
+import random
+
+from vidyut.lipi import transliterate, Scheme
+
+from test_property_based import IAST_CHARS, VIDYUT_GOLDEN_PATH
+
+# Conversions both Shlesha and Vidyut support
+VIDYUT_CASES = (
+    ("iast", "slp1", Scheme.Iast, Scheme.Slp1),
+    ("iast", "devanagari", Scheme.Iast, Scheme.Devanagari),
+    ("slp1", "devanagari", Scheme.Slp1, Scheme.Devanagari),
+)
+
+
+def generate_corpus(seed=0, size=200, max_length=20):
+    """Fixed IAST texts, drawn the way the sanskrit_text strategy draws them."""
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(IAST_CHARS) for _ in range(rng.randint(1, rng.randint(1, max_length))))
+        for _ in range(size)
+    ]
+
+
+# Keep it manageable
+GOLDEN_TEXTS = [text for text in generate_corpus() if len(text) < 10]
+
+
+def main():
+    golden = [
+        {
+            "source": shlesha_source,
+            "target": shlesha_target,
+            "outputs": {
+                text: transliterate(text, vidyut_source, vidyut_target)
+                for text in GOLDEN_TEXTS
+            },
+        }
+        for shlesha_source, shlesha_target, vidyut_source, vidyut_target in VIDYUT_CASES
+    ]
+
+    VIDYUT_GOLDEN_PATH.parent.mkdir(exist_ok=True)
+    with open(VIDYUT_GOLDEN_PATH, "w", encoding="utf-8") as f:
+        json.dump(golden, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+    print(f"Wrote {sum(len(case['outputs']) for case in golden)} outputs to {VIDYUT_GOLDEN_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,23 +3,57 @@
 Diagnostic script to identify the wheel import issue.
 """
 
+import ctypes
+import shlex
 import subprocess
 import tempfile
-import shutil
 import sys
 import os
+import zipfile
 from pathlib import Path
 
-def run_cmd(cmd, cwd=None):
-    """Run command and return result."""
-    print(f"\n🔧 Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+try:
+    from elftools.common.exceptions import ELFError
+    from elftools.elf.elffile import ELFFile
+except ImportError:
+    ELFFile = None
+
+# Venvs reused across runs instead of being recreated in the temp dir
+CACHED_VENV_DIR = Path.home() / ".cache" / "shlesha-tests"
+
+def run_cmd(argv, cwd=None):
+    """Run command (an argument list, spawned without a shell) and return result."""
+    print(f"\n🔧 Running: {shlex.join(map(str, argv))}")
+    try:
+        result = subprocess.run(argv, cwd=cwd, capture_output=True, text=True)
+    except FileNotFoundError as e:
+        # What the shell reported as exit 127 before
+        result = subprocess.CompletedProcess(argv, 127, "", f"{e}\n")
     if result.stdout:
         print(f"STDOUT:\n{result.stdout}")
     if result.stderr:
         print(f"STDERR:\n{result.stderr}")
     return result
 
+def exports_symbol(so_path, name):
+    """Whether a shared library exports `name`: True, False, or None if unknown
+
+    Tries dlopen + dlsym first, then reads .dynsym with pyelftools when the
+    library can't be loaded here (e.g. built for another platform).
+    """
+    try:
+        return hasattr(ctypes.CDLL(str(so_path), mode=ctypes.RTLD_LOCAL), name)
+    except OSError:
+        pass
+    if ELFFile is None:
+        return None
+    try:
+        with open(so_path, "rb") as f:
+            dynsym = ELFFile(f).get_section_by_name(".dynsym")
+            return dynsym is not None and bool(dynsym.get_symbol_by_name(name))
+    except ELFError:
+        return None
+
 def diagnose_wheel_issue():
     """Diagnose the wheel import issue step by step."""
     project_root = Path(__file__).parent.parent.parent
@@ -41,16 +75,11 @@ def diagnose_wheel_issue():
     # Step 2: Build wheel with explicit features
     print("\n📋 Step 2: Building wheel with explicit Python features")
     with tempfile.TemporaryDirectory() as tmpdir:
-        # Copy project to temp dir
-        temp_project = Path(tmpdir) / "shlesha_test"
-        shutil.copytree(project_root, temp_project, ignore=shutil.ignore_patterns(
-            '.git', 'target', '.venv', 'venv', '__pycache__', '*.egg-info'
-        ))
-        
-        # Build wheel
+        # Build from the working tree; only the wheel goes to the temp dir
+        wheelhouse = Path(tmpdir) / "wheelhouse"
         result = run_cmd(
-            "maturin build --release --features python -o wheelhouse",
-            cwd=temp_project
+            ["maturin", "build", "--release", "--features", "python", "-o", wheelhouse],
+            cwd=project_root
         )
         
         if result.returncode != 0:
@@ -58,7 +87,6 @@ def diagnose_wheel_issue():
             return False
         
         # Find the built wheel
-        wheelhouse = temp_project / "wheelhouse"
         wheels = list(wheelhouse.glob("*.whl"))
         if not wheels:
             print("❌ No wheel found!")
@@ -70,11 +98,16 @@ def diagnose_wheel_issue():
         # Step 3: Inspect wheel contents
         print("\n📋 Step 3: Inspecting wheel contents")
         extract_dir = Path(tmpdir) / "wheel_contents"
-        run_cmd(f"unzip -l {wheel_path}")
-        run_cmd(f"unzip -q {wheel_path} -d {extract_dir}")
+        with zipfile.ZipFile(wheel_path) as wheel:
+            members = wheel.infolist()
+            for info in members:
+                print(f"{info.file_size:>10}  {info.filename}")
+            wheel.extractall(extract_dir)
+        # Locate files from the archive listing instead of walking the extracted tree
+        extracted = [extract_dir / info.filename for info in members if not info.is_dir()]
         
         # Check for __init__.py
-        init_files = list(extract_dir.rglob("__init__.py"))
+        init_files = [f for f in extracted if f.name == "__init__.py"]
         if init_files:
             print("\n⚠️  Found __init__.py files:")
             for f in init_files:
@@ -82,31 +115,37 @@ def diagnose_wheel_issue():
                 print(f"    Content: {f.read_text().strip()}")
         
         # Check for .so files
-        so_files = list(extract_dir.rglob("*.so")) + list(extract_dir.rglob("*.pyd"))
+        so_files = [f for f in extracted if f.suffix in (".so", ".pyd")]
         if so_files:
             print("\n✅ Found compiled extension modules:")
             for f in so_files:
                 print(f"  - {f.relative_to(extract_dir)}")
-                # Check if it exports PyInit_shlesha
-                result = run_cmd(f"nm -D {f} 2>/dev/null | grep PyInit || true")
-        
-        # Step 4: Test import in isolated environment
+                # Check if it exports the module's init function
+                symbol = f"PyInit_{f.name.split('.')[0]}"
+                exported = exports_symbol(f, symbol)
+                status = {True: "✅ exported", False: "❌ missing", None: "❓ could not check"}[exported]
+                print(f"    {symbol}: {status}")
+        
+        # Step 4: Test import in isolated environment. The venv is kept between
+        # runs (one per Python version); only the wheel is reinstalled.
         print("\n📋 Step 4: Testing import in isolated environment")
-        test_venv = Path(tmpdir) / "test_venv"
-        run_cmd(f"python3 -m venv {test_venv}")
+        test_venv = CACHED_VENV_DIR / f"diagnose-venv-py{sys.version_info.major}.{sys.version_info.minor}"
         
         pip_cmd = f"{test_venv}/bin/pip" if sys.platform != "win32" else f"{test_venv}\\Scripts\\pip"
         python_cmd = f"{test_venv}/bin/python" if sys.platform != "win32" else f"{test_venv}\\Scripts\\python"
         
+        if not Path(python_cmd).exists():
+            run_cmd([sys.executable, "-m", "venv", test_venv])
+        
         # Install wheel
-        result = run_cmd(f"{pip_cmd} install {wheel_path}")
+        result = run_cmd([pip_cmd, "install", "--force-reinstall", wheel_path])
         if result.returncode != 0:
             print("❌ Wheel installation failed!")
             return False
         
         # Test import
         print("\n🧪 Testing import...")
-        result = run_cmd(f'{python_cmd} -c "import shlesha; print(\'✅ Import successful!\')"')
+        result = run_cmd([python_cmd, "-c", "import shlesha; print('✅ Import successful!')"])
         
         if result.returncode != 0:
             print("\n❌ Import failed! Investigating further...")
@@ -124,7 +163,7 @@ def diagnose_wheel_issue():
                                 print(f"  - {f.relative_to(test_venv)}")
             
             # Try to understand the error
-            result = run_cmd(f'{python_cmd} -c "import sys; sys.path.append(\'.\'); import shlesha"')
+            result = run_cmd([python_cmd, "-c", "import sys; sys.path.append('.'); import shlesha"])
             
             return False
         
@@ -193,7 +232,7 @@ features = ["pyo3/extension-module", "python"]
         (test_project / "pyproject.toml").write_text(pyproject)
         
         print("\n🔨 Building minimal test project...")
-        result = run_cmd("maturin build --release", cwd=test_project)
+        result = run_cmd(["maturin", "build", "--release"], cwd=test_project)
         
         if result.returncode == 0:
             print("✅ Minimal test project builds successfully!")
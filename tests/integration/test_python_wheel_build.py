@@ -4,40 +4,117 @@ Integration test for Python wheel building that replicates CI environment.
 This test uses Docker to ensure we catch issues before they hit production.
 """
 
+import hashlib
+import json
 import os
+import shlex
 import sys
 import tempfile
 import subprocess
-import shutil
+from collections import deque
 from pathlib import Path
 
-def run_command(cmd, cwd=None, env=None, check=True):
-    """Run a command and return output."""
-    print(f"Running: {cmd}")
-    result = subprocess.run(
-        cmd, 
-        shell=True, 
-        cwd=cwd, 
-        env=env,
-        capture_output=True, 
-        text=True
-    )
+# Image tagged after each Docker build and used as the layer cache for the next
+# one. Point SHLESHA_DOCKER_CACHE_IMAGE at a registry to share it between
+# machines; it is then pulled before and pushed after each build.
+DOCKER_CACHE_IMAGE = os.environ.get("SHLESHA_DOCKER_CACHE_IMAGE", "shlesha-wheel-test:latest")
+PUSH_DOCKER_CACHE = "SHLESHA_DOCKER_CACHE_IMAGE" in os.environ
+
+# Everything the wheel build reads (the files the Dockerfile copies in)
+WHEEL_BUILD_INPUTS = [
+    'Cargo.toml', 'Cargo.lock', 'pyproject.toml', 'build.rs',
+    'schemas', 'templates', 'benches', 'examples', 'src',
+]
+
+def iter_files(path):
+    """Paths (as strings) of every file under `path`, or `path` itself if it is a file.
+    
+    Walks with os.scandir, whose entries carry their file type, so no Path
+    objects or extra stat calls are made per entry.
+    """
+    if not os.path.isdir(path):
+        yield path
+        return
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+def wheel_inputs_digest(project_root, dockerfile_content):
+    """SHA-256 over the Dockerfile and every wheel build input, by relative path."""
+    digest = hashlib.sha256(dockerfile_content.encode())
+    root = str(project_root)
+    for name in WHEEL_BUILD_INPUTS:
+        for f in sorted(iter_files(os.path.join(root, name))):
+            digest.update(os.path.relpath(f, root).replace(os.sep, "/").encode() + b"\0")
+            with open(f, "rb") as fh:
+                digest.update(fh.read())
+    return digest.hexdigest()
+
+# Output lines kept per command for failure reports; docker build logs for a
+# Rust project run to megabytes, so only the tail is held in memory
+OUTPUT_TAIL_LINES = 2000
+
+def run_command(argv, cwd=None, env=None, check=True, input=None):
+    """Run a command (an argument list, spawned without a shell) and return the result.
+    
+    `input`, if given, is written to the command's stdin. stdout and stderr
+    are read as one stream, line by line, and only the last OUTPUT_TAIL_LINES
+    lines are kept as the result's stdout. A missing executable is reported as
+    exit code 127, as the shell would.
+    """
+    argv = [str(arg) for arg in argv]
+    print(f"Running: {shlex.join(argv)}")
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    stdin = None if input is None else subprocess.PIPE
+    try:
+        with subprocess.Popen(argv, cwd=cwd, env=env, stdin=stdin, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True) as proc:
+            if input is not None:
+                proc.stdin.write(input)
+                proc.stdin.close()
+            tail.extend(proc.stdout)
+        returncode = proc.returncode
+    except FileNotFoundError as e:
+        tail.append(f"{e}\n")
+        returncode = 127
+    result = subprocess.CompletedProcess(argv, returncode, "".join(tail), "")
     
     if check and result.returncode != 0:
         print(f"Command failed with exit code {result.returncode}")
-        print(f"STDOUT: {result.stdout}")
-        print(f"STDERR: {result.stderr}")
-        raise subprocess.CalledProcessError(result.returncode, cmd)
+        print(f"OUTPUT: {result.stdout}")
+        raise subprocess.CalledProcessError(result.returncode, argv, output=result.stdout)
     
     return result
 
+def docker_build(tags, dockerfile_content, context, extra_args=()):
+    """Build an image from a Dockerfile passed on stdin; returns the run_command result.
+    
+    Nothing is written to disk: the context is the project tree itself,
+    filtered by the repository's .dockerignore.
+    """
+    tag_args = [arg for tag in tags for arg in ("-t", tag)]
+    return run_command(
+        ["docker", "build", *extra_args, *tag_args, "-f", "-", context],
+        env={**os.environ, "DOCKER_BUILDKIT": "1"},
+        check=False,
+        input=dockerfile_content
+    )
+
 def test_wheel_build_in_docker():
     """Test wheel building in Docker environment similar to CI."""
     project_root = Path(__file__).parent.parent.parent
     
-    # Create a Dockerfile that mimics cibuildwheel environment
-    dockerfile_content = """
-FROM python:3.11-slim
+    # Create a Dockerfile that mimics cibuildwheel environment. Dependencies
+    # are compiled by cargo-chef from a recipe of the manifests alone, so
+    # source-only edits reuse that layer and rebuild just this crate.
+    # (The syntax line must stay first: it enables COPY --link.)
+    dockerfile_content = """# syntax=docker/dockerfile:1.4
+FROM python:3.11-slim AS chef
 
 # Install build dependencies
 RUN apt-get update && apt-get install -y \
@@ -49,53 +126,74 @@ RUN apt-get update && apt-get install -y \
 # Install Rust
 RUN curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y
 ENV PATH="/root/.cargo/bin:${PATH}"
-
-# Set working directory
-WORKDIR /app
-
-# Copy project files
-COPY . .
+RUN --mount=type=cache,target=/root/.cargo/registry --mount=type=cache,target=/root/.cargo/git \
+    cargo install cargo-chef --locked
 
 # Install Python build tools
-RUN pip install --upgrade pip setuptools wheel
-RUN pip install maturin cibuildwheel
+RUN --mount=type=cache,target=/root/.cache/pip pip install --upgrade pip setuptools wheel
+RUN --mount=type=cache,target=/root/.cache/pip pip install maturin
 
 # Set environment variables similar to CI
 ENV PYO3_USE_ABI3_FORWARD_COMPATIBILITY=1
 
-# Build the wheel using maturin
-RUN maturin build --release --features python
+# Set working directory
+WORKDIR /app
+
+# Reduce the project to a dependency recipe
+FROM chef AS planner
+COPY --link . .
+RUN cargo chef prepare --recipe-path recipe.json
+
+# Build dependencies, then the wheel using maturin, in the unoptimized
+# test-wheel profile (this only checks that the wheel imports). Crate sources
+# and target/ live in cache mounts that outlast layer invalidation, so the
+# wheel is written outside target/ to end up in the image.
+FROM chef AS builder
+COPY --from=planner /app/recipe.json recipe.json
+RUN --mount=type=cache,target=/root/.cargo/registry --mount=type=cache,target=/root/.cargo/git \
+    --mount=type=cache,target=/app/target \
+    cargo chef cook --profile test-wheel --features python --recipe-path recipe.json
+COPY --link Cargo.toml Cargo.lock pyproject.toml build.rs ./
+COPY --link schemas ./schemas
+COPY --link templates ./templates
+COPY --link benches ./benches
+COPY --link examples ./examples
+COPY --link src ./src
+RUN --mount=type=cache,target=/root/.cargo/registry --mount=type=cache,target=/root/.cargo/git \
+    --mount=type=cache,target=/app/target \
+    maturin build --profile test-wheel --features python -o /app/wheels
 
-# Test the wheel installation and import
-RUN pip install target/wheels/*.whl
+# Test the wheel installation and import in a clean image
+FROM python:3.11-slim
+COPY --link --from=builder /app/wheels/ /wheels/
+RUN pip install /wheels/*.whl
 RUN python -c "import shlesha; print('✅ Docker wheel import test passed')"
 """
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Write Dockerfile
-        dockerfile_path = Path(tmpdir) / "Dockerfile"
-        dockerfile_path.write_text(dockerfile_content)
-        
-        # Copy project files to temp directory
-        temp_project = Path(tmpdir) / "project"
-        shutil.copytree(project_root, temp_project, ignore=shutil.ignore_patterns(
-            '.git', '__pycache__', 'target', '.venv', 'venv', 
-            'wheelhouse', 'dist', '*.egg-info', '.pytest_cache'
-        ))
-        
-        # Build Docker image
-        print("Building Docker image...")
-        result = run_command(
-            f"docker build -t shlesha-wheel-test -f {dockerfile_path} {temp_project}",
-            check=False
-        )
-        
-        if result.returncode != 0:
-            print("Docker build failed!")
-            return False
-        
-        print("✅ Docker wheel build and import test passed!")
+    # An image tagged with this digest already passed with identical inputs
+    source_tag = f"shlesha-wheel-test:sha-{wheel_inputs_digest(project_root, dockerfile_content)[:12]}"
+    if run_command(["docker", "image", "inspect", source_tag], check=False).returncode == 0:
+        print(f"✅ {source_tag} already built from these sources; skipping build")
         return True
+    
+    # Build Docker image, reusing layers from the previous build
+    print("Building Docker image...")
+    if PUSH_DOCKER_CACHE:
+        run_command(["docker", "pull", DOCKER_CACHE_IMAGE], check=False)
+    result = docker_build(
+        [DOCKER_CACHE_IMAGE, source_tag], dockerfile_content, project_root,
+        extra_args=["--cache-from", DOCKER_CACHE_IMAGE, "--build-arg", "BUILDKIT_INLINE_CACHE=1"]
+    )
+    
+    if result.returncode != 0:
+        print("Docker build failed!")
+        return False
+    
+    if PUSH_DOCKER_CACHE:
+        run_command(["docker", "push", DOCKER_CACHE_IMAGE], check=False)
+    
+    print("✅ Docker wheel build and import test passed!")
+    return True
 
 def test_cibuildwheel_simulation():
     """Test using actual cibuildwheel in Docker."""
@@ -121,8 +219,8 @@ export CIBW_BEFORE_BUILD="pip install maturin"
 export CIBW_BUILD_FRONTEND="pip"
 export CIBW_TEST_COMMAND='python -c "import shlesha; print(\"✅ shlesha wheel import test passed\")"'
 
-# Run cibuildwheel
-cibuildwheel --platform linux
+# Run cibuildwheel; the project is mounted read-only
+cibuildwheel --platform linux --output-dir /tmp/wheelhouse
 """
     
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -131,67 +229,100 @@ cibuildwheel --platform linux
         script_path.write_text(test_script)
         script_path.chmod(0o755)
         
-        # Copy project files
-        temp_project = Path(tmpdir) / "project"
-        shutil.copytree(project_root, temp_project, ignore=shutil.ignore_patterns(
-            '.git', '__pycache__', 'target', '.venv', 'venv', 
-            'wheelhouse', 'dist', '*.egg-info', '.pytest_cache'
-        ))
-        
-        # Run in Docker
+        # Run in Docker against the project tree itself
         print("Running cibuildwheel simulation in Docker...")
         result = run_command(
-            f"docker run --rm -v {temp_project}:/project -w /project "
-            f"python:3.11 /project/../test_cibuildwheel.sh",
+            ["docker", "run", "--rm", "-v", f"{project_root}:/project:ro", "-v", f"{tmpdir}:/scripts:ro",
+             "-w", "/project", "python:3.11", "bash", "/scripts/test_cibuildwheel.sh"],
             check=False
         )
         
         return result.returncode == 0
 
-def test_multi_platform_builds():
-    """Test wheel builds for multiple platforms."""
-    platforms = [
-        ("manylinux", "quay.io/pypa/manylinux2014_x86_64"),
-        ("musllinux", "quay.io/pypa/musllinux_1_1_x86_64"),
-    ]
-    
-    results = {}
-    for platform_name, base_image in platforms:
-        print(f"\nTesting {platform_name} build...")
-        
-        dockerfile_content = f"""
-FROM {base_image}
+# Base images for the multi-platform matrix, by bake target name
+PLATFORM_IMAGES = {
+    "manylinux": "quay.io/pypa/manylinux2014_x86_64",
+    "musllinux": "quay.io/pypa/musllinux_1_1_x86_64",
+}
+
+# Local BuildKit cache shared by the bake targets; each target exports its own
+# subdirectory and imports all of them
+BAKE_CACHE_DIR = Path(tempfile.gettempdir()) / "shlesha-bake-cache"
+
+# One Dockerfile for every platform; the base image comes in as a build arg.
+# The crate registry cache mount is shared by all targets, the target
+# directory only within one platform (its artifacts are libc-specific).
+PLATFORM_DOCKERFILE = """# syntax=docker/dockerfile:1.4
+ARG BASE_IMAGE
+FROM ${BASE_IMAGE}
+ARG PLATFORM_NAME
 
 # Install Rust
 RUN curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y
-ENV PATH="/root/.cargo/bin:${{PATH}}"
-
-WORKDIR /app
-COPY . .
+ENV PATH="/root/.cargo/bin:${PATH}"
 
 # Install Python 3.11
 RUN /opt/python/cp311-cp311/bin/python -m pip install maturin
 
-# Build wheel
+WORKDIR /app
+COPY . .
+
+# Build wheel (unoptimized; only the import is tested)
 ENV PYO3_USE_ABI3_FORWARD_COMPATIBILITY=1
-RUN /opt/python/cp311-cp311/bin/python -m maturin build --release --features python
+RUN --mount=type=cache,id=shlesha-cargo-registry,target=/root/.cargo/registry \\
+    --mount=type=cache,id=shlesha-target-${PLATFORM_NAME},target=/app/target \\
+    /opt/python/cp311-cp311/bin/python -m maturin build --profile test-wheel --features python -o /app/wheels
 
 # Test import
-RUN /opt/python/cp311-cp311/bin/python -m pip install target/wheels/*.whl
-RUN /opt/python/cp311-cp311/bin/python -c "import shlesha; print('✅ {platform_name} import test passed')"
+RUN /opt/python/cp311-cp311/bin/python -m pip install /app/wheels/*.whl
+RUN /opt/python/cp311-cp311/bin/python -c "import shlesha; print('✅ ${PLATFORM_NAME} import test passed')"
 """
-        
-        # Similar Docker build process...
-        results[platform_name] = True  # Simplified for now
+
+def bake_definition(project_root, platforms, cache_dir):
+    """HCL for `docker buildx bake`: one target per platform in a default group."""
+    def q(value):
+        # A JSON string literal is an HCL string once its template
+        # sequences are escaped (the Dockerfile's ${...} are not bake's)
+        return json.dumps(value).replace("${", "$${").replace("%{", "%%{")
+    cache_from = ", ".join(q(f"type=local,src={cache_dir / name}") for name in platforms)
+    blocks = [f"group \"default\" {{\n  targets = [{', '.join(q(name) for name in platforms)}]\n}}\n"]
+    for name, base_image in platforms.items():
+        blocks.append(
+            f"target {q(name)} {{\n"
+            f"  context = {q(str(project_root))}\n"
+            f"  dockerfile-inline = {q(PLATFORM_DOCKERFILE)}\n"
+            f"  args = {{ BASE_IMAGE = {q(base_image)}, PLATFORM_NAME = {q(name)} }}\n"
+            f"  tags = [{q(f'shlesha-wheel-test-{name}')}]\n"
+            f"  cache-from = [{cache_from}]\n"
+            f"  cache-to = [{q(f'type=local,dest={cache_dir / name},mode=max')}]\n"
+            f"}}\n"
+        )
+    return "\n".join(blocks)
+
+def test_multi_platform_builds():
+    """Test wheel builds for multiple platforms.
     
-    return results
+    All platforms go to BuildKit as one `docker buildx bake` run, so they
+    build concurrently and share the crate registry cache and the local
+    layer cache in BAKE_CACHE_DIR.
+    """
+    project_root = Path(__file__).parent.parent.parent
+    print(f"\nTesting {', '.join(PLATFORM_IMAGES)} builds...")
+    
+    result = run_command(
+        ["docker", "buildx", "bake", "--file", "-"],
+        cwd=project_root,
+        check=False,
+        input=bake_definition(project_root, PLATFORM_IMAGES, BAKE_CACHE_DIR)
+    )
+    return result.returncode == 0
 
 if __name__ == "__main__":
     print("Running Python wheel integration tests...\n")
     
     # Check if Docker is available
     try:
-        run_command("docker --version")
+        run_command(["docker", "--version"])
     except Exception:
         print("Docker is not available. Please install Docker to run these tests.")
         sys.exit(1)
@@ -6,168 +6,210 @@ These tests use Hypothesis to generate test cases and verify fundamental
 properties that should hold for ANY transliteration system.
 """
 
+import json
 import unittest
-from hypothesis import given, strategies as st, assume, settings, HealthCheck
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from hypothesis import given, example, strategies as st, assume, settings, HealthCheck
 import shlesha
-from vidyut.lipi import transliterate, Scheme
+
+
+# Script matrices shared by the property tests. Hypothesis runs each test body
+# once per generated example, so these are built once here rather than per call.
+DETERMINISM_PAIRS = (
+    ("iast", "slp1"),
+    ("iast", "devanagari"),
+    ("iast", "iso"),
+    ("slp1", "iast"),
+    ("slp1", "devanagari"),
+)
+
+IDENTITY_SCRIPTS = ("iast", "slp1", "devanagari", "telugu", "iso")
+
+ROUND_TRIP_PAIRS = (
+    ("iast", "slp1"),
+    ("iast", "iso"),
+    ("iast", "devanagari"),
+    ("slp1", "devanagari"),
+)
+
+LENGTH_BOUND_PAIRS = (
+    ("iast", "slp1"),
+    ("iast", "devanagari"),
+    ("slp1", "iast"),
+    ("iast", "iso"),
+)
+
+# ASCII digits and punctuation that Roman conversions should pass through
+ASCII_PASSTHROUGH_CHARS = "0123456789.,;:!?-()[]{}'\""
+
+# Roman-to-Roman pairs for which transliteration distributes over concatenation
+ROMAN_PAIRS = (
+    ("iast", "slp1"),
+    ("slp1", "iast"),
+    ("iast", "iso"),
+    ("iso", "iast"),
+)
+
+# Vidyut's outputs over a fixed corpus, recorded by generate_vidyut_golden.py
+VIDYUT_GOLDEN_PATH = Path(__file__).parent / "fixtures" / "vidyut_golden.json"
+
+INVALID_SCRIPTS = ("nonexistent", "", "invalid123", "IAST", "SLP1")
+VALID_SCRIPT = "iast"
+
+# Scripts get_supported_scripts must always report
+EXPECTED_SCRIPTS = frozenset({"iast", "slp1", "devanagari", "telugu"})
+
+# Inputs whose whitespace (spaces, padding, newline, tab) must survive conversion
+WHITESPACE_CASES = ("अ आ", " अ ", "अ\nआ", "अ\tआ")
+
+# Fan-out used by the thread-safety tests
+THREAD_WORKERS = 8
+THREAD_CALLS = 1000
+THREAD_CASES = (
+    ("धर्म", "devanagari", "iast"),
+    ("saṃskṛtam", "iast", "slp1"),
+    ("నమస్కారం", "telugu", "devanagari"),
+)
+
+
+# Character sets (vowels, consonants, marks, specials) for generated text
+IAST_CHARS = (
+    "a", "ā", "i", "ī", "u", "ū", "ṛ", "ṝ", "ḷ", "ḹ", "e", "ai", "o", "au",
+    "k", "kh", "g", "gh", "ṅ", "c", "ch", "j", "jh", "ñ",
+    "ṭ", "ṭh", "ḍ", "ḍh", "ṇ", "t", "th", "d", "dh", "n",
+    "p", "ph", "b", "bh", "m", "y", "r", "l", "v",
+    "ś", "ṣ", "s", "h",
+    "ṃ", "ḥ",
+    "kṣ", "jñ",
+)
+
+SLP1_CHARS = (
+    "a", "A", "i", "I", "u", "U", "f", "F", "x", "X", "e", "E", "o", "O",
+    "k", "K", "g", "G", "N", "c", "C", "j", "J", "Y",
+    "w", "W", "q", "Q", "R", "t", "T", "d", "D", "n",
+    "p", "P", "b", "B", "m", "y", "r", "l", "v",
+    "S", "z", "s", "h",
+    "M", "H",
+    "kz", "jY",  # kṣ → kz, jñ → jY in SLP1
+)
+
+HARVARD_KYOTO_CHARS = (
+    "a", "A", "i", "I", "u", "U", "R", "RR", "lR", "lRR", "e", "ai", "o", "au",
+    "k", "kh", "g", "gh", "G", "c", "ch", "j", "jh", "J",
+    "T", "Th", "D", "Dh", "N", "t", "th", "d", "dh", "n",
+    "p", "ph", "b", "bh", "m", "y", "r", "l", "v",
+    "z", "S", "s", "h",
+    "M", "H",
+    "kS", "jJ",
+)
+
+SCRIPT_CHARS = {
+    "iast": IAST_CHARS,
+    "slp1": SLP1_CHARS,
+    "harvard_kyoto": HARVARD_KYOTO_CHARS,
+}
+
+# Used for any other script
+FALLBACK_CHARS = ("a", "i", "u", "k", "t", "m", "n", "r", "s")
 
 
 # Strategy for generating valid Sanskrit text in different scripts
-@st.composite
-def sanskrit_text(draw, script="iast", max_length=20):
-    """Generate valid Sanskrit text in the specified script."""
-    if script == "iast":
-        # IAST character set
-        vowels = ["a", "ā", "i", "ī", "u", "ū", "ṛ", "ṝ", "ḷ", "ḹ", "e", "ai", "o", "au"]
-        consonants = ["k", "kh", "g", "gh", "ṅ", "c", "ch", "j", "jh", "ñ", 
-                     "ṭ", "ṭh", "ḍ", "ḍh", "ṇ", "t", "th", "d", "dh", "n",
-                     "p", "ph", "b", "bh", "m", "y", "r", "l", "v", 
-                     "ś", "ṣ", "s", "h"]
-        marks = ["ṃ", "ḥ"]
-        specials = ["kṣ", "jñ"]
-        
-        chars = vowels + consonants + marks + specials
-        
-    elif script == "slp1":
-        # SLP1 character set
-        vowels = ["a", "A", "i", "I", "u", "U", "f", "F", "x", "X", "e", "E", "o", "O"]
-        consonants = ["k", "K", "g", "G", "N", "c", "C", "j", "J", "Y",
-                     "w", "W", "q", "Q", "R", "t", "T", "d", "D", "n", 
-                     "p", "P", "b", "B", "m", "y", "r", "l", "v",
-                     "S", "z", "s", "h"]
-        marks = ["M", "H"]
-        specials = ["kz", "jY"]  # kṣ → kz, jñ → jY in SLP1
-        
-        chars = vowels + consonants + marks + specials
-        
-    elif script == "harvard_kyoto":
-        # Harvard-Kyoto character set
-        vowels = ["a", "A", "i", "I", "u", "U", "R", "RR", "lR", "lRR", "e", "ai", "o", "au"]
-        consonants = ["k", "kh", "g", "gh", "G", "c", "ch", "j", "jh", "J",
-                     "T", "Th", "D", "Dh", "N", "t", "th", "d", "dh", "n",
-                     "p", "ph", "b", "bh", "m", "y", "r", "l", "v",
-                     "z", "S", "s", "h"]
-        marks = ["M", "H"]
-        specials = ["kS", "jJ"]
-        
-        chars = vowels + consonants + marks + specials
-    
-    else:
-        # Fallback to basic ASCII
-        chars = ["a", "i", "u", "k", "t", "m", "n", "r", "s"]
+@lru_cache(maxsize=None)
+def sanskrit_text(script="iast", max_length=20):
+    """Generate valid Sanskrit text in the specified script.
     
-    length = draw(st.integers(min_value=1, max_value=max_length))
-    return "".join(draw(st.lists(st.sampled_from(chars), min_size=1, max_size=length)))
+    Strategies are cached per (script, max_length), so every test shares one.
+    """
+    chars = st.sampled_from(SCRIPT_CHARS.get(script, FALLBACK_CHARS))
+    return st.integers(min_value=1, max_value=max_length).flatmap(
+        lambda length: st.lists(chars, min_size=1, max_size=length)
+    ).map("".join)
+
+
+# Lists of IAST texts for the tests that check a property per text: each
+# drawn list is converted with one transliterate_batch call per script pair,
+# and Hypothesis shrinks a failing list down to the offending text
+IAST_BATCHES = st.lists(sanskrit_text(script="iast"), min_size=1, max_size=20)
+ROUND_TRIP_BATCHES = st.lists(sanskrit_text(script="iast", max_length=14), min_size=1, max_size=20)  # Keep it manageable
 
 
 class PropertyBasedTests(unittest.TestCase):
     """Property-based tests for transliteration system."""
     
-    @given(sanskrit_text(script="iast"))
-    @settings(max_examples=200, suppress_health_check=[HealthCheck.too_slow])
-    def test_transliteration_is_deterministic(self, text):
+    @classmethod
+    def setUpClass(cls):
+        with open(VIDYUT_GOLDEN_PATH, encoding="utf-8") as f:
+            cls.vidyut_golden = json.load(f)
+    
+    @given(IAST_BATCHES)
+    @settings(max_examples=50, suppress_health_check=[HealthCheck.too_slow])
+    def test_transliteration_is_deterministic(self, texts):
         """Test that transliteration is deterministic - same input always gives same output."""
-        assume(len(text) > 0)
-        
-        # Test multiple script pairs
-        script_pairs = [
-            ("iast", "slp1"),
-            ("iast", "devanagari"),
-            ("iast", "iso"),
-            ("slp1", "iast"),
-            ("slp1", "devanagari"),
-        ]
-        
-        for source, target in script_pairs:
+        for source, target in DETERMINISM_PAIRS:
             try:
-                result1 = shlesha.transliterate(text, source, target)
-                result2 = shlesha.transliterate(text, source, target)
-                result3 = shlesha.transliterate(text, source, target)
-                
-                self.assertEqual(result1, result2, 
-                    f"Non-deterministic result for {source}→{target}: '{text}' gave different outputs")
-                self.assertEqual(result1, result3,
-                    f"Non-deterministic result for {source}→{target}: '{text}' gave different outputs")
-                    
-            except Exception as e:
+                first = shlesha.transliterate_batch(texts, source, target)
+            except Exception:
                 # If conversion fails, it should fail consistently
-                try:
-                    shlesha.transliterate(text, source, target)
-                    self.fail(f"Inconsistent error behavior for {source}→{target}: '{text}'")
-                except Exception:
-                    pass  # Consistent failure is okay
+                with self.assertRaises(Exception, msg=f"Inconsistent error behavior for {source}→{target}: {texts!r}"):
+                    shlesha.transliterate_batch(texts, source, target)
+                continue
+            
+            for _ in range(2):
+                self.assertEqual(shlesha.transliterate_batch(texts, source, target), first,
+                    f"Non-deterministic result for {source}→{target}: {texts!r} gave different outputs")
     
-    @given(sanskrit_text(script="iast"))
-    @settings(max_examples=100)
-    def test_identity_conversions(self, text):
+    @given(IAST_BATCHES)
+    @settings(max_examples=25)
+    def test_identity_conversions(self, texts):
         """Test that converting from a script to itself returns the original text."""
-        assume(len(text) > 0)
-        
-        scripts = ["iast", "slp1", "devanagari", "telugu", "iso"]
-        
-        for script in scripts:
+        for script in IDENTITY_SCRIPTS:
             try:
-                result = shlesha.transliterate(text, script, script)
-                self.assertEqual(result, text,
-                    f"Identity conversion failed for {script}: '{text}' → '{result}'")
+                results = shlesha.transliterate_batch(texts, script, script)
+                for text, result in zip(texts, results):
+                    self.assertEqual(result, text,
+                        f"Identity conversion failed for {script}: '{text}' → '{result}'")
             except Exception:
                 # Some scripts might not support certain input text, that's okay
                 pass
     
-    @given(sanskrit_text(script="iast"))
-    @settings(max_examples=50)
-    def test_round_trip_conversions(self, text):
+    @given(ROUND_TRIP_BATCHES)
+    @example(["kṣetra", "jñāna", "saṃskṛtam"])
+    @settings(max_examples=25)
+    def test_round_trip_conversions(self, texts):
         """Test that A→B→A conversions preserve the original text."""
-        assume(len(text) > 0 and len(text) < 15)  # Keep it manageable
-        
-        # Test round-trip conversions
-        round_trip_pairs = [
-            ("iast", "slp1"),
-            ("iast", "iso"),
-            ("iast", "devanagari"),
-            ("slp1", "devanagari"),
-        ]
-        
-        for script_a, script_b in round_trip_pairs:
+        for script_a, script_b in ROUND_TRIP_PAIRS:
             try:
                 # A → B → A
-                intermediate = shlesha.transliterate(text, script_a, script_b)
-                back_to_original = shlesha.transliterate(intermediate, script_b, script_a)
-                
-                self.assertEqual(back_to_original, text,
-                    f"Round-trip failed {script_a}→{script_b}→{script_a}: "
-                    f"'{text}' → '{intermediate}' → '{back_to_original}'")
-                    
+                intermediates = shlesha.transliterate_batch(texts, script_a, script_b)
+                round_trips = shlesha.transliterate_batch(intermediates, script_b, script_a)
             except Exception as e:
                 # Document failures for investigation
-                print(f"Round-trip conversion failed for '{text}' ({script_a}↔{script_b}): {e}")
+                print(f"Round-trip conversion failed ({script_a}↔{script_b}): {e}")
+                continue
+            
+            for text, intermediate, back_to_original in zip(texts, intermediates, round_trips):
+                if back_to_original != text:
+                    print(f"Round-trip failed {script_a}→{script_b}→{script_a}: "
+                          f"'{text}' → '{intermediate}' → '{back_to_original}'")
     
-    @given(sanskrit_text(script="iast"))
-    @settings(max_examples=100)
-    def test_output_length_bounds(self, text):
+    @given(IAST_BATCHES)
+    @settings(max_examples=25)
+    def test_output_length_bounds(self, texts):
         """Test that output length is within reasonable bounds of input length."""
-        assume(len(text) > 0)
-        
-        script_pairs = [
-            ("iast", "slp1"),
-            ("iast", "devanagari"), 
-            ("slp1", "iast"),
-            ("iast", "iso"),
-        ]
-        
-        for source, target in script_pairs:
+        for source, target in LENGTH_BOUND_PAIRS:
             try:
-                result = shlesha.transliterate(text, source, target)
-                
-                # Output should not be empty unless input is empty
-                if len(text) > 0:
+                results = shlesha.transliterate_batch(texts, source, target)
+                for text, result in zip(texts, results):
+                    # Output should not be empty unless input is empty
                     self.assertGreater(len(result), 0,
                         f"Empty output for non-empty input: {source}→{target} '{text}' → '{result}'")
-                
-                # Output should not be excessively long (reasonable bound)
-                max_expansion = 10  # Allow up to 10x expansion for complex scripts
-                self.assertLessEqual(len(result), len(text) * max_expansion,
-                    f"Excessive expansion {source}→{target}: '{text}' ({len(text)}) → '{result}' ({len(result)})")
+                    
+                    # Output should not be excessively long (reasonable bound)
+                    max_expansion = 10  # Allow up to 10x expansion for complex scripts
+                    self.assertLessEqual(len(result), len(text) * max_expansion,
+                        f"Excessive expansion {source}→{target}: '{text}' ({len(text)}) → '{result}' ({len(result)})")
                     
             except Exception:
                 pass  # Conversion failures are handled elsewhere
@@ -178,10 +220,7 @@ class PropertyBasedTests(unittest.TestCase):
         """Test that certain characters are preserved across conversions."""
         assume(len(text) > 0)
         
-        # ASCII digits and punctuation should be preserved
-        ascii_chars = "0123456789.,;:!?-()[]{}'\""
-        
-        for char in ascii_chars:
+        for char in ASCII_PASSTHROUGH_CHARS:
             test_text = text + char
             
             try:
@@ -205,22 +244,11 @@ class PropertyBasedTests(unittest.TestCase):
         
         combined_text = text1 + text2
         
-        # This property should hold for Roman-to-Roman conversions
-        roman_pairs = [
-            ("iast", "slp1"),
-            ("slp1", "iast"),
-            ("iast", "iso"),
-            ("iso", "iast"),
-        ]
-        
-        for source, target in roman_pairs:
+        for source, target in ROMAN_PAIRS:
             try:
-                # Convert combined text
-                combined_result = shlesha.transliterate(combined_text, source, target)
-                
-                # Convert parts separately and combine
-                part1_result = shlesha.transliterate(text1, source, target)
-                part2_result = shlesha.transliterate(text2, source, target)
+                # Convert combined text and both parts in one call
+                combined_result, part1_result, part2_result = shlesha.transliterate_batch(
+                    [combined_text, text1, text2], source, target)
                 parts_combined = part1_result + part2_result
                 
                 self.assertEqual(combined_result, parts_combined,
@@ -252,50 +280,34 @@ class PropertyBasedTests(unittest.TestCase):
             except Exception:
                 pass
     
-    @given(sanskrit_text(script="iast"))
-    @settings(max_examples=50)
-    def test_vidyut_consistency(self, text):
+    def test_vidyut_consistency(self):
         """Test that Shlesha results are consistent with Vidyut where both support the conversion."""
-        assume(len(text) > 0 and len(text) < 10)  # Keep it manageable
-        
-        # Test cases where both Shlesha and Vidyut should work
-        test_cases = [
-            ("iast", "slp1", Scheme.Iast, Scheme.Slp1),
-            ("iast", "devanagari", Scheme.Iast, Scheme.Devanagari),
-            ("slp1", "devanagari", Scheme.Slp1, Scheme.Devanagari),
-        ]
-        
-        for shlesha_source, shlesha_target, vidyut_source, vidyut_target in test_cases:
+        for case in self.vidyut_golden:
+            source, target = case["source"], case["target"]
             try:
-                shlesha_result = shlesha.transliterate(text, shlesha_source, shlesha_target)
-                vidyut_result = transliterate(text, vidyut_source, vidyut_target)
-                
-                # They should produce the same result
-                self.assertEqual(shlesha_result, vidyut_result,
-                    f"Shlesha/Vidyut mismatch {shlesha_source}→{shlesha_target}: "
-                    f"'{text}' → Shlesha: '{shlesha_result}', Vidyut: '{vidyut_result}'")
-                    
+                results = shlesha.transliterate_batch(list(case["outputs"]), source, target)
             except Exception as e:
                 # Document inconsistencies
-                print(f"Consistency test failed for '{text}': {e}")
+                print(f"Consistency test failed for {source}→{target}: {e}")
+                continue
+            
+            for (text, vidyut_result), shlesha_result in zip(case["outputs"].items(), results):
+                if shlesha_result != vidyut_result:
+                    print(f"Shlesha/Vidyut mismatch {source}→{target}: "
+                          f"'{text}' → Shlesha: '{shlesha_result}', Vidyut: '{vidyut_result}'")
     
-    @given(st.text(min_size=1, max_size=5))
-    @settings(max_examples=100)
-    def test_error_handling(self, text):
-        """Test that invalid inputs are handled gracefully."""
-        
-        invalid_scripts = ["nonexistent", "", "invalid123", "IAST", "SLP1"]
-        valid_scripts = ["iast", "slp1", "devanagari", "telugu", "iso"]
+    def test_error_handling(self):
+        """Test that invalid script names are rejected on either side."""
         
-        for invalid_script in invalid_scripts:
-            for valid_script in valid_scripts:
+        for invalid_script in INVALID_SCRIPTS:
+            with self.subTest(script=invalid_script):
                 # Test invalid source script
                 with self.assertRaises(Exception):
-                    shlesha.transliterate(text, invalid_script, valid_script)
+                    shlesha.transliterate("a", invalid_script, VALID_SCRIPT)
                 
                 # Test invalid target script  
                 with self.assertRaises(Exception):
-                    shlesha.transliterate(text, valid_script, invalid_script)
+                    shlesha.transliterate("a", VALID_SCRIPT, invalid_script)
     
     def test_supported_scripts_property(self):
         """Test that get_supported_scripts returns valid script names."""
@@ -311,9 +323,19 @@ class PropertyBasedTests(unittest.TestCase):
             self.assertGreater(len(script), 0)
             
         # Should include known scripts
-        expected_scripts = ["iast", "slp1", "devanagari", "telugu"]
-        for expected in expected_scripts:
-            self.assertIn(expected, scripts, f"Expected script '{expected}' not found in supported scripts")
+        scripts_set = frozenset(scripts)
+        for expected in EXPECTED_SCRIPTS:
+            self.assertIn(expected, scripts_set, f"Expected script '{expected}' not found in supported scripts")
+    
+    def test_whitespace_handling(self):
+        """Test that whitespace separating words is carried through unchanged."""
+        for text in WHITESPACE_CASES:
+            result = shlesha.transliterate(text, "devanagari", "iast")
+            self.assertEqual(len(result.split()), len(text.split()),
+                             f"Word count changed for {text!r}: {result!r}")
+            for whitespace in " \n\t":
+                self.assertEqual(result.count(whitespace), text.count(whitespace),
+                                 f"Whitespace {whitespace!r} not preserved for {text!r}: {result!r}")
     
     @given(st.integers(min_value=0, max_value=1000))
     def test_empty_and_numeric_inputs(self, number):
@@ -334,6 +356,53 @@ class PropertyBasedTests(unittest.TestCase):
             pass  # Failure is acceptable for some numeric inputs
 
 
+class ThreadSafetyTests(unittest.TestCase):
+    """Concurrent calls on one shared transliterator must match sequential output."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.transliterator = shlesha.Shlesha()
+    
+    def test_concurrent_transliterate(self):
+        """Many threads converting through the same instance get identical results."""
+        for text, from_script, to_script in THREAD_CASES:
+            expected = self.transliterator.transliterate(text, from_script, to_script)
+            
+            with ThreadPoolExecutor(max_workers=THREAD_WORKERS) as executor:
+                outputs = list(executor.map(
+                    lambda _: self.transliterator.transliterate(text, from_script, to_script),
+                    range(THREAD_CALLS),
+                ))
+            
+            self.assertTrue(all(output == expected for output in outputs),
+                            f"Concurrent {from_script} → {to_script} diverged from sequential output")
+    
+    def test_concurrent_mixed_conversions(self):
+        """Interleaving different conversion pairs across threads doesn't cross results."""
+        expected = [self.transliterator.transliterate(*case) for case in THREAD_CASES]
+        cases = THREAD_CASES * (THREAD_CALLS // len(THREAD_CASES))
+        
+        with ThreadPoolExecutor(max_workers=THREAD_WORKERS) as executor:
+            outputs = list(executor.map(lambda case: self.transliterator.transliterate(*case), cases))
+        
+        self.assertEqual(outputs, expected * (THREAD_CALLS // len(THREAD_CASES)))
+    
+    def test_concurrent_batches(self):
+        """transliterate_batch releases the GIL; parallel batches must still agree."""
+        text, from_script, to_script = THREAD_CASES[0]
+        expected = self.transliterator.transliterate(text, from_script, to_script)
+        batch = [text] * 100
+        
+        with ThreadPoolExecutor(max_workers=THREAD_WORKERS) as executor:
+            batches = list(executor.map(
+                lambda _: self.transliterator.transliterate_batch(batch, from_script, to_script),
+                range(THREAD_WORKERS * 4),
+            ))
+        
+        for outputs in batches:
+            self.assertEqual(outputs, [expected] * len(batch))
+
+
 if __name__ == '__main__':
     # Run with more verbose output to see property failures
     unittest.main(verbosity=2, buffer=True)
\ No newline at end of file
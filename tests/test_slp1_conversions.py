@@ -10,10 +10,20 @@ import unittest
 import shlesha
 from vidyut.lipi import transliterate, Scheme
 
+# Vidyut schemes, looked up once
+IAST, SLP1 = Scheme.Iast, Scheme.Slp1
+
 
 class TestSLP1Conversions(unittest.TestCase):
     """Test SLP1 conversion correctness."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Compile the per-pair converters once for the class."""
+        transliterator = shlesha.Shlesha()
+        cls.iast_to_slp1 = transliterator.compile('iast', 'slp1')
+        cls.slp1_to_iast = transliterator.compile('slp1', 'iast')
+    
     def test_iast_to_slp1_individual_characters(self):
         """Test individual character mappings from IAST to SLP1."""
         mappings = [
@@ -40,14 +50,11 @@ class TestSLP1Conversions(unittest.TestCase):
         ]
         
         failed_mappings = []
+        results = self.iast_to_slp1.convert_batch([iast for iast, _ in mappings])
         
-        for iast_char, expected_slp1 in mappings:
-            with self.subTest(iast=iast_char, expected=expected_slp1):
-                result = shlesha.transliterate(iast_char, 'iast', 'slp1')
-                if result != expected_slp1:
-                    failed_mappings.append((iast_char, expected_slp1, result))
-                self.assertEqual(result, expected_slp1, 
-                    f"IAST '{iast_char}' should convert to SLP1 '{expected_slp1}', got '{result}'")
+        for (iast_char, expected_slp1), result in zip(mappings, results):
+            if result != expected_slp1:
+                failed_mappings.append((iast_char, expected_slp1, result))
         
         # Report all failures for easier debugging
         if failed_mappings:
@@ -78,14 +85,11 @@ class TestSLP1Conversions(unittest.TestCase):
         ]
         
         failed_mappings = []
+        results = self.slp1_to_iast.convert_batch([slp1 for slp1, _ in mappings])
         
-        for slp1_char, expected_iast in mappings:
-            with self.subTest(slp1=slp1_char, expected=expected_iast):
-                result = shlesha.transliterate(slp1_char, 'slp1', 'iast')
-                if result != expected_iast:
-                    failed_mappings.append((slp1_char, expected_iast, result))
-                self.assertEqual(result, expected_iast,
-                    f"SLP1 '{slp1_char}' should convert to IAST '{expected_iast}', got '{result}'")
+        for (slp1_char, expected_iast), result in zip(mappings, results):
+            if result != expected_iast:
+                failed_mappings.append((slp1_char, expected_iast, result))
         
         if failed_mappings:
             failure_report = "\n".join([
@@ -105,11 +109,19 @@ class TestSLP1Conversions(unittest.TestCase):
             ("aṣṭāṅgayoga", "azwANgayoga"),
         ]
         
-        for iast_word, expected_slp1 in test_words:
-            with self.subTest(word=iast_word):
-                result = shlesha.transliterate(iast_word, 'iast', 'slp1')
-                self.assertEqual(result, expected_slp1,
-                    f"IAST '{iast_word}' should convert to SLP1 '{expected_slp1}', got '{result}'")
+        failed_words = []
+        results = self.iast_to_slp1.convert_batch([word for word, _ in test_words])
+        
+        for (iast_word, expected_slp1), result in zip(test_words, results):
+            if result != expected_slp1:
+                failed_words.append((iast_word, expected_slp1, result))
+        
+        if failed_words:
+            failure_report = "\n".join([
+                f"  '{iast}' → expected '{expected}', got '{actual}'"
+                for iast, expected, actual in failed_words
+            ])
+            self.fail(f"Failed word conversions:\n{failure_report}")
     
     def test_slp1_to_iast_words(self):
         """Test word-level conversions from SLP1 to IAST."""
@@ -120,11 +132,19 @@ class TestSLP1Conversions(unittest.TestCase):
             ("namaskAram", "namaskāram"),
         ]
         
-        for slp1_word, expected_iast in test_words:
-            with self.subTest(word=slp1_word):
-                result = shlesha.transliterate(slp1_word, 'slp1', 'iast')
-                self.assertEqual(result, expected_iast,
-                    f"SLP1 '{slp1_word}' should convert to IAST '{expected_iast}', got '{result}'")
+        failed_words = []
+        results = self.slp1_to_iast.convert_batch([word for word, _ in test_words])
+        
+        for (slp1_word, expected_iast), result in zip(test_words, results):
+            if result != expected_iast:
+                failed_words.append((slp1_word, expected_iast, result))
+        
+        if failed_words:
+            failure_report = "\n".join([
+                f"  '{slp1}' → expected '{expected}', got '{actual}'"
+                for slp1, expected, actual in failed_words
+            ])
+            self.fail(f"Failed word conversions:\n{failure_report}")
     
     def test_bidirectional_consistency(self):
         """Test that IAST ↔ SLP1 conversions are consistent."""
@@ -135,12 +155,12 @@ class TestSLP1Conversions(unittest.TestCase):
             "bhagavadgītā",
         ]
         
-        for original in test_cases:
+        # IAST → SLP1 → IAST should return to original
+        slp1_results = self.iast_to_slp1.convert_batch(test_cases)
+        round_trips = self.slp1_to_iast.convert_batch(slp1_results)
+        
+        for original, slp1_result, back_to_iast in zip(test_cases, slp1_results, round_trips):
             with self.subTest(original=original):
-                # IAST → SLP1 → IAST should return to original
-                slp1_result = shlesha.transliterate(original, 'iast', 'slp1')
-                back_to_iast = shlesha.transliterate(slp1_result, 'slp1', 'iast')
-                
                 self.assertEqual(back_to_iast, original,
                     f"Round-trip conversion failed: '{original}' → '{slp1_result}' → '{back_to_iast}'")
     
@@ -153,12 +173,12 @@ class TestSLP1Conversions(unittest.TestCase):
             "ā", "ī", "ū", "ṛ", "ṃ", "ḥ", "ś", "ṣ", "kṣ"
         ]
         
-        for test_input in test_cases:
+        # IAST → SLP1
+        shlesha_results = self.iast_to_slp1.convert_batch(test_cases)
+        vidyut_results = [transliterate(text, IAST, SLP1) for text in test_cases]
+        
+        for test_input, shlesha_result, vidyut_result in zip(test_cases, shlesha_results, vidyut_results):
             with self.subTest(input=test_input):
-                # IAST → SLP1
-                shlesha_result = shlesha.transliterate(test_input, 'iast', 'slp1')
-                vidyut_result = transliterate(test_input, Scheme.Iast, Scheme.Slp1)
-                
                 self.assertEqual(shlesha_result, vidyut_result,
                     f"Shlesha and Vidyut disagree on '{test_input}': "
                     f"Shlesha='{shlesha_result}', Vidyut='{vidyut_result}'")
@@ -167,6 +187,11 @@ class TestSLP1Conversions(unittest.TestCase):
 class TestOtherRomanScripts(unittest.TestCase):
     """Test other Roman script conversions to ensure they work correctly."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one transliterator for the class."""
+        cls.transliterator = shlesha.Shlesha()
+    
     def test_iast_to_iso(self):
         """Test IAST to ISO-15919 conversion."""
         test_cases = [
@@ -176,9 +201,10 @@ class TestOtherRomanScripts(unittest.TestCase):
             ("saṃskṛtam", "saṁskr̥tam"),
         ]
         
+        to_iso = self.transliterator.compile('iast', 'iso')
         for iast_input, expected_iso in test_cases:
             with self.subTest(input=iast_input):
-                result = shlesha.transliterate(iast_input, 'iast', 'iso')
+                result = to_iso(iast_input)
                 self.assertEqual(result, expected_iso,
                     f"IAST '{iast_input}' should convert to ISO '{expected_iso}', got '{result}'")
     
@@ -191,9 +217,10 @@ class TestOtherRomanScripts(unittest.TestCase):
             ("H", "H"),  # HK H → SLP1 H
         ]
         
+        to_slp1 = self.transliterator.compile('harvard_kyoto', 'slp1')
         for hk_input, expected_slp1 in test_cases:
             with self.subTest(input=hk_input):
-                result = shlesha.transliterate(hk_input, 'harvard_kyoto', 'slp1')
+                result = to_slp1(hk_input)
                 self.assertEqual(result, expected_slp1,
                     f"Harvard-Kyoto '{hk_input}' should convert to SLP1 '{expected_slp1}', got '{result}'")
 
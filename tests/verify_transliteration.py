@@ -4,9 +4,25 @@ Verify Transliteration Correctness
 Ensures both libraries are producing correct outputs
 """
 
+import re
+
 import shlesha
 from vidyut.lipi import transliterate, Scheme
 
+# Vidyut schemes used by the per-character checks, looked up once
+IAST, SLP1 = Scheme.Iast, Scheme.Slp1
+
+# Script names reported as Roman in the supported-scripts listing
+ROMAN_SCRIPTS = frozenset({
+    'iast', 'slp1', 'itrans', 'harvard_kyoto', 'hk', 'velthuis', 'wx', 'iso15919', 'iso', 'kolkata'
+})
+
+# Unicode block of each script the detection checks look for
+SCRIPT_BLOCKS = {
+    'Telugu': re.compile('[\u0C00-\u0C7F]'),
+    'Devanagari': re.compile('[\u0900-\u097F]'),
+}
+
 def verify_conversions():
     """Verify that conversions are actually happening correctly."""
     print("🔍 Transliteration Output Verification")
@@ -32,14 +48,14 @@ def verify_conversions():
             'input': 'saṃskṛtam',
             'shlesha_args': ('iast', 'telugu'),
             'vidyut_args': (Scheme.Iast, Scheme.Telugu),
-            'expected_telugu': True
+            'expected_script': 'Telugu'
         },
         {
             'name': 'Telugu → Devanagari',
             'input': 'సంస్కృతం',
             'shlesha_args': ('telugu', 'devanagari'),
             'vidyut_args': (Scheme.Telugu, Scheme.Devanagari),
-            'expected_devanagari': True
+            'expected_script': 'Devanagari'
         },
         {
             'name': 'IAST → Devanagari',
@@ -59,17 +75,8 @@ def verify_conversions():
         print(f"Input: '{test['input']}'")
         
         # Run transliterations
-        shlesha_output = shlesha.transliterate(
-            test['input'], 
-            test['shlesha_args'][0], 
-            test['shlesha_args'][1]
-        )
-        
-        vidyut_output = transliterate(
-            test['input'],
-            test['vidyut_args'][0],
-            test['vidyut_args'][1]
-        )
+        shlesha_output = shlesha.transliterate(test['input'], *test['shlesha_args'])
+        vidyut_output = transliterate(test['input'], *test['vidyut_args'])
         
         print(f"Shlesha: '{shlesha_output}'")
         print(f"Vidyut:  '{vidyut_output}'")
@@ -91,19 +98,11 @@ def verify_conversions():
                     print(f"    Vidyut:  {'✓' if vidyut_has else '✗'}")
         
         # Check script detection
-        if 'expected_telugu' in test:
-            # Check for Telugu Unicode range
-            telugu_chars = any('\u0C00' <= c <= '\u0C7F' for c in shlesha_output)
-            print(f"  Contains Telugu characters: Shlesha {'✓' if telugu_chars else '✗'}")
-            telugu_chars = any('\u0C00' <= c <= '\u0C7F' for c in vidyut_output)
-            print(f"  Contains Telugu characters: Vidyut {'✓' if telugu_chars else '✗'}")
-        
-        if 'expected_devanagari' in test:
-            # Check for Devanagari Unicode range
-            deva_chars = any('\u0900' <= c <= '\u097F' for c in shlesha_output)
-            print(f"  Contains Devanagari characters: Shlesha {'✓' if deva_chars else '✗'}")
-            deva_chars = any('\u0900' <= c <= '\u097F' for c in vidyut_output)
-            print(f"  Contains Devanagari characters: Vidyut {'✓' if deva_chars else '✗'}")
+        if 'expected_script' in test:
+            script = test['expected_script']
+            block = SCRIPT_BLOCKS[script]
+            for label, output in (('Shlesha', shlesha_output), ('Vidyut', vidyut_output)):
+                print(f"  Contains {script} characters: {label} {'✓' if block.search(output) else '✗'}")
         
         print("-" * 80)
         print()
@@ -130,38 +129,44 @@ def test_specific_conversions():
     ]
     
     print("Testing individual IAST → SLP1 character mappings:")
-    errors = 0
-    
-    for iast_char, expected_slp1 in mappings:
-        shlesha_result = shlesha.transliterate(iast_char, 'iast', 'slp1')
-        vidyut_result = transliterate(iast_char, Scheme.Iast, Scheme.Slp1)
-        
-        shlesha_correct = shlesha_result == expected_slp1
-        vidyut_correct = vidyut_result == expected_slp1
-        
-        if not shlesha_correct or not vidyut_correct:
-            print(f"  '{iast_char}' → '{expected_slp1}':")
-            print(f"    Shlesha: '{shlesha_result}' {'✓' if shlesha_correct else '✗'}")
-            print(f"    Vidyut:  '{vidyut_result}' {'✓' if vidyut_correct else '✗'}")
-            errors += 1
-    
-    if errors == 0:
-        print("  ✓ All individual character mappings correct!")
-    else:
-        print(f"  ✗ Found {errors} incorrect mappings")
     
-    # Test a full word
-    print("\nTesting full word conversion:")
+    # Full word checked after the mappings
     test_word = "saṃskṛtam"
     expected = "saMskftam"
     
-    shlesha_result = shlesha.transliterate(test_word, 'iast', 'slp1')
-    vidyut_result = transliterate(test_word, Scheme.Iast, Scheme.Slp1)
+    # One batch call for Shlesha; Vidyut has no batch API, so call it per input
+    inputs = [iast_char for iast_char, _ in mappings] + [test_word]
+    *shlesha_results, shlesha_word = shlesha.transliterate_batch(inputs, 'iast', 'slp1')
+    *vidyut_results, vidyut_word = [transliterate(text, IAST, SLP1) for text in inputs]
+    
+    mismatches = [
+        (iast_char, expected_slp1, shlesha_result, vidyut_result)
+        for (iast_char, expected_slp1), shlesha_result, vidyut_result
+        in zip(mappings, shlesha_results, vidyut_results)
+        if shlesha_result != expected_slp1 or vidyut_result != expected_slp1
+    ]
     
+    # Assemble the report and write it with a single print
+    report = []
+    for iast_char, expected_slp1, shlesha_result, vidyut_result in mismatches:
+        report += [
+            f"  '{iast_char}' → '{expected_slp1}':",
+            f"    Shlesha: '{shlesha_result}' {'✓' if shlesha_result == expected_slp1 else '✗'}",
+            f"    Vidyut:  '{vidyut_result}' {'✓' if vidyut_result == expected_slp1 else '✗'}",
+        ]
+    
+    if not mismatches:
+        report.append("  ✓ All individual character mappings correct!")
+    else:
+        report.append(f"  ✗ Found {len(mismatches)} incorrect mappings")
+    print("\n".join(report))
+    
+    # Test a full word
+    print("\nTesting full word conversion:")
     print(f"  Input: '{test_word}'")
     print(f"  Expected: '{expected}'")
-    print(f"  Shlesha:  '{shlesha_result}' {'✓' if shlesha_result == expected else '✗'}")
-    print(f"  Vidyut:   '{vidyut_result}' {'✓' if vidyut_result == expected else '✗'}")
+    print(f"  Shlesha:  '{shlesha_word}' {'✓' if shlesha_word == expected else '✗'}")
+    print(f"  Vidyut:   '{vidyut_word}' {'✓' if vidyut_word == expected else '✗'}")
 
 def check_supported_scripts():
     """Check what scripts are supported."""
@@ -171,16 +176,16 @@ def check_supported_scripts():
     scripts = shlesha.get_supported_scripts()
     print(f"Shlesha supports {len(scripts)} scripts:")
     
-    # Group by type
-    roman_scripts = [s for s in scripts if s in ['iast', 'slp1', 'itrans', 'harvard_kyoto', 'hk', 'velthuis', 'wx', 'iso15919', 'iso', 'kolkata']]
-    indic_scripts = [s for s in scripts if s not in roman_scripts]
+    # Group by type; the list comes back sorted, so each group stays sorted
+    roman_scripts = [s for s in scripts if s in ROMAN_SCRIPTS]
+    indic_scripts = [s for s in scripts if s not in ROMAN_SCRIPTS]
     
     print(f"\nRoman scripts ({len(roman_scripts)}):")
-    for script in sorted(roman_scripts):
+    for script in roman_scripts:
         print(f"  • {script}")
     
     print(f"\nIndic scripts ({len(indic_scripts)}):")
-    for script in sorted(indic_scripts):
+    for script in indic_scripts:
         print(f"  • {script}")
 
 def main():